@@ -1,5 +1,6 @@
 import os
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Sequence, Type, Union
+import re
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Sequence, Type, Union, Tuple
 from typing import Protocol
 
 from fastapi import FastAPI
@@ -9,16 +10,20 @@ from starlette.middleware import Middleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 from starlette.routing import BaseRoute
+from starlette.types import Scope
 from starlette.status import HTTP_403_FORBIDDEN, HTTP_401_UNAUTHORIZED, HTTP_404_NOT_FOUND, \
     HTTP_500_INTERNAL_SERVER_ERROR
 
 
+from fastapi_admin2.exceptions import ResourceRegistrationError
 from fastapi_admin2.providers import Provider
+from fastapi_admin2.utils.files import FileManager
 from fastapi_admin2.utils.templating import JinjaTemplates
 from .middlewares.i18n.base import AbstractI18nMiddleware
 from .middlewares.i18n.impl import I18nMiddleware
-from .middlewares.theme import theme_middleware
-from .middlewares.templating import create_template_middleware
+from .middlewares.theme import ThemeMiddleware
+from .middlewares.templating import TemplatingMiddleware
+from .middlewares.upload_limit import UploadLimitMiddleware
 from .i18n.localizer import I18NLocalizer
 from .ui.resources import AbstractModelResource as ModelResource
 from .ui.resources import Dropdown
@@ -27,6 +32,11 @@ from fastapi_admin2.utils.responses import server_error_exception, not_found, fo
 from .controllers import resources
 
 
+DEFAULT_MAX_UPLOAD_SIZE = 1024 ** 3
+# routes, which bodies are limited by resource
+RESOURCE_UPLOAD_PATH_PATTERN = re.compile(r"^/(?P<resource>[^/]+)/(?P<action>create|update/[^/]+|import)/?$")
+
+
 class ORMBackend(Protocol):
     def configure(self, app: FastAPI) -> None: ...
 
@@ -46,6 +56,7 @@ class FastAPIAdmin(FastAPI):
             providers: Optional[List[Provider]] = None,
             favicon_url: Optional[str] = None,
             i18n_middleware_class: Optional[Type[AbstractI18nMiddleware]] = None,
+            max_upload_size: Optional[int] = DEFAULT_MAX_UPLOAD_SIZE,
             debug: bool = False, routes: Optional[List[BaseRoute]] = None,
             title: str = "FastAPI",
             description: str = "",
@@ -99,7 +110,7 @@ class FastAPIAdmin(FastAPI):
 
         self.templates = JinjaTemplates()
         self.templates.env.add_extension("jinja2.ext.i18n")
-        self.middleware("http")(create_template_middleware(self.templates))
+        self.add_middleware(TemplatingMiddleware, templates=self.templates)
         self.dependency_overrides[JinjaTemplates] = lambda: self.templates
 
         if i18n_middleware_class is None:
@@ -107,13 +118,20 @@ class FastAPIAdmin(FastAPI):
         self.add_middleware(i18n_middleware_class, translator=translator)
         self.language_switch = True
 
-        self.middleware('http')(theme_middleware)
+        self.add_middleware(ThemeMiddleware)
+
+        # max size of body of requests, which aren't limited by resources, None disables the limit
+        self.max_upload_size = max_upload_size
+        self.add_middleware(UploadLimitMiddleware, get_limit=self._get_upload_limit)
 
         self._orm_backend = orm_backend
         self._orm_backend.configure(self)
 
         self.resources: List[Type[Resource]] = []
         self.model_resources: Dict[Type[ORMModel], Type[Resource]] = {}
+        # resource name(slug), which is used in urls -> ORM model and its resource
+        self._model_resources_by_slug: Dict[str, Tuple[Type[ORMModel], Type[ModelResource]]] = {}
+        self.file_managers: List[FileManager] = []
 
         if add_custom_exception_handlers:
             exception_handlers = {
@@ -132,12 +150,32 @@ class FastAPIAdmin(FastAPI):
     def register_provider(self, provider: Provider) -> None:
         provider.register(self)
 
+    def register_file_manager(self, file_manager: FileManager) -> None:
+        """
+        Bind lifecycle of file manager(e.g. pooled client of storage) to startup and shutdown of application
+        """
+        if any(registered is file_manager for registered in self.file_managers):
+            return
+        self.file_managers.append(file_manager)
+        self.router.on_startup.append(file_manager.startup)
+        self.router.on_shutdown.append(file_manager.shutdown)
+
     def register_resource(self, resource: Type[Resource]) -> None:
         self._set_model_resource(resource)
         self.resources.append(resource)
 
     def _set_model_resource(self, resource: Type[Resource]) -> None:
         if issubclass(resource, ModelResource):
+            slug = resource.get_slug()
+            registered = self._model_resources_by_slug.get(slug)
+            if registered is not None and registered[1] is not resource:
+                raise ResourceRegistrationError(
+                    f"Name `{slug}` of resource {resource.__name__} collides with "
+                    f"already registered resource {registered[1].__name__}, specify `slug` explicitly"
+                )
+            # fields, filters and converters are scaffolded once, not on every request
+            resource.get_spec()
+            self._model_resources_by_slug[slug] = (resource.model, resource)
             self.model_resources[resource.model] = resource
         elif issubclass(resource, Dropdown):
             for r in resource.resources:
@@ -146,5 +184,34 @@ class FastAPIAdmin(FastAPI):
     def get_model_resource_type(self, model: Type[ORMModel]) -> Optional[Type[Resource]]:
         return self.model_resources.get(model)
 
+    def get_orm_model_by_slug(self, slug: str) -> Optional[Type[ORMModel]]:
+        model_and_resource = self._model_resources_by_slug.get(slug.strip().lower())
+        if model_and_resource is None:
+            return None
+        return model_and_resource[0]
+
+    def get_model_resource_by_slug(self, slug: str) -> Optional[Type[ModelResource]]:
+        """
+        Unlike `get_model_resource_type` it distinguishes resources of the same ORM model with different slugs
+        """
+        model_and_resource = self._model_resources_by_slug.get(slug.strip().lower())
+        if model_and_resource is None:
+            return None
+        return model_and_resource[1]
+
+    def _get_upload_limit(self, scope: Scope) -> Optional[int]:
+        match = RESOURCE_UPLOAD_PATH_PATTERN.match(scope["path"])
+        if match is not None:
+            resource = self.get_model_resource_by_slug(match.group("resource"))
+            if resource is not None:
+                if match.group("action") == "import":
+                    # imported file isn't a file input of the form
+                    resource_limit = resource.max_upload_size
+                else:
+                    resource_limit = resource.get_spec().max_upload_size
+                if resource_limit is not None:
+                    return resource_limit
+        return self.max_upload_size
+
     def add_template_folder(self, folder: Union[str, os.PathLike]) -> None:
         self.templates.env.loader.searchpath.insert(0, folder)
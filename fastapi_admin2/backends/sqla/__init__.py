@@ -10,10 +10,10 @@ from fastapi_admin2.backends.sqla.dao.admin_dao import SqlalchemyAdminDao
 from fastapi_admin2.backends.sqla.markers import AsyncSessionDependencyMarker, SessionMakerDependencyMarker
 from fastapi_admin2.backends.sqla.models import SqlalchemyAdminModel
 from fastapi_admin2.backends.sqla.queriers import get_resource_list, delete_resource_by_id, \
-    bulk_delete_resources
+    bulk_delete_resources, stream_resource_list, get_bulk_inserter
 from fastapi_admin2.providers.security.dependencies import AdminDaoDependencyMarker
 from fastapi_admin2.controllers.dependencies import ModelListDependencyMarker, DeleteOneDependencyMarker, \
-    DeleteManyDependencyMarker
+    DeleteManyDependencyMarker, ModelExportDependencyMarker, BulkInsertDependencyMarker
 from . import filters
 from .model_resource import Model
 
@@ -43,3 +43,5 @@ class SQLAlchemyBackend:
         app.dependency_overrides[DeleteOneDependencyMarker] = delete_resource_by_id
         app.dependency_overrides[DeleteManyDependencyMarker] = bulk_delete_resources
         app.dependency_overrides[ModelListDependencyMarker] = get_resource_list
+        app.dependency_overrides[ModelExportDependencyMarker] = stream_resource_list
+        app.dependency_overrides[BulkInsertDependencyMarker] = get_bulk_inserter
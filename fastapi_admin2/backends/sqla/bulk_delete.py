@@ -0,0 +1,88 @@
+from typing import Any, List, Sequence, Iterator
+
+from sqlalchemy import delete, inspect, tuple_, select, values, column, Column
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Delete
+
+POSTGRESQL_DIALECT_NAME = "postgresql"
+
+
+def build_delete_by_pks_statement(model: Any, ids: Sequence[Any], dialect_name: str) -> Delete:
+    """
+    Build DELETE statement for one chunk of primary keys.
+    Composite primary keys are compared as row values, so condition stays index-friendly:
+    sqlite compiles `IN` of tuples to `IN (VALUES ...)` by itself, for postgresql ids are joined as VALUES list,
+    because long list of row constructors is planned as OR of ANDs.
+
+    :param model:
+    :param ids: values of primary key or sequences of values of primary key columns for composite primary key
+    :param dialect_name:
+    :return:
+    """
+    mapper = inspect(model)
+    pk_columns: List[Column] = list(mapper.primary_key)
+    pk_attributes = [getattr(model, mapper.get_property_by_column(c).key) for c in pk_columns]
+    # deleted entries are not loaded to the session, so there is nothing to synchronize
+    statement = delete(model).execution_options(synchronize_session=False)
+
+    if len(pk_columns) == 1:
+        return statement.where(pk_attributes[0].in_([_coerce(pk_columns[0], id_) for id_ in ids]))
+
+    rows = []
+    for id_ in ids:
+        if isinstance(id_, str) or len(id_) != len(pk_columns):
+            raise ValueError(f"Id `{id_}` doesn't match composite primary key of {model.__name__}")
+        rows.append(tuple(_coerce(c, v) for c, v in zip(pk_columns, id_)))
+
+    key = tuple_(*pk_attributes)
+    if dialect_name != POSTGRESQL_DIALECT_NAME:
+        return statement.where(key.in_(rows))
+
+    ids_values = values(*[column(c.name, c.type) for c in pk_columns], name="deleted_ids").data(rows)
+    return statement.where(key.in_(select(ids_values)))
+
+
+async def delete_by_pks_in_chunks(session: AsyncSession, model: Any, ids: Sequence[Any],
+                                  chunk_size: int, single_transaction: bool = False) -> None:
+    """
+    Delete entries by bounded chunks of primary keys, so statements don't exceed limits of
+    bound parameters and expression depth of database and don't lock too many rows at once
+
+    :param session:
+    :param model:
+    :param ids:
+    :param chunk_size: count of primary keys deleted by one statement
+    :param single_transaction: delete all chunks in one transaction instead of committing every chunk
+    """
+    statements = [
+        build_delete_by_pks_statement(model, chunk, dialect_name=session.bind.dialect.name)
+        for chunk in _split_into_chunks(ids, chunk_size)
+    ]
+
+    if single_transaction:
+        async with session.begin():
+            for statement in statements:
+                await session.execute(statement)
+        return
+
+    for statement in statements:
+        async with session.begin():
+            await session.execute(statement)
+
+
+def _split_into_chunks(ids: Sequence[Any], chunk_size: int) -> Iterator[Sequence[Any]]:
+    for offset in range(0, len(ids), chunk_size):
+        yield ids[offset:offset + chunk_size]
+
+
+def _coerce(pk_column: Column, value: Any) -> Any:
+    # ids from query string are always strings
+    if not isinstance(value, str):
+        return value
+    try:
+        python_type = pk_column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is str:
+        return value
+    return python_type(value)
@@ -0,0 +1,76 @@
+import json
+from typing import Any, Tuple, Optional
+
+from sqlalchemy import select, func, inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from fastapi_admin2.enums import CountStrategy
+
+POSTGRESQL_DIALECT_NAME = "postgresql"
+
+
+class explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(explain, POSTGRESQL_DIALECT_NAME)
+def _compile_explain_for_postgresql(element: explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def count_entries(session: AsyncSession, statement: Select, model: Any,
+                        strategy: CountStrategy, cap: int) -> Tuple[int, bool]:
+    """
+    Count entries, that match filtered statement, using given strategy.
+    CountStrategy.HAS_NEXT_PAGE must be handled by the caller, because it doesn't require counting at all.
+
+    :return: count of entries and flag, that denotes whether count is only the lower bound of the real count
+    """
+    statement = statement.order_by(None)
+
+    if strategy == CountStrategy.ESTIMATE and session.bind.dialect.name == POSTGRESQL_DIALECT_NAME:
+        estimated_count = await _estimate_count_for_postgresql(session, statement, model)
+        if estimated_count is not None:
+            return estimated_count, False
+
+    if strategy == CountStrategy.CAPPED:
+        capped_count = await _scalar(session, select(func.count()).select_from(
+            statement.limit(cap + 1).subquery()
+        ))
+        if capped_count > cap:
+            return cap, True
+        return capped_count, False
+
+    return await _scalar(session, select(func.count()).select_from(statement.subquery())), False
+
+
+async def _estimate_count_for_postgresql(session: AsyncSession, statement: Select, model: Any) -> Optional[int]:
+    if statement.whereclause is None:
+        table_name = session.bind.dialect.identifier_preparer.format_table(inspect(model).local_table)
+        reltuples = await _scalar(
+            session,
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS regclass)"),
+            table_name=table_name
+        )
+        # reltuples is -1 if table has never been vacuumed or analyzed yet
+        if reltuples is not None and reltuples >= 0:
+            return int(reltuples)
+
+    query_plan = await _scalar(session, explain(statement))
+    if isinstance(query_plan, str):
+        query_plan = json.loads(query_plan)
+    try:
+        return int(query_plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError):
+        return None
+
+
+async def _scalar(session: AsyncSession, statement: Any, **params: Any) -> Any:
+    return (await session.execute(statement, params)).scalar()
@@ -1,7 +1,8 @@
-from typing import List, Union, Optional, Sequence, Any, Type
+from typing import List, Union, Optional, Sequence, Any, Type, Set, Dict, Hashable, Mapping
 
 from sqlalchemy import Column, inspect, Boolean, DateTime, Date, String, Integer, Enum, JSON
-from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy import orm
+from sqlalchemy.orm import DeclarativeMeta, load_only
 from starlette.datastructures import FormData
 from starlette.requests import Request
 
@@ -17,17 +18,21 @@ from fastapi_admin2.backends.sqla.field_converters import (
 from fastapi_admin2.backends.sqla.filters import Search
 from fastapi_admin2.ui.resources import AbstractModelResource
 from fastapi_admin2.ui.resources.column import Field, ComputedField
-from fastapi_admin2.ui.resources.model import Q
+from fastapi_admin2.ui.resources.model import Q, ColumnToFieldConverter
 from fastapi_admin2.ui.widgets import inputs, displays
 
 
 class Model(AbstractModelResource):
     _default_filter = Search
 
-    def __init__(self):
-        super().__init__()
-        self._fields = self._scaffold_fields(inspect(self.model).columns.items())
-        self._converters = {
+    # Opt-in keyset(cursor) pagination, that seeks on `keyset_sort_key` columns(primary key is used by default
+    # and always appended to the sort key to make it unique) instead of scanning and skipping rows with OFFSET
+    keyset_pagination: bool = False
+    keyset_sort_key: Sequence[str] = ()
+
+    @classmethod
+    def _get_default_converters(cls) -> Dict[Hashable, ColumnToFieldConverter[Any]]:
+        return {
             Boolean: BooleanColumnToFieldConverter(),
             DateTime: DatetimeColumnToFieldConverter(),
             Date: DateColumnToFieldConverter(),
@@ -36,7 +41,6 @@ class Model(AbstractModelResource):
             Enum: EnumColumnToFieldConverter(),
             JSON: JSONColumnToFieldConverter()
         }
-        self._converters.update(self.converters)
 
     async def enrich_select_with_filters(self, request: Request, model: Any, query: Q) -> Q:
         query_params = {k: v for k, v in request.query_params.items() if v}
@@ -44,6 +48,62 @@ class Model(AbstractModelResource):
             query = filter_.apply(query, query_params.get(filter_.name))
         return query
 
+    def apply_list_projection(self, query: Q) -> Q:
+        if not self.should_load_only_displayed_columns():
+            return query
+
+        mapper = inspect(self.model)
+        column_names = set(self.get_list_column_names()) | set(self.keyset_sort_key)
+        column_names.update(mapper.get_property_by_column(c).key for c in mapper.primary_key)
+        column_names.update(self._get_eagerly_loaded_relationships_local_columns())
+        return query.options(load_only(*[
+            getattr(self.model, name) for name in sorted(column_names)
+            if name in mapper.column_attrs
+        ]))
+
+    def apply_eager_loading(self, query: Q, streamed: bool = False) -> Q:
+        """
+        :param streamed: rows are fetched by chunks(yield_per), e.g. during export.
+                         Collections can't be joined to such query, so they're loaded by SELECT IN instead
+        """
+        loader_options = [self._build_loader_option(path, "selectinload") for path in self.prefetch]
+        loader_options.extend(
+            self._build_loader_option(path, "joinedload", join_collections=not streamed) for path in self.eager_load
+        )
+        if not loader_options:
+            return query
+        return query.options(*loader_options)
+
+    def _build_loader_option(self, relationship_path: str, loading_strategy: str,
+                             join_collections: bool = True) -> Any:
+        entity, loader_option = self.model, None
+        for relationship_name in relationship_path.split("."):
+            relationship = getattr(entity, relationship_name)
+            strategy = loading_strategy
+            if not join_collections and relationship.property.uselist:
+                strategy = "selectinload"
+            if loader_option is None:
+                loader_option = getattr(orm, strategy)(relationship)
+            else:
+                loader_option = getattr(loader_option, strategy)(relationship)
+            entity = relationship.property.mapper.class_
+        return loader_option
+
+    def _get_eagerly_loaded_relationships_local_columns(self) -> Set[str]:
+        """
+        Relationships(e.g. many-to-one) can't be loaded without local foreign key columns,
+        so they must not be deferred by projection
+        """
+        mapper = inspect(self.model)
+        column_names: Set[str] = set()
+        for relationship_path in [*self.prefetch, *self.eager_load]:
+            relationship = mapper.relationships[relationship_path.split(".")[0]]
+            column_names.update(
+                mapper.get_property_by_column(c).key for c in relationship.local_columns
+                if c in mapper.columns.values()
+            )
+        return column_names
+
     async def resolve_form_data(self, data: FormData):
         for field in self.input_fields:
             field_input = field.input
@@ -56,21 +116,26 @@ class Model(AbstractModelResource):
 
             v = await field_input.parse(data.getlist(input_name))
 
-    def _scaffold_model_fields_for_display(self) -> List[Field]:
-        sqlalchemy_model_columns: Sequence[Column] = inspect(self.model).columns.items()
+    @classmethod
+    def _scaffold_model_fields_for_display(
+            cls,
+            converters: Mapping[Hashable, ColumnToFieldConverter[Any]]
+    ) -> List[Field]:
+        sqlalchemy_model_columns: Sequence[Column] = inspect(cls.model).columns.items()
         fields: List[Field] = []
 
-        for field in self._scaffold_fields(sqlalchemy_model_columns):
+        for field in cls._scaffold_fields(converters, sqlalchemy_model_columns):
             if isinstance(field, str):
-                field = self._create_field_by_field_name(field)
+                field = cls._create_field_by_field_name(field, converters)
             if isinstance(field.display, displays.InputOnly):
                 continue
             fields.append(field)
 
-        return self._shift_primary_keys_to_beginning(fields)
+        return cls._shift_primary_keys_to_beginning(fields)
 
-    def _shift_primary_keys_to_beginning(self, fields: List[Field]) -> List[Field]:
-        pk_columns: Sequence[Column] = inspect(self.model).primary_key
+    @classmethod
+    def _shift_primary_keys_to_beginning(cls, fields: List[Field]) -> List[Field]:
+        pk_columns: Sequence[Column] = inspect(cls.model).primary_key
         pk_columns_names = [c.name for c in pk_columns]
         for index, field in enumerate(fields):
             if field.name not in pk_columns_names:
@@ -81,22 +146,26 @@ class Model(AbstractModelResource):
                 fields.insert(0, field)
         return fields
 
+    @classmethod
     def _scaffold_fields(
-            self,
+            cls,
+            converters: Mapping[Hashable, ColumnToFieldConverter[Any]],
             sqlalchemy_model_columns: Sequence[Column] = ()
     ) -> Sequence[Union[str, Field, ComputedField]]:
-        field_iterator = self.fields
+        field_iterator = cls.fields
         if not field_iterator:
             field_iterator = [
-                self._create_field_by_field_name(column.name)
+                cls._create_field_by_field_name(column.name, converters)
                 for column in sqlalchemy_model_columns
             ]
         return field_iterator
 
-    def _get_column_by_name(self, name: str) -> Any:
-        return self.model.__dict__.get(name)
+    @classmethod
+    def _get_column_by_name(cls, name: str) -> Any:
+        return cls.model.__dict__.get(name)
 
-    def _convert_column_for_which_no_converter_found(self, column: Column, field_name: str) -> Field:
+    @classmethod
+    def _convert_column_for_which_no_converter_found(cls, column: Column, field_name: str) -> Field:
         placeholder = column.description or ""
         return Field(
             display=displays.Display(),
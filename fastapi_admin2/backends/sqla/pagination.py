@@ -0,0 +1,158 @@
+import base64
+import binascii
+import datetime
+import decimal
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any, List, Sequence, Tuple, TypeVar, Optional
+
+from sqlalchemy import Column, tuple_, inspect
+
+from fastapi_admin2.enums import StrEnum
+
+_S = TypeVar("_S", bound=Any)
+
+
+class InvalidCursorError(ValueError):
+    """
+    raise when cursor can't be decoded or doesn't match sort key of the resource
+    """
+
+
+class Direction(StrEnum):
+    FORWARD = "f"
+    BACKWARD = "b"
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Position of keyset pagination, that consists of values of sort key of the boundary row and
+    direction in which the next page should be fetched.
+    """
+    values: Tuple[Any, ...]
+    direction: Direction = Direction.FORWARD
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            {"v": [_dump_value(v) for v in self.values], "d": self.direction.value},
+            separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, raw_cursor: str) -> "Cursor":
+        try:
+            padding = "=" * (-len(raw_cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(raw_cursor + padding))
+            return cls(
+                values=tuple(_load_value(v) for v in payload["v"]),
+                direction=Direction(payload["d"])
+            )
+        except (binascii.Error, ValueError, KeyError, TypeError) as ex:
+            raise InvalidCursorError(f"Cursor `{raw_cursor}` is malformed") from ex
+
+
+def get_keyset_columns(model: Any, sort_key: Sequence[str] = ()) -> List[Column]:
+    """
+    Return columns on which keyset pagination seeks.
+    Primary key columns are always appended to the declared sort key to make it unique,
+    otherwise rows with equal sort key values could be skipped between pages.
+    """
+    mapper = inspect(model)
+    columns: List[Column] = [mapper.columns[name] for name in sort_key]
+    for pk_column in mapper.primary_key:
+        if pk_column not in columns:
+            columns.append(pk_column)
+    return columns
+
+
+def apply_keyset_pagination(statement: _S, columns: Sequence[Column], page_size: int,
+                            cursor: Optional[Cursor] = None) -> _S:
+    """
+    Seek to the page located after(or before, depending on the direction) the cursor.
+    One extra row is fetched to find out whether there is one more page in the same direction.
+    """
+    backward = cursor is not None and cursor.direction == Direction.BACKWARD
+
+    if cursor is not None:
+        if len(cursor.values) != len(columns):
+            raise InvalidCursorError("Cursor doesn't match sort key of the resource")
+        key, boundary = _as_comparable(columns, cursor.values)
+        statement = statement.where(key < boundary if backward else key > boundary)
+
+    if backward:
+        statement = statement.order_by(*[c.desc() for c in columns])
+    else:
+        statement = statement.order_by(*[c.asc() for c in columns])
+
+    return statement.limit(page_size + 1)
+
+
+def paginate_fetched_rows(rows: Sequence[Any], columns: Sequence[Column], page_size: int,
+                          cursor: Optional[Cursor] = None) -> Tuple[List[Any], Optional[str], Optional[str]]:
+    """
+    Trim extra row fetched by `apply_keyset_pagination`, restore ascending order
+    of the page and build cursors to the neighbouring pages.
+
+    :return: rows of the page, next page cursor and previous page cursor
+    """
+    backward = cursor is not None and cursor.direction == Direction.BACKWARD
+    has_more = len(rows) > page_size
+    page = list(rows[:page_size])
+    if backward:
+        page.reverse()
+
+    if not page:
+        return page, None, None
+
+    has_next = has_more if not backward else True
+    has_prev = has_more if backward else cursor is not None
+
+    next_cursor, prev_cursor = None, None
+    if has_next:
+        next_cursor = Cursor(_get_key_values(page[-1], columns), Direction.FORWARD).encode()
+    if has_prev:
+        prev_cursor = Cursor(_get_key_values(page[0], columns), Direction.BACKWARD).encode()
+    return page, next_cursor, prev_cursor
+
+
+def _as_comparable(columns: Sequence[Column], values: Sequence[Any]) -> Tuple[Any, Any]:
+    if len(columns) == 1:
+        return columns[0], values[0]
+    return tuple_(*columns), tuple_(*values)
+
+
+def _get_key_values(orm_model_instance: Any, columns: Sequence[Column]) -> Tuple[Any, ...]:
+    mapper = inspect(type(orm_model_instance))
+    return tuple(
+        getattr(orm_model_instance, mapper.get_property_by_column(c).key)
+        for c in columns
+    )
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"d": value.isoformat()}
+    if isinstance(value, decimal.Decimal):
+        return {"dec": str(value)}
+    if isinstance(value, uuid.UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _load_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if "dt" in value:
+        return datetime.datetime.fromisoformat(value["dt"])
+    if "d" in value:
+        return datetime.date.fromisoformat(value["d"])
+    if "dec" in value:
+        return decimal.Decimal(value["dec"])
+    if "uuid" in value:
+        return uuid.UUID(value["uuid"])
+    raise ValueError(f"Unknown cursor value {value}")
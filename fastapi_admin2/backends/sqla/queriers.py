@@ -1,48 +1,142 @@
-from typing import Any
+from collections import defaultdict
+from typing import Any, Optional, AsyncIterator, Dict, List, Tuple
 
-from fastapi import Depends
-from sqlalchemy import select, func, delete
+from fastapi import Depends, HTTPException
+from sqlalchemy import select, delete, insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql import Select
 from starlette.requests import Request
+from starlette.status import HTTP_400_BAD_REQUEST
 
 from fastapi_admin2.entities import ResourceList
-from fastapi_admin2.depends import get_model_resource, get_orm_model_by_resource_name
-from fastapi_admin2.backends.sqla.markers import AsyncSessionDependencyMarker
+from fastapi_admin2.enums import CountStrategy
+from fastapi_admin2.exceptions import DatabaseError
+from fastapi_admin2.depends import get_model_resource, get_orm_model_by_resource_name, get_ids_of_selected_entries
+from fastapi_admin2.backends.sqla.bulk_delete import delete_by_pks_in_chunks
+from fastapi_admin2.backends.sqla.counting import count_entries
+from fastapi_admin2.backends.sqla.markers import AsyncSessionDependencyMarker, SessionMakerDependencyMarker
+from fastapi_admin2.backends.sqla.model_resource import Model
+from fastapi_admin2.backends.sqla.pagination import Cursor, InvalidCursorError, get_keyset_columns, \
+    apply_keyset_pagination, paginate_fetched_rows
 from fastapi_admin2.backends.sqla.toolings import include_where_condition_by_pk
 from fastapi_admin2.ui.resources.model import AbstractModelResource
+from fastapi_admin2.utils.bulk_import import BulkInserter
 
 
 async def get_resource_list(request: Request,
                             model_resource: AbstractModelResource = Depends(get_model_resource),
                             page_size: int = 10,
                             model=Depends(get_orm_model_by_resource_name), page_num: int = 1,
-                            session: AsyncSession = Depends(AsyncSessionDependencyMarker)) -> ResourceList:
-    select_stmt = select(
-        model, func.count("*").over().label("entry_count")
-    ).select_from(model)
+                            session: AsyncSession = Depends(AsyncSessionDependencyMarker),
+                            cursor: Optional[str] = None) -> ResourceList:
+    page_size = page_size or model_resource.page_size
     select_stmt = await model_resource.enrich_select_with_filters(
         request=request,
         model=model,
-        query=select_stmt
+        query=model_resource.apply_list_projection(select(model))
     )
 
-    page_size = page_size
-    if page_size:
-        select_stmt = select_stmt.limit(page_size)
-    else:
-        page_size = model_resource.page_size
+    if isinstance(model_resource, Model) and model_resource.keyset_pagination:
+        return await _get_resource_list_by_keyset(model_resource, model, select_stmt, session, page_size, cursor)
 
-    select_stmt = select_stmt.offset((page_num - 1) * page_size)
+    offset = (page_num - 1) * page_size
+    # one extra row is fetched to find out whether the next page exists
+    page_stmt = model_resource.apply_eager_loading(select_stmt).limit(page_size + 1).offset(offset)
 
     async with session.begin():
-        rows = (await session.execute(select_stmt)).all()
+        rows = (await session.execute(page_stmt)).unique().scalars().all()
+        resource_list = ResourceList(
+            models=rows[:page_size],
+            has_next_page=len(rows) > page_size,
+            count_strategy=model_resource.count_strategy
+        )
+        await _count_entries(resource_list, model_resource, model, select_stmt, session, offset)
 
+    return resource_list
+
+
+async def _get_resource_list_by_keyset(model_resource: Model, model: Any, select_stmt: Select,
+                                       session: AsyncSession, page_size: int,
+                                       raw_cursor: Optional[str]) -> ResourceList:
+    columns = get_keyset_columns(model, model_resource.keyset_sort_key)
     try:
-        total_entries_count = rows[0][1]
-        orm_models = [row[0] for row in rows]
-        return ResourceList(models=orm_models, total_entries_count=total_entries_count)
-    except IndexError:
-        return ResourceList()
+        cursor = Cursor.decode(raw_cursor) if raw_cursor else None
+        page_stmt = apply_keyset_pagination(
+            model_resource.apply_eager_loading(select_stmt), columns, page_size, cursor
+        )
+    except InvalidCursorError as ex:
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(ex))
+
+    async with session.begin():
+        rows = (await session.execute(page_stmt)).unique().scalars().all()
+        orm_models, next_cursor, prev_cursor = paginate_fetched_rows(rows, columns, page_size, cursor)
+
+    # keyset pages don't show the total count, so it isn't calculated at all
+    return ResourceList(
+        models=orm_models,
+        has_next_page=next_cursor is not None,
+        count_strategy=CountStrategy.HAS_NEXT_PAGE,
+        is_keyset_paginated=True,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor
+    )
+
+
+async def _count_entries(resource_list: ResourceList, model_resource: AbstractModelResource, model: Any,
+                         select_stmt: Select, session: AsyncSession, offset: int = 0) -> None:
+    if model_resource.count_strategy == CountStrategy.HAS_NEXT_PAGE:
+        resource_list.total_entries_count = offset + len(resource_list.models)
+        resource_list.is_lower_bound = resource_list.has_next_page
+        return
+
+    resource_list.total_entries_count, resource_list.is_lower_bound = await count_entries(
+        session, select_stmt, model, model_resource.count_strategy, model_resource.count_cap
+    )
+
+
+async def stream_resource_list(request: Request,
+                               model_resource: AbstractModelResource = Depends(get_model_resource),
+                               model: Any = Depends(get_orm_model_by_resource_name),
+                               session_maker: sessionmaker = Depends(SessionMakerDependencyMarker)
+                               ) -> AsyncIterator[Any]:
+    select_stmt = await model_resource.enrich_select_with_filters(
+        request=request,
+        model=model,
+        query=model_resource.apply_eager_loading(model_resource.apply_list_projection(select(model)), streamed=True)
+    )
+    # rows are fetched by server-side cursor and converted to ORM models by chunks
+    select_stmt = select_stmt.execution_options(yield_per=model_resource.export_chunk_size)
+
+    async def iterate_over_rows() -> AsyncIterator[Any]:
+        # session is opened inside of the iterator, because response is streamed after the endpoint has returned.
+        # It's only closed(not committed) in the end, so loaded instances of the last chunk are not expired
+        async with session_maker() as session:
+            result = await session.stream(select_stmt)
+            async for orm_model in result.scalars():
+                yield orm_model
+
+    return iterate_over_rows()
+
+
+async def get_bulk_inserter(model: Any = Depends(get_orm_model_by_resource_name),
+                            session_maker: sessionmaker = Depends(SessionMakerDependencyMarker)) -> BulkInserter:
+    async def insert_rows(rows: List[Dict[str, Any]]) -> None:
+        # executemany requires the same set of columns for all parameters,
+        # so rows are grouped by their keys(e.g. rows with omitted nullable columns)
+        rows_by_keys: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            rows_by_keys[tuple(sorted(row))].append(row)
+
+        try:
+            async with session_maker() as session, session.begin():
+                for rows_with_same_keys in rows_by_keys.values():
+                    await session.execute(insert(model), rows_with_same_keys)
+        except SQLAlchemyError as ex:
+            raise DatabaseError(str(ex)) from ex
+
+    return insert_rows
 
 
 async def delete_resource_by_id(id_: str, session: AsyncSession = Depends(AsyncSessionDependencyMarker),
@@ -53,9 +147,15 @@ async def delete_resource_by_id(id_: str, session: AsyncSession = Depends(AsyncS
         await session.execute(stmt)
 
 
-async def bulk_delete_resources(ids: str, model: Any = Depends(get_orm_model_by_resource_name),
+async def bulk_delete_resources(ids: List[Any] = Depends(get_ids_of_selected_entries),
+                                model_resource: AbstractModelResource = Depends(get_model_resource),
+                                model: Any = Depends(get_orm_model_by_resource_name),
                                 session: AsyncSession = Depends(AsyncSessionDependencyMarker)) -> None:
-    stmt = include_where_condition_by_pk(delete(model), model, ids.split(","),
-                                         dialect_name=session.bind.dialect.name)
-    async with session.begin():
-        await session.execute(stmt)
+    try:
+        await delete_by_pks_in_chunks(
+            session, model, ids,
+            chunk_size=model_resource.bulk_delete_chunk_size,
+            single_transaction=model_resource.bulk_delete_in_single_transaction
+        )
+    except ValueError as ex:
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=str(ex))
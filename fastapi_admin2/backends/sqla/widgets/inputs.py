@@ -1,6 +1,65 @@
-from fastapi_admin2.widgets.inputs import BaseForeignKeyInput
+from typing import Any, List, Tuple, Sequence
+
+from sqlalchemy import inspect, select, or_, String
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from fastapi_admin2.backends.sqla.markers import SessionMakerDependencyMarker
+from fastapi_admin2.ui.widgets.inputs import BaseForeignKeyInput, OptionsPage
+from fastapi_admin2.utils.depends import get_dependency_from_request_by_marker
+
+LIKE_ESCAPE_CHARACTER = "\\"
 
 
 class ForeignKey(BaseForeignKeyInput):
-    async def get_options(self):
-        pass
+    async def search_options(self, request: Request, query: str, limit: int, offset: int) -> OptionsPage:
+        mapper = inspect(self.model)
+        statement = select(self.model).order_by(*mapper.primary_key)
+        search_attributes = self._get_search_attributes()
+        if query and search_attributes:
+            pattern = _escape_like(query) + "%"
+            statement = statement.where(or_(*[
+                attribute.ilike(pattern, escape=LIKE_ESCAPE_CHARACTER) for attribute in search_attributes
+            ]))
+
+        session_maker: sessionmaker = get_dependency_from_request_by_marker(request, SessionMakerDependencyMarker)
+        async with session_maker() as session:
+            # one extra entry shows, whether there is next page
+            related_models = (await session.execute(statement.offset(offset).limit(limit + 1))).scalars().all()
+            return OptionsPage(
+                options=[(str(x), _get_pk(mapper, x)) for x in related_models[:limit]],
+                has_more=len(related_models) > limit
+            )
+
+    async def get_selected_options(self, request: Request, value: Any) -> List[Tuple[str, Any]]:
+        mapper = inspect(self.model)
+        if isinstance(value, self.model):
+            return [(str(value), _get_pk(mapper, value))]
+        if value is None or value == "":
+            return []
+
+        session_maker: sessionmaker = get_dependency_from_request_by_marker(request, SessionMakerDependencyMarker)
+        async with session_maker() as session:
+            related_model = await session.get(self.model, value)
+            if related_model is None:
+                return []
+            return [(str(related_model), _get_pk(mapper, related_model))]
+
+    def _get_search_attributes(self) -> Sequence[Any]:
+        if self.search_fields:
+            return [getattr(self.model, name) for name in self.search_fields]
+        for column_property in inspect(self.model).column_attrs:
+            if isinstance(column_property.columns[0].type, String):
+                return [getattr(self.model, column_property.key)]
+        return []
+
+
+def _get_pk(mapper: Any, orm_model: Any) -> Any:
+    identity = mapper.primary_key_from_instance(orm_model)
+    if len(identity) == 1:
+        return identity[0]
+    return tuple(identity)
+
+
+def _escape_like(query: str) -> str:
+    return query.replace(LIKE_ESCAPE_CHARACTER, LIKE_ESCAPE_CHARACTER * 2).replace("%", "\\%").replace("_", "\\_")
@@ -7,10 +7,10 @@ from fastapi_admin2.backends.tortoise.dao.admin_dao import TortoiseAdminDao
 from fastapi_admin2.backends.tortoise.models import AbstractAdminModel
 from fastapi_admin2.backends.tortoise.models import Model
 from fastapi_admin2.backends.tortoise.queriers import get_resource_list, delete_one_by_id, \
-    bulk_delete_resources
+    bulk_delete_resources, stream_resource_list, get_bulk_inserter
 from fastapi_admin2.providers.security.dependencies import AdminDaoDependencyMarker
 from fastapi_admin2.controllers.dependencies import ModelListDependencyMarker, DeleteOneDependencyMarker, \
-    DeleteManyDependencyMarker
+    DeleteManyDependencyMarker, ModelExportDependencyMarker, BulkInsertDependencyMarker
 
 
 class TortoiseBackend:
@@ -27,6 +27,8 @@ class TortoiseBackend:
         app.dependency_overrides[ModelListDependencyMarker] = get_resource_list
         app.dependency_overrides[DeleteOneDependencyMarker] = delete_one_by_id
         app.dependency_overrides[DeleteManyDependencyMarker] = bulk_delete_resources
+        app.dependency_overrides[ModelExportDependencyMarker] = stream_resource_list
+        app.dependency_overrides[BulkInsertDependencyMarker] = get_bulk_inserter
 
 
 __all__ = ('TortoiseBackend', 'Model')
@@ -0,0 +1,43 @@
+import json
+from typing import Tuple, Optional, Type
+
+from tortoise import Model
+from tortoise.queryset import QuerySet
+
+from fastapi_admin2.enums import CountStrategy
+
+POSTGRESQL_DIALECT_NAME = "postgres"
+
+
+async def count_entries(queryset: QuerySet, model: Type[Model],
+                        strategy: CountStrategy, cap: int) -> Tuple[int, bool]:
+    """
+    Count entries of filtered queryset using given strategy.
+    CountStrategy.HAS_NEXT_PAGE must be handled by the caller, because it doesn't require counting at all.
+
+    :return: count of entries and flag, that denotes whether count is only the lower bound of the real count
+    """
+    if strategy == CountStrategy.ESTIMATE and model._meta.db.capabilities.dialect == POSTGRESQL_DIALECT_NAME:
+        estimated_count = await _estimate_count_for_postgresql(queryset, model)
+        if estimated_count is not None:
+            return estimated_count, False
+
+    if strategy == CountStrategy.CAPPED:
+        # QuerySet.count() applies LIMIT only after counting all rows, so primary keys are fetched instead
+        capped_count = len(await queryset.limit(cap + 1).values_list(model._meta.pk_attr, flat=True))
+        if capped_count > cap:
+            return cap, True
+        return capped_count, False
+
+    return await queryset.count(), False
+
+
+async def _estimate_count_for_postgresql(queryset: QuerySet, model: Type[Model]) -> Optional[int]:
+    rows = await model._meta.db.execute_query_dict("EXPLAIN (FORMAT JSON) " + queryset.sql())
+    try:
+        query_plan = rows[0]["QUERY PLAN"]
+        if isinstance(query_plan, str):
+            query_plan = json.loads(query_plan)
+        return int(query_plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
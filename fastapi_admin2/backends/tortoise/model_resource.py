@@ -1,4 +1,4 @@
-from typing import Any, List, Type
+from typing import Any, List, Type, Dict, Hashable, Mapping
 
 from starlette.datastructures import FormData
 from starlette.requests import Request
@@ -13,20 +13,19 @@ from fastapi_admin2.backends.tortoise.field_converters import BooleanColumnToFie
     IntEnumColumnToFieldConverter, ForeignKeyToFieldConverter, ManyToManyFieldConverter
 from fastapi_admin2.backends.tortoise.filters import Search
 from fastapi_admin2.backends.tortoise.widgets.inputs import ManyToMany
-from fastapi_admin2.resources import Field
-from fastapi_admin2.resources.model import AbstractModelResource, Q
-from fastapi_admin2.widgets import displays, inputs
-from fastapi_admin2.widgets.inputs import DisplayOnly
+from fastapi_admin2.ui.resources import Field
+from fastapi_admin2.ui.resources.model import AbstractModelResource, Q, ColumnToFieldConverter
+from fastapi_admin2.ui.widgets import displays, inputs
+from fastapi_admin2.ui.widgets.inputs import DisplayOnly
 
 
 class Model(AbstractModelResource):
     model: Type[TortoiseModel]
     _default_filter = Search
 
-    def __init__(self):
-        super().__init__()
-        self._pk_column_name = self.model._meta.db_pk_column
-        self._converters = {
+    @classmethod
+    def _get_default_converters(cls) -> Dict[Hashable, ColumnToFieldConverter[Any]]:
+        return {
             CharEnumFieldInstance: CharEnumColumnToFieldConverter(),
             IntEnumFieldInstance: IntEnumColumnToFieldConverter(),
             ForeignKeyFieldInstance: ForeignKeyToFieldConverter(),
@@ -38,7 +37,6 @@ class Model(AbstractModelResource):
             TextField: TextColumnToFieldConverter(),
             JSONField: JSONColumnToFieldConverter(),
         }
-        self._converters.update(self.converters)
 
     async def enrich_select_with_filters(self, request: Request, model: Any, query: Q) -> Q:
         query_params = {k: v for k, v in request.query_params.items() if v}
@@ -47,6 +45,29 @@ class Model(AbstractModelResource):
 
         return query
 
+    def apply_list_projection(self, query: Q) -> Q:
+        if not self.should_load_only_displayed_columns():
+            return query
+
+        column_names = {self.model._meta.pk_attr}
+        column_names.update(
+            name for name in self.get_list_column_names()
+            if name in self.model._meta.fields_db_projection
+        )
+        # forward relations can't be fetched without their foreign key columns
+        for relation_path in [*self.prefetch, *self.eager_load]:
+            relation = self.model._meta.fields_map[relation_path.split(".")[0]]
+            if relation.name in self.model._meta.fk_fields | self.model._meta.o2o_fields:
+                column_names.add(relation.source_field)
+        return query.only(*sorted(column_names))
+
+    def apply_eager_loading(self, query: Q, streamed: bool = False) -> Q:
+        if self.prefetch:
+            query = query.prefetch_related(*[path.replace(".", "__") for path in self.prefetch])
+        if self.eager_load:
+            query = query.select_related(*[path.replace(".", "__") for path in self.eager_load])
+        return query
+
     async def resolve_form_data(self, data: FormData):
         ret = {}
         m2m_ret = {}
@@ -67,30 +88,37 @@ class Model(AbstractModelResource):
                 ret[name] = value
         return ret, m2m_ret
 
-    def _scaffold_model_fields_for_display(self) -> List[Field]:
+    @classmethod
+    def _scaffold_model_fields_for_display(
+            cls,
+            converters: Mapping[Hashable, ColumnToFieldConverter[Any]]
+    ) -> List[Field]:
+        pk_column_name = cls.model._meta.db_pk_column
         fields: List[Field] = []
-        for field in self.fields or self.model._meta.fields:
+        for field in cls.fields or cls.model._meta.fields:
             if isinstance(field, str):
-                if field == self._pk_column_name:
+                if field == pk_column_name:
                     continue
-                field = self._create_field_by_field_name(field)
+                field = cls._create_field_by_field_name(field, converters)
             if isinstance(field, str):
-                field = self._create_field_by_field_name(field)
+                field = cls._create_field_by_field_name(field, converters)
             if isinstance(field.display, displays.InputOnly):
                 continue
             if (
-                    field.name in self.model._meta.fetch_fields
-                    and field.name not in self.model._meta.fk_fields | self.model._meta.m2m_fields
+                    field.name in cls.model._meta.fetch_fields
+                    and field.name not in cls.model._meta.fk_fields | cls.model._meta.m2m_fields
             ):
                 continue
             fields.append(field)
-        fields.insert(0, self._create_field_by_field_name(self._pk_column_name))
+        fields.insert(0, cls._create_field_by_field_name(pk_column_name, converters))
         return fields
 
-    def _get_column_by_name(self, name: str) -> Any:
-        return self.model._meta.fields_map.get(name)
+    @classmethod
+    def _get_column_by_name(cls, name: str) -> Any:
+        return cls.model._meta.fields_map.get(name)
 
-    def _convert_column_for_which_no_converter_found(self, column: TortoiseField, field_name: str) -> Field:
+    @classmethod
+    def _convert_column_for_which_no_converter_found(cls, column: TortoiseField, field_name: str) -> Field:
         placeholder = column.description or ""
         return Field(
             display=displays.Display(),
@@ -1,12 +1,19 @@
-from typing import Any
+import asyncio
+from typing import Any, AsyncIterator, Dict, List
 
 from fastapi import Depends
 from starlette.requests import Request
 from tortoise import Model
+from tortoise.exceptions import BaseORMException
+from tortoise.transactions import in_transaction
 
+from fastapi_admin2.backends.tortoise.counting import count_entries
 from fastapi_admin2.entities import ResourceList
-from fastapi_admin2.depends import get_model_resource, get_orm_model_by_resource_name
-from fastapi_admin2.resources import AbstractModelResource
+from fastapi_admin2.enums import CountStrategy
+from fastapi_admin2.exceptions import DatabaseError
+from fastapi_admin2.depends import get_model_resource, get_orm_model_by_resource_name, get_ids_of_selected_entries
+from fastapi_admin2.ui.resources import AbstractModelResource
+from fastapi_admin2.utils.bulk_import import BulkInserter
 
 
 async def get_resource_list(request: Request,
@@ -14,24 +21,80 @@ async def get_resource_list(request: Request,
                             page_size: int = 10,
                             model: Model = Depends(get_orm_model_by_resource_name),
                             page_num: int = 1) -> ResourceList:
-    qs = model.all()
-    qs = await model_resource.enrich_select_with_filters(request, model, query=qs)
+    page_size = page_size or model_resource.page_size
+    qs = await model_resource.enrich_select_with_filters(request, model, query=model.all())
 
-    total = await qs.count()
+    offset = (page_num - 1) * page_size
+    # one extra row is fetched to find out whether the next page exists
+    page_qs = qs.limit(page_size + 1).offset(offset)
+    page_qs = model_resource.apply_eager_loading(model_resource.apply_list_projection(page_qs))
 
-    if page_size:
-        qs = qs.limit(page_size)
+    if model_resource.count_strategy == CountStrategy.HAS_NEXT_PAGE:
+        rows = await page_qs
+        total, is_lower_bound = offset + len(rows[:page_size]), len(rows) > page_size
     else:
-        page_size = model_resource.page_size
+        # queries are executed concurrently on separate connections acquired from the pool
+        rows, (total, is_lower_bound) = await asyncio.gather(
+            page_qs,
+            count_entries(qs, model, model_resource.count_strategy, model_resource.count_cap)
+        )
 
-    qs = qs.offset((page_num - 1) * page_size)
+    return ResourceList(
+        models=rows[:page_size],
+        total_entries_count=total,
+        count_strategy=model_resource.count_strategy,
+        is_lower_bound=is_lower_bound,
+        has_next_page=len(rows) > page_size
+    )
 
-    return ResourceList(models=await qs, total_entries_count=total)
+
+async def stream_resource_list(request: Request,
+                               model_resource: AbstractModelResource = Depends(get_model_resource),
+                               model: Model = Depends(get_orm_model_by_resource_name)) -> AsyncIterator[Any]:
+    qs = await model_resource.enrich_select_with_filters(request, model, query=model.all())
+    qs = model_resource.apply_eager_loading(model_resource.apply_list_projection(qs))
+    pk_attr = model._meta.pk_attr
+    chunk_size = model_resource.export_chunk_size
+
+    async def iterate_over_rows() -> AsyncIterator[Any]:
+        # rows are fetched in chunks seeking on primary key, so deep chunks are as cheap as the first one
+        chunk_qs = qs.order_by(pk_attr).limit(chunk_size)
+        while True:
+            chunk = await chunk_qs
+            for orm_model in chunk:
+                yield orm_model
+            if len(chunk) < chunk_size:
+                return
+            chunk_qs = qs.filter(**{f"{pk_attr}__gt": chunk[-1].pk}).order_by(pk_attr).limit(chunk_size)
+
+    return iterate_over_rows()
+
+
+async def get_bulk_inserter(model: Model = Depends(get_orm_model_by_resource_name)) -> BulkInserter:
+    async def insert_rows(rows: List[Dict[str, Any]]) -> None:
+        try:
+            await model.bulk_create([model(**row) for row in rows])
+        except BaseORMException as ex:
+            raise DatabaseError(str(ex)) from ex
+
+    return insert_rows
 
 
 async def delete_one_by_id(id_: Any, model: Model = Depends(get_orm_model_by_resource_name)) -> None:
     await model.filter(pk=id_).delete()
 
 
-async def bulk_delete_resources(ids: str, model: Model = Depends(get_orm_model_by_resource_name)) -> None:
-    await model.filter(pk__in=ids.split(",")).delete()
+async def bulk_delete_resources(ids: List[Any] = Depends(get_ids_of_selected_entries),
+                                model_resource: AbstractModelResource = Depends(get_model_resource),
+                                model: Model = Depends(get_orm_model_by_resource_name)) -> None:
+    chunk_size = model_resource.bulk_delete_chunk_size
+    chunks = [ids[offset:offset + chunk_size] for offset in range(0, len(ids), chunk_size)]
+
+    if not model_resource.bulk_delete_in_single_transaction:
+        for chunk in chunks:
+            await model.filter(pk__in=chunk).delete()
+        return
+
+    async with in_transaction(model._meta.default_connection):
+        for chunk in chunks:
+            await model.filter(pk__in=chunk).delete()
@@ -1,39 +1,60 @@
-import json
-from typing import Any
+from typing import Any, List, Tuple, Sequence
 
 from starlette.requests import Request
+from tortoise import Model
+from tortoise.expressions import Q
+from tortoise.fields import CharField, TextField
 
-from fastapi_admin2.widgets.inputs import Input, BaseManyToManyInput, BaseForeignKeyInput
+from fastapi_admin2.ui.widgets.inputs import BaseManyToManyInput, BaseForeignKeyInput, OptionsPage
 
 
 class ForeignKey(BaseForeignKeyInput):
-    async def get_options(self):
-        ret = await self.get_queryset()
-        options = [(str(x), x.pk) for x in ret]
-        if self.context.get("null"):
-            options = [("", "")] + options
-        return options
-
-    async def get_queryset(self):
-        return await self.model.all()
-
-
-class ManyToMany(BaseManyToManyInput):
-    template_name = "widgets/inputs/many_to_many.html"
-
-    async def render(self, request: Request, value: Any):
-        options = await self.get_options()
-        selected = list(map(lambda x: x.pk, value.related_objects if value else []))
-        for option in options:
-            if option.get("value") in selected:
-                option["selected"] = True
-        self.context.update(options=json.dumps(options))
-        return await super(Input, self).render(request, value)
-
-    async def get_options(self):
-        ret = await self.get_queryset()
-        options = [dict(label=str(x), value=x.pk) for x in ret]
-        return options
-
-    async def get_queryset(self):
-        return await self.model.all()
+    async def search_options(self, request: Request, query: str, limit: int, offset: int) -> OptionsPage:
+        queryset = self.model.all()
+        search_fields = self._get_search_fields()
+        if query and search_fields:
+            queryset = queryset.filter(Q(*[Q(**{f"{f}__istartswith": query}) for f in search_fields], join_type="OR"))
+
+        # one extra entry shows, whether there is next page
+        related_models = await queryset.order_by(self.model._meta.pk_attr).offset(offset).limit(limit + 1)
+        return OptionsPage(
+            options=[(str(x), x.pk) for x in related_models[:limit]],
+            has_more=len(related_models) > limit
+        )
+
+    async def get_selected_options(self, request: Request, value: Any) -> List[Tuple[str, Any]]:
+        pks = [_get_pk(v) for v in _as_sequence(value)]
+        if not pks:
+            return []
+        return [(str(x), x.pk) for x in await self.model.filter(pk__in=pks)]
+
+    def _get_search_fields(self) -> Sequence[str]:
+        if self.search_fields:
+            return self.search_fields
+        for name, field in self.model._meta.fields_map.items():
+            if isinstance(field, (CharField, TextField)):
+                return (name,)
+        return ()
+
+
+class ManyToMany(BaseManyToManyInput, ForeignKey):
+    async def get_selected_options(self, request: Request, value: Any) -> List[Tuple[str, Any]]:
+        # related objects of fetched relation are already loaded
+        related_objects = getattr(value, "related_objects", None)
+        if related_objects is not None:
+            return [(str(x), x.pk) for x in related_objects]
+        return await super().get_selected_options(request, value)
+
+
+def _as_sequence(value: Any) -> Sequence[Any]:
+    if value is None or value == "":
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+def _get_pk(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.pk
+    return value
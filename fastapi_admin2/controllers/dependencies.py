@@ -1,4 +1,7 @@
+from typing import AsyncIterator, Any
+
 from fastapi_admin2.entities import ResourceList
+from fastapi_admin2.utils.bulk_import import BulkInserter
 from fastapi_admin2.utils.depends import DependencyMarker
 
 
@@ -12,3 +15,11 @@ class DeleteOneDependencyMarker(DependencyMarker[None]):
 
 class DeleteManyDependencyMarker(DependencyMarker[None]):
     pass
+
+
+class ModelExportDependencyMarker(DependencyMarker[AsyncIterator[Any]]):
+    pass
+
+
+class BulkInsertDependencyMarker(DependencyMarker[BulkInserter]):
+    pass
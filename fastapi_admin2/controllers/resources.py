@@ -1,19 +1,27 @@
-from typing import Type, Any, List, Dict
+import dataclasses
+import pathlib
+from typing import Type, Any, List, Dict, AsyncIterator, Optional
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query, File, UploadFile, HTTPException
+from fastapi.encoders import jsonable_encoder
 from jinja2 import TemplateNotFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
-from starlette.responses import RedirectResponse, Response
-from starlette.status import HTTP_303_SEE_OTHER
+from starlette.responses import RedirectResponse, Response, StreamingResponse, JSONResponse
+from starlette.status import HTTP_303_SEE_OTHER, HTTP_404_NOT_FOUND
 
 from fastapi_admin2.entities import ResourceList
-from fastapi_admin2.depends import get_orm_model_by_resource_name, get_model_resource, get_resources
+from fastapi_admin2.enums import CountStrategy, DataFormat
+from fastapi_admin2.exceptions import FieldNotFoundError
+from fastapi_admin2.depends import get_orm_model_by_resource_name, get_model_resource, get_resources, \
+    get_model_resource_type_by_resource_name
 from fastapi_admin2.backends.sqla.markers import AsyncSessionDependencyMarker
 from fastapi_admin2.ui.resources import AbstractModelResource
+from fastapi_admin2.utils.bulk_import import BulkInserter, read_batches, import_rows
+from fastapi_admin2.utils.export import stream_export, EXPORT_MEDIA_TYPES
 from fastapi_admin2.utils.responses import redirect
 from fastapi_admin2.controllers.dependencies import ModelListDependencyMarker, DeleteOneDependencyMarker, \
-    DeleteManyDependencyMarker
+    DeleteManyDependencyMarker, ModelExportDependencyMarker, BulkInsertDependencyMarker
 
 router = APIRouter()
 
@@ -46,6 +54,12 @@ async def list_view(
         "page_size": page_size,
         "page_num": page_num,
         "total": resource_list.total_entries_count,
+        "total_label": _format_total_entries_count(resource_list),
+        "is_total_lower_bound": resource_list.is_lower_bound,
+        "has_next_page": resource_list.has_next_page,
+        "is_keyset_paginated": resource_list.is_keyset_paginated,
+        "next_cursor": resource_list.next_cursor,
+        "prev_cursor": resource_list.prev_cursor,
         "from": page_size * (page_num - 1) + 1,
         "to": page_size * page_num,
         "page_title": model_resource.page_title,
@@ -63,6 +77,89 @@ async def list_view(
         )
 
 
+@router.get("/{resource}/export")
+async def export(
+        request: Request,
+        resource_name: str = Path(..., alias="resource"),
+        model_resource: AbstractModelResource = Depends(get_model_resource),
+        export_format: DataFormat = Query(DataFormat.CSV, alias="format"),
+        raw: bool = False,
+        orm_models: AsyncIterator[Any] = Depends(ModelExportDependencyMarker)
+) -> StreamingResponse:
+    async def serialize_rows(chunk: List[Any]) -> List[List[Any]]:
+        return await model_resource.export_rows(chunk, request, raw=raw)
+
+    return StreamingResponse(
+        stream_export(
+            orm_models,
+            serialize_rows,
+            field_names=model_resource.get_field_names(),
+            export_format=export_format,
+            chunk_size=model_resource.export_chunk_size
+        ),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{resource_name}.{export_format}"'}
+    )
+
+
+@router.post("/{resource}/import")
+async def bulk_import(
+        model_resource: AbstractModelResource = Depends(get_model_resource),
+        file: UploadFile = File(...),
+        import_format: Optional[DataFormat] = Query(None, alias="format"),
+        batch_size: Optional[int] = Query(None, gt=0),
+        insert_rows: BulkInserter = Depends(BulkInsertDependencyMarker)
+) -> JSONResponse:
+    if import_format is None:
+        import_format = _guess_import_format(file.filename)
+
+    report = await import_rows(
+        read_batches(file, import_format, batch_size=batch_size or model_resource.import_batch_size),
+        parse_row=model_resource.parse_row,
+        insert_rows=insert_rows
+    )
+    return JSONResponse(dataclasses.asdict(report))
+
+
+@router.get("/{resource}/autocomplete/{field}")
+async def autocomplete_options(
+        request: Request,
+        field: str = Path(...),
+        query: str = Query("", alias="q"),
+        offset: int = Query(0, ge=0),
+        limit: Optional[int] = Query(None, gt=0, le=100),
+        # resource isn't instantiated, because inputs are shared by all instances of resource class
+        model_resource_type: Type[AbstractModelResource] = Depends(get_model_resource_type_by_resource_name),
+) -> JSONResponse:
+    try:
+        input_ = model_resource_type.get_foreign_key_input(field)
+    except FieldNotFoundError:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND)
+
+    page = await input_.get_options_page(
+        request, query.strip(), limit=limit or input_.options_page_size, offset=offset
+    )
+    return JSONResponse({
+        "options": [dict(label=label, value=value) for label, value in jsonable_encoder(page.options)],
+        "has_more": page.has_more
+    })
+
+
+def _guess_import_format(filename: Optional[str]) -> DataFormat:
+    extension = pathlib.Path(filename or "").suffix.lstrip(".").lower()
+    if extension in {"ndjson", "jsonl"}:
+        return DataFormat.NDJSON
+    return DataFormat.CSV
+
+
+def _format_total_entries_count(resource_list: ResourceList) -> str:
+    if resource_list.is_lower_bound:
+        return f"{resource_list.total_entries_count}+"
+    if resource_list.count_strategy == CountStrategy.ESTIMATE:
+        return f"~{resource_list.total_entries_count}"
+    return str(resource_list.total_entries_count)
+
+
 @router.post("/{resource_name}/update/{pk}")
 async def update(request: Request, resource_name: str = Path(...), pk: int = Path(...)):
     # TODO fill out this view
@@ -82,7 +179,7 @@ async def update_view(
     async with session.begin():
         obj = await session.get(model, id_)
 
-    inputs = await model_resource.render_inputs(obj)
+    inputs = await model_resource.render_inputs(request, obj)
     context = {
         "request": request,
         "resources": resources,
@@ -1,9 +1,9 @@
 from typing import List, Type, Optional, Any, Dict
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Query
 from fastapi.params import Path
 from starlette.requests import Request
-from starlette.status import HTTP_404_NOT_FOUND
+from starlette.status import HTTP_404_NOT_FOUND, HTTP_422_UNPROCESSABLE_ENTITY
 
 from fastapi_admin2.exceptions import InvalidResource
 from fastapi_admin2.ui.resources import Dropdown, Link, AbstractModelResource, Resource
@@ -15,26 +15,51 @@ def get_orm_model_by_resource_name(
 ) -> Optional[Type[Any]]:
     if not resource_name:
         return None
-    for model_cls in request.app.model_resources.keys():
-        if model_cls.__name__.lower() != resource_name.strip().lower():
-            continue
-        return model_cls
-    raise HTTPException(status_code=HTTP_404_NOT_FOUND)
+    model_cls = request.app.get_orm_model_by_slug(resource_name)
+    if model_cls is None:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND)
+    return model_cls
 
 
-async def get_model_resource(
+def get_model_resource_type_by_resource_name(
         request: Request,
-        orm_model: Any = Depends(
-            get_orm_model_by_resource_name
-        )
-) -> AbstractModelResource:
-    model_resource_type = request.app.get_model_resource_type(orm_model)  # type: Optional[Type[AbstractModelResource]]
-    if not model_resource_type:
+        resource_name: str = Path(..., alias="resource")
+) -> Type[AbstractModelResource]:
+    model_resource_type = request.app.get_model_resource_by_slug(resource_name)
+    if model_resource_type is None:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND)
+    return model_resource_type
+
 
+async def get_model_resource(
+        request: Request,
+        model_resource_type: Type[AbstractModelResource] = Depends(get_model_resource_type_by_resource_name)
+) -> AbstractModelResource:
     return await model_resource_type.from_http_request(request)
 
 
+async def get_ids_of_selected_entries(request: Request, ids: Optional[str] = Query(None)) -> List[Any]:
+    """
+    Ids can be passed either as comma separated query parameter or as json body `{"ids": [...]}`.
+    Json body should be preferred for large selections, because they don't fit in url,
+    it also allows to pass composite primary keys as lists of values of primary key columns.
+    """
+    if ids is not None:
+        return ids.split(",")
+
+    try:
+        body = await request.json()
+        selected_ids = body["ids"]
+    except (ValueError, KeyError, TypeError):
+        selected_ids = None
+    if not isinstance(selected_ids, list):
+        raise HTTPException(
+            status_code=HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Ids must be passed either by `ids` query parameter or by json body `{\"ids\": [...]}`"
+        )
+    return selected_ids
+
+
 def get_resources(request: Request) -> List[Dict[str, Any]]:
     resources = request.app.resources
     r = _get_resources(resources)  # TODO replace
@@ -54,7 +79,7 @@ def _get_resources(resources: List[Type[Resource]]):
             item["target"] = resource.target
         elif issubclass(resource, AbstractModelResource):
             item["type"] = "model"
-            item["model"] = resource.model.__name__.lower()
+            item["model"] = resource.get_slug()
         elif issubclass(resource, Dropdown):
             item["type"] = "dropdown"
             item["resources"] = _get_resources(resource.resources)
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import Any, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Sequence, Optional, List
+
+from fastapi_admin2.enums import CountStrategy
 
 
 @dataclass
@@ -14,3 +16,38 @@ class AbstractAdmin:
 class ResourceList:
     models: Sequence[Any] = ()
     total_entries_count: int = 0
+    # strategy, that has been used to calculate `total_entries_count`
+    count_strategy: CountStrategy = CountStrategy.EXACT
+    # `total_entries_count` is not a real count, but only the lower bound of it(e.g. capped count)
+    is_lower_bound: bool = False
+    has_next_page: bool = False
+
+    # filled only for resources, that are paginated by keyset(cursor) instead of LIMIT/OFFSET
+    is_keyset_paginated: bool = False
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+@dataclass
+class ImportRowError:
+    # 1-based number of the row in the imported file, None if the whole batch has failed
+    row_number: Optional[int]
+    error: str
+
+
+@dataclass
+class ImportBatchReport:
+    batch_number: int
+    inserted_count: int = 0
+    errors: List[ImportRowError] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
+
+
+@dataclass
+class ImportReport:
+    batches: List[ImportBatchReport] = field(default_factory=list)
+    inserted_count: int = 0
+    errors_count: int = 0
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
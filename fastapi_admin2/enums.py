@@ -12,3 +12,25 @@ class HTTPMethod(StrEnum):
     DELETE = "DELETE"
     PUT = "PUT"
     PATCH = "PATCH"
+
+
+class CountStrategy(StrEnum):
+    """
+    Defines how total count of entries is calculated for the list page of model resource
+    """
+    EXACT = "exact"
+    # cheap planner estimation(e.g. pg_class.reltuples or EXPLAIN rows estimation for postgresql),
+    # dialects that can't estimate count of rows fall back to exact count
+    ESTIMATE = "estimate"
+    # count only up to `AbstractModelResource.count_cap` rows and show it as "10000+"
+    CAPPED = "capped"
+    # do not count at all, only find out whether the next page exists
+    HAS_NEXT_PAGE = "has_next_page"
+
+
+class DataFormat(StrEnum):
+    """
+    Format of exported and imported files of model resources
+    """
+    CSV = "csv"
+    NDJSON = "ndjson"
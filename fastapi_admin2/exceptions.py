@@ -41,6 +41,12 @@ class DatabaseError(Exception):
     """
 
 
+class ResourceRegistrationError(Exception):
+    """
+    raise when resource can't be registered, e.g. its name collides with already registered resource
+    """
+
+
 class RequiredThirdPartyLibNotInstalled(Exception):
     def __init__(self, lib_name: str, *, thing_that_cant_work_without_lib: str,
                  can_be_installed_with_ext: Optional[str] = None):
@@ -1,5 +1,6 @@
 import abc
 import contextlib
+from contextvars import ContextVar
 from gettext import GNUTranslations
 from pathlib import Path
 from typing import Dict, Optional, ContextManager, Set
@@ -54,10 +55,16 @@ class I18NLocalizer(Localizer):
         self._domain = domain
         self._path_to_default_translations = path_to_default_translations
         self._locales = self._find_locales()
-        self._current_locale = self._default_locale
+        # translated messages by locale, so translation of hot messages is a single dict lookup
+        self._messages_cache: Dict[str, Dict[str, str]] = {}
+        # locale is local for the context(task of request), so concurrent requests don't switch locale of each other
+        self._current_locale: ContextVar[str] = ContextVar(
+            f"fastapi_admin2_current_locale_{id(self)}", default=self._default_locale
+        )
 
     def reload_locales(self) -> None:
         self._locales = self._find_locales()
+        self._messages_cache = {}
 
     @property
     def default_locale(self) -> str:
@@ -69,17 +76,17 @@ class I18NLocalizer(Localizer):
 
     @contextlib.contextmanager
     def internationalized(self, new_locale: str) -> ContextManager[None]:
-        previous_locale = self._current_locale
+        token = self._current_locale.set(new_locale)
         try:
-            self._current_locale = new_locale
             yield
         finally:
-            self._current_locale = previous_locale
+            self._current_locale.reset(token)
 
     def gettext(
             self, singular: str, plural: Optional[str] = None, n: int = 1, locale: Optional[str] = None
     ) -> str:
-        locale = self._current_locale
+        if locale is None:
+            locale = self._current_locale.get()
 
         if locale not in self._locales:
             if n == 1:
@@ -88,9 +95,17 @@ class I18NLocalizer(Localizer):
 
         translator = self._locales[locale]
 
-        if plural is None:
-            return translator.gettext(singular)
-        return translator.ngettext(singular, plural, n)
+        if plural is not None:
+            return translator.ngettext(singular, plural, n)
+
+        messages = self._messages_cache.get(locale)
+        if messages is None:
+            messages = self._messages_cache[locale] = {}
+        try:
+            return messages[singular]
+        except KeyError:
+            translated = messages[singular] = translator.gettext(singular)
+            return translated
 
     def lazy_gettext(
             self, singular: str, plural: Optional[str] = None, n: int = 1, locale: Optional[str] = None
@@ -106,7 +121,11 @@ class I18NLocalizer(Localizer):
         translations = self._get_default_translations()
 
         if self._path_to_extra_translations:
-            translations.update(**self._parse_translations(self._path_to_extra_translations))
+            for locale, extra_translation in self._parse_translations(self._path_to_extra_translations).items():
+                # messages, that aren't overridden by extra translations, are looked up in default ones
+                if locale in translations:
+                    extra_translation.add_fallback(translations[locale])
+                translations[locale] = extra_translation
         return translations
 
     def _get_default_translations(self) -> Dict[str, GNUTranslations]:
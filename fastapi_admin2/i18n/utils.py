@@ -1,15 +1,58 @@
+import functools
+from typing import Tuple, List
+
 from starlette.requests import Request
 
 from fastapi_admin2.i18n.exceptions import UnableToExtractLocaleFromRequestError
 
 
 def get_locale_from_request(request: Request) -> str:
+    return get_locale_candidates_from_request(request)[0]
+
+
+def get_locale_candidates_from_request(request: Request) -> Tuple[str, ...]:
+    """
+    Return locales, that are acceptable for the user, from the most preferred one
+    """
     if locale := request.query_params.get("language"):
-        return locale
+        return (locale,)
     if locale := request.cookies.get("language"):
-        return locale
+        return (locale,)
 
     if accept_language := request.headers.get("Accept-Language"):
-        return accept_language.split(",")[0].replace("-", "_")
+        if languages := parse_accept_language(accept_language):
+            return languages
 
     raise UnableToExtractLocaleFromRequestError()
+
+
+@functools.lru_cache(maxsize=256)
+def parse_accept_language(header: str) -> Tuple[str, ...]:
+    """
+    Parse value of `Accept-Language` header to the language codes ordered by their quality values.
+    Browsers send a few distinct values of this header, so result is memoized.
+
+    :param header: e.g. "uk-UA,uk;q=0.9,en-US;q=0.8,en;q=0.7"
+    :return: e.g. ("uk_UA", "uk", "en_US", "en")
+    """
+    weighted_languages: List[Tuple[float, int, str]] = []
+    for position, language_range in enumerate(header.split(",")):
+        language, *params = [part.strip() for part in language_range.split(";")]
+        if not language or language == "*":
+            continue
+
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() != "q":
+                continue
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+
+        if quality > 0:
+            # position keeps order of languages with equal quality values
+            weighted_languages.append((-quality, position, language.replace("-", "_")))
+
+    return tuple(language for _, _, language in sorted(weighted_languages))
@@ -1,15 +1,14 @@
 import functools
 from abc import ABC, abstractmethod
-from typing import Protocol, Optional, Generator
+from typing import Protocol, Optional, Generator, List, AbstractSet
 
 import pycountry
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Scope, Receive, Send
 
 from fastapi_admin2.i18n import Localizer
 from fastapi_admin2.i18n.localizer import I18NLocalizer
+from fastapi_admin2.utils.cookies import build_set_cookie_header, send_with_headers
 
 
 class Language(Protocol):
@@ -19,11 +18,11 @@ class Language(Protocol):
     type: str
 
 
-class AbstractI18nMiddleware(BaseHTTPMiddleware, ABC):
+class AbstractI18nMiddleware(ABC):
 
     def __init__(self, app: ASGIApp,
                  translator: Optional[Localizer] = None, ) -> None:
-        super().__init__(app)
+        self.app = app
         self._translator = translator
         if translator is None:
             self._translator = I18NLocalizer()
@@ -31,21 +30,41 @@ class AbstractI18nMiddleware(BaseHTTPMiddleware, ABC):
         self._languages = pycountry.languages
         iter(self._languages)  # avoid pycountry lazy loading
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        # languages are looked up in pycountry only when set of translations changes(e.g. after reload of locales)
+        self._available_languages: List[Language] = []
+        self._available_languages_translations: Optional[AbstractSet[str]] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
         current_locale = await self.get_locale(request)
         request.state.gettext = functools.partial(self._translator.gettext, locale=current_locale)
         request.state.lazy_gettext = functools.partial(self._translator.lazy_gettext, locale=current_locale)
         request.state.current_locale = current_locale
 
-        request.app.templates.env.globals['gettext'] = request.state.gettext
-        request.app.templates.env.globals['current_locale'] = current_locale
-        request.app.templates.env.globals['available_languages'] = list(self.iter_founded_locales())
-
+        # it's merged into context of rendered pages instead of globals of environment,
+        # which is shared between concurrent requests with different locales
+        request.state.template_context = {
+            "gettext": request.state.gettext,
+            "current_locale": current_locale,
+            "available_languages": self.get_available_languages()
+        }
+
+        send = send_with_headers(
+            send, build_set_cookie_header("language", current_locale, path=request.app.admin_path)
+        )
         with self._translator.internationalized(new_locale=current_locale):
-            response = await call_next(request)
-
-        response.set_cookie(key="language", value=current_locale, path=request.app.admin_path)
-        return response
+            await self.app(scope, receive, send)
+
+    def get_available_languages(self) -> List[Language]:
+        available_translations = self._translator.available_translations
+        if available_translations != self._available_languages_translations:
+            self._available_languages = list(self.iter_founded_locales())
+            self._available_languages_translations = available_translations
+        return self._available_languages
 
     def iter_founded_locales(self) -> Generator[Language, None, None]:
         for t in self._translator.available_translations:
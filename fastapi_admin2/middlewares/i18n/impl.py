@@ -1,4 +1,5 @@
-from typing import cast, Optional
+import functools
+from typing import cast, Optional, Tuple, AbstractSet
 
 from starlette.requests import Request
 from starlette.types import ASGIApp
@@ -6,11 +7,11 @@ from starlette.types import ASGIApp
 from fastapi_admin2.exceptions import RequiredThirdPartyLibNotInstalled
 from fastapi_admin2.i18n.exceptions import UnableToExtractLocaleFromRequestError
 from fastapi_admin2.i18n.localizer import Localizer
-from fastapi_admin2.i18n.utils import get_locale_from_request
+from fastapi_admin2.i18n.utils import get_locale_candidates_from_request
 from fastapi_admin2.middlewares.i18n.base import AbstractI18nMiddleware
 
 try:
-    from babel import Locale
+    from babel import Locale, UnknownLocaleError
 except ImportError:  # pragma: no cover
     Locale = None
 
@@ -29,14 +30,38 @@ class I18nMiddleware(AbstractI18nMiddleware):
     async def get_locale(self, request: Request) -> str:
 
         try:
-            locale = get_locale_from_request(request)
+            candidates = get_locale_candidates_from_request(request)
         except UnableToExtractLocaleFromRequestError:
             return self._translator.default_locale
 
-        parsed_locale = Locale.parse(locale)
-        if parsed_locale.language not in self._translator.available_translations:
-            return self._translator.default_locale
-        return cast(str, parsed_locale.language)
+        return resolve_locale(
+            candidates,
+            frozenset(self._translator.available_translations),
+            self._translator.default_locale
+        )
+
+
+@functools.lru_cache(maxsize=256)
+def resolve_locale(candidates: Tuple[str, ...], available_translations: AbstractSet[str],
+                   default_locale: str) -> str:
+    """
+    Choose the most preferred of candidates, for which translation is available.
+    Set of candidates comes from a few distinct values of headers and cookies, so it's memoized
+    instead of parsing locales on every request.
+
+    :param candidates: locales ordered by preference of the user
+    :param available_translations:
+    :param default_locale: locale, that is used if there is no translation for any of candidates
+    :return:
+    """
+    for candidate in candidates:
+        try:
+            parsed_locale = Locale.parse(candidate)
+        except (ValueError, UnknownLocaleError):
+            continue
+        if parsed_locale.language in available_translations:
+            return cast(str, parsed_locale.language)
+    return default_locale
 
 
 def _raise_if_babel_not_installed() -> None:
@@ -1,23 +1,49 @@
-from typing import Callable, Awaitable
+import functools
+from typing import Any, Dict, Optional, Sequence, List
 
-from starlette.middleware.base import RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Scope, Receive, Send
 
 from fastapi_admin2.utils.templating import JinjaTemplates, supplement_template_name
 
 
-def create_template_middleware(templates: JinjaTemplates) -> Callable[
-    [Request, RequestResponseEndpoint], Awaitable[Response]
-]:
-    async def add_render_function_to_request(request: Request, call_next: RequestResponseEndpoint) -> Response:
-        request.state.create_html_response = templates.create_html_response
+class TemplatingMiddleware:
+    """
+    Provide rendering functions to widgets and views through `request.state`
+    """
 
-        async def render_jinja_template(template_name, context):
-            template = templates.env.get_template(supplement_template_name(template_name))
-            return await template.render_async(context)
+    def __init__(self, app: ASGIApp, templates: JinjaTemplates) -> None:
+        self.app = app
+        self._templates = templates
 
-        request.state.render_jinja = render_jinja_template
-        return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    return add_render_function_to_request
+        # `request.state` is backed by scope, so it's shared with all requests created from this scope
+        state = scope.setdefault("state", {})
+        state["create_html_response"] = self._templates.create_html_response
+        # state is bound, because context specific for the request(e.g. current locale) is set by
+        # middlewares, that are called after this one
+        state["render_jinja"] = functools.partial(self.render_jinja_template, state=state)
+        state["render_jinja_column"] = functools.partial(self.render_jinja_column, state=state)
+
+        await self.app(scope, receive, send)
+
+    async def render_jinja_template(self, template_name: str, context: Dict[str, Any],
+                                    state: Optional[Dict[str, Any]] = None) -> str:
+        template = self._templates.env.get_template(supplement_template_name(template_name))
+        return await template.render_async(_get_template_context(state), **context)
+
+    async def render_jinja_column(self, template_name: str, values: Sequence[Any],
+                                  context: Optional[Dict[str, Any]] = None,
+                                  state: Optional[Dict[str, Any]] = None) -> List[str]:
+        return await self._templates.render_column(
+            template_name, values, {**_get_template_context(state), **(context or {})}
+        )
+
+
+def _get_template_context(state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if state is None:
+        return {}
+    return state.get("template_context", {})
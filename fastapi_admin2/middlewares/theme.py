@@ -1,16 +1,27 @@
-from starlette.middleware.base import RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import QueryParams
+from starlette.types import ASGIApp, Scope, Receive, Send
 
+from fastapi_admin2.utils.cookies import build_set_cookie_header, build_delete_cookie_header, send_with_headers
 
-async def theme_middleware(request: Request, call_next: RequestResponseEndpoint) -> Response:
-    dark_mode_toggled = request.query_params.get('theme') == 'dark'
-    light_theme_toggled = request.query_params.get('theme') == 'light'
-    response = await call_next(request)
 
-    if dark_mode_toggled:
-        response.set_cookie('dark_mode', 'yes', path=request.app.admin_path)
-    elif light_theme_toggled:
-        response.delete_cookie('dark_mode', path=request.app.admin_path)
+class ThemeMiddleware:
+    """
+    Remember theme toggled by `theme` query parameter in cookie
+    """
 
-    return response
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        theme = QueryParams(scope.get("query_string", b"").decode("latin-1")).get("theme")
+        admin_path = scope["app"].admin_path
+        if theme == "dark":
+            send = send_with_headers(send, build_set_cookie_header("dark_mode", "yes", path=admin_path))
+        elif theme == "light":
+            send = send_with_headers(send, build_delete_cookie_header("dark_mode", path=admin_path))
+
+        await self.app(scope, receive, send)
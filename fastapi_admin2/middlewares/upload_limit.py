@@ -0,0 +1,84 @@
+from typing import Callable, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import PlainTextResponse
+from starlette.status import HTTP_413_REQUEST_ENTITY_TOO_LARGE
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+METHODS_WITH_BODY = frozenset({"POST", "PUT", "PATCH"})
+
+
+class RequestBodyTooLarge(Exception):
+    pass
+
+
+class UploadLimitMiddleware:
+    """
+    Reject requests, which body exceeds the limit, before it's parsed(and spooled to disk) by multipart parser.
+    Declared `Content-Length` is checked before reading the body, bytes of chunked bodies are counted while they're
+    received, so request is aborted as soon as limit is exceeded.
+    """
+
+    def __init__(self, app: ASGIApp, get_limit: Callable[[Scope], Optional[int]]) -> None:
+        """
+        :param app:
+        :param get_limit: returns max size of body of request in bytes or None, if body isn't limited
+        """
+        self.app = app
+        self._get_limit = get_limit
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in METHODS_WITH_BODY:
+            await self.app(scope, receive, send)
+            return
+
+        limit = self._get_limit(scope)
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            await _create_too_large_response(limit)(scope, receive, send)
+            return
+
+        received_bytes = 0
+        limit_exceeded = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received_bytes, limit_exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received_bytes += len(message.get("body", b""))
+                if received_bytes > limit:
+                    limit_exceeded = True
+                    raise RequestBodyTooLarge()
+            return message
+
+        async def tracked_send(message: Message) -> None:
+            nonlocal response_started
+            if limit_exceeded and not response_started:
+                # app may catch the exception while parsing body and respond by itself,
+                # e.g. FastAPI reports it as malformed body with 400, such response is replaced by 413
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except RequestBodyTooLarge:
+            if response_started:
+                raise
+        if limit_exceeded and not response_started:
+            await _create_too_large_response(limit)(scope, receive, send)
+
+
+def _create_too_large_response(limit: int) -> PlainTextResponse:
+    return PlainTextResponse(
+        f"Request body exceeds max size {limit}",
+        status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        # rest of the body isn't read, so connection can't be reused
+        headers={"Connection": "close"}
+    )
@@ -0,0 +1,30 @@
+from typing import TYPE_CHECKING
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Scope, Receive, Send
+
+if TYPE_CHECKING:
+    from fastapi_admin2.providers.security.provider import SecurityProvider
+
+
+class AuthenticationMiddleware:
+    """
+    Authenticate admin by session before request reaches routes,
+    unauthenticated requests are answered by provider(e.g. redirected to login page)
+    """
+
+    def __init__(self, app: ASGIApp, provider: "SecurityProvider") -> None:
+        self.app = app
+        self._provider = provider
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response = await self._provider.authenticate(Request(scope, receive))
+        if response is not None:
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
@@ -1,14 +1,22 @@
-from typing import Union
+import os
+from typing import Union, Optional, Any
 
 from argon2 import PasswordHasher, DEFAULT_TIME_COST, DEFAULT_MEMORY_COST, DEFAULT_PARALLELISM, \
-    DEFAULT_HASH_LENGTH, DEFAULT_RANDOM_SALT_LENGTH, Type
+    DEFAULT_HASH_LENGTH, DEFAULT_RANDOM_SALT_LENGTH, Type, extract_parameters
 from argon2.exceptions import InvalidHash, VerifyMismatchError, VerificationError
+from argon2.low_level import ARGON2_VERSION
 
-from fastapi_admin2.providers.security.password_hashing.protocol import PasswordHasherProto, \
+from fastapi_admin2.providers.security.password_hashing.protocol import AsyncPasswordHasherProto, \
     HashVerifyFailedError
+from fastapi_admin2.providers.security.password_hashing.calibration import calibrate_argon2, \
+    DEFAULT_TARGET_LATENCY_SECONDS, DEFAULT_MAX_MEMORY_COST_KIB
+from fastapi_admin2.providers.security.password_hashing.pool import HashingPool, HashingPoolStatistics
 
+# every hashing allocates `memory_cost` KiB, so count of concurrent hashings is bounded
+DEFAULT_MAX_CONCURRENT_HASHINGS = min(4, os.cpu_count() or 1)
 
-class Argon2PasswordHasher(PasswordHasherProto):
+
+class Argon2PasswordHasher(AsyncPasswordHasherProto):
 
     def __init__(
             self,
@@ -19,11 +27,57 @@ class Argon2PasswordHasher(PasswordHasherProto):
             salt_len: int = DEFAULT_RANDOM_SALT_LENGTH,
             encoding: str = "utf-8",
             type_: Type = Type.ID,
+            max_concurrent_hashings: Optional[int] = None,
     ):
         self._hasher = PasswordHasher(time_cost, memory_cost, parallelism, hash_len, salt_len, encoding, type_)
+        if max_concurrent_hashings is None:
+            max_concurrent_hashings = DEFAULT_MAX_CONCURRENT_HASHINGS
+        self._pool = HashingPool(max_concurrent_hashings)
+
+    @classmethod
+    def from_calibration(
+            cls,
+            target_latency_seconds: float = DEFAULT_TARGET_LATENCY_SECONDS,
+            max_memory_cost_kib: int = DEFAULT_MAX_MEMORY_COST_KIB,
+            parallelism: Optional[int] = None,
+            type_: Type = Type.ID,
+            **kwargs: Any
+    ) -> "Argon2PasswordHasher":
+        """
+        Create hasher with the strongest parameters, that fit target latency and memory budget on the current host.
+        Hashes created with weaker parameters are upgraded on login, because `is_rehashing_required`
+        compares parameters of hash with calibrated ones.
+        """
+        parameters = calibrate_argon2(
+            target_latency_seconds=target_latency_seconds,
+            max_memory_cost_kib=max_memory_cost_kib,
+            parallelism=parallelism,
+            type_=type_
+        )
+        return cls(
+            time_cost=parameters.time_cost,
+            memory_cost=parameters.memory_cost,
+            parallelism=parameters.parallelism,
+            type_=type_,
+            **kwargs
+        )
 
     def is_rehashing_required(self, hash_: str) -> bool:
-        return self._hasher.check_needs_rehash(hash_)
+        """
+        Hash is upgraded only if configured parameters are stronger, it's never downgraded.
+        Otherwise hashes would be rehashed back and forth by workers with different calibrated parameters,
+        e.g. with parallelism equal to count of CPUs of the host
+        """
+        try:
+            parameters = extract_parameters(hash_)
+        except InvalidHash:
+            return True
+
+        configured = (self._hasher.time_cost, self._hasher.memory_cost, self._hasher.parallelism)
+        current = (parameters.time_cost, parameters.memory_cost, parameters.parallelism)
+        if any(c < h for c, h in zip(configured, current)):
+            return False
+        return configured != current or parameters.version < ARGON2_VERSION or parameters.type != self._hasher.type
 
     def verify(self, hash_: str, password: str) -> None:
         try:
@@ -33,3 +87,13 @@ class Argon2PasswordHasher(PasswordHasherProto):
 
     def hash(self, password: Union[str, bytes]) -> str:
         return self._hasher.hash(password)
+
+    async def verify_async(self, hash_: str, password: str) -> None:
+        # argon2 releases GIL while hashing, so threads run it in parallel
+        await self._pool.run(self.verify, hash_, password)
+
+    async def hash_async(self, password: Union[str, bytes]) -> str:
+        return await self._pool.run(self.hash, password)
+
+    def statistics(self) -> HashingPoolStatistics:
+        return self._pool.statistics()
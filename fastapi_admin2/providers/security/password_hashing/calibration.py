@@ -0,0 +1,113 @@
+"""
+Choose the strongest argon2 parameters, that fit target latency and memory budget on the current host.
+
+Can be run from command line::
+
+    python -m fastapi_admin2.providers.security.password_hashing.calibration --target-latency-ms 100
+"""
+import argparse
+import os
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from argon2 import DEFAULT_HASH_LENGTH, DEFAULT_RANDOM_SALT_LENGTH, Type
+from argon2.low_level import hash_secret_raw
+
+DEFAULT_TARGET_LATENCY_SECONDS = 0.1
+DEFAULT_MAX_MEMORY_COST_KIB = 64 * 1024
+MAX_TIME_COST = 32
+# argon2 requires at least 8 KiB of memory per lane
+MIN_MEMORY_COST_PER_LANE_KIB = 8
+BENCHMARK_PASSWORD = b"calibration-password"
+
+
+@dataclass(frozen=True)
+class Argon2Parameters:
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    # median latency of hashing with these parameters on the host, where they were calibrated
+    latency_seconds: float
+
+
+def calibrate_argon2(
+        target_latency_seconds: float = DEFAULT_TARGET_LATENCY_SECONDS,
+        max_memory_cost_kib: int = DEFAULT_MAX_MEMORY_COST_KIB,
+        parallelism: Optional[int] = None,
+        type_: Type = Type.ID,
+        rounds: int = 3,
+) -> Argon2Parameters:
+    """
+    Whole memory budget is used first, because memory cost is what makes brute force on GPUs expensive,
+    then time cost is raised while hashing still fits target latency.
+    If even minimal time cost with whole memory budget is too slow, memory cost is halved until it fits.
+
+    :param target_latency_seconds: how long one hashing may take
+    :param max_memory_cost_kib: memory budget of one hashing, pay attention, that hashings may run concurrently
+    :param parallelism: count of lanes, count of CPUs by default
+    :param type_:
+    :param rounds: count of measurements of every candidate, median of them is compared with target latency
+    :return:
+    """
+    if parallelism is None:
+        parallelism = os.cpu_count() or 1
+    min_memory_cost = MIN_MEMORY_COST_PER_LANE_KIB * parallelism
+    if max_memory_cost_kib < min_memory_cost:
+        raise ValueError(f"Memory budget must be at least {min_memory_cost} KiB for parallelism {parallelism}")
+
+    memory_cost = max_memory_cost_kib
+    latency = _measure(1, memory_cost, parallelism, type_, rounds)
+    while latency > target_latency_seconds and memory_cost // 2 >= min_memory_cost:
+        memory_cost //= 2
+        latency = _measure(1, memory_cost, parallelism, type_, rounds)
+
+    best = Argon2Parameters(time_cost=1, memory_cost=memory_cost, parallelism=parallelism, latency_seconds=latency)
+    for time_cost in range(2, MAX_TIME_COST + 1):
+        # latency grows linearly with time cost, so candidates, that surely don't fit, aren't measured
+        if best.latency_seconds / best.time_cost * time_cost > target_latency_seconds:
+            break
+        latency = _measure(time_cost, memory_cost, parallelism, type_, rounds)
+        if latency > target_latency_seconds:
+            break
+        best = Argon2Parameters(
+            time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism, latency_seconds=latency
+        )
+    return best
+
+
+def _measure(time_cost: int, memory_cost: int, parallelism: int, type_: Type, rounds: int) -> float:
+    salt = os.urandom(DEFAULT_RANDOM_SALT_LENGTH)
+    latencies = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        hash_secret_raw(
+            BENCHMARK_PASSWORD, salt, time_cost=time_cost, memory_cost=memory_cost,
+            parallelism=parallelism, hash_len=DEFAULT_HASH_LENGTH, type=type_
+        )
+        latencies.append(time.perf_counter() - started_at)
+    return statistics.median(latencies)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Calibrate argon2 parameters for the current host")
+    parser.add_argument("--target-latency-ms", type=float, default=DEFAULT_TARGET_LATENCY_SECONDS * 1000)
+    parser.add_argument("--max-memory-mib", type=int, default=DEFAULT_MAX_MEMORY_COST_KIB // 1024)
+    parser.add_argument("--parallelism", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    parameters = calibrate_argon2(
+        target_latency_seconds=args.target_latency_ms / 1000,
+        max_memory_cost_kib=args.max_memory_mib * 1024,
+        parallelism=args.parallelism
+    )
+    print(
+        f"time_cost={parameters.time_cost} memory_cost={parameters.memory_cost} "
+        f"parallelism={parameters.parallelism} "
+        f"(hashing takes {parameters.latency_seconds * 1000:.1f} ms on this host)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import functools
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+import anyio
+from anyio import CapacityLimiter
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HashingPoolStatistics:
+    max_concurrency: int
+    running: int
+    # count of hashings waiting for a free worker(queue depth)
+    waiting: int
+
+
+class HashingPool:
+    """
+    Run CPU-bound hashing in worker threads, so it doesn't block event loop.
+    Count of concurrent hashings is bounded, because every hashing may take a lot of memory(e.g. argon2),
+    exceeding ones are queued.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        if max_concurrency <= 0:
+            raise ValueError("Concurrency of hashing pool must be positive")
+        self._max_concurrency = max_concurrency
+        # limiter is bound to event loop, so it's created on first use rather than at import/configuration time
+        self._limiter: Optional[CapacityLimiter] = None
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await anyio.to_thread.run_sync(functools.partial(func, *args, **kwargs), limiter=self._get_limiter())
+
+    def statistics(self) -> HashingPoolStatistics:
+        if self._limiter is None:
+            return HashingPoolStatistics(max_concurrency=self._max_concurrency, running=0, waiting=0)
+        limiter_statistics = self._limiter.statistics()
+        return HashingPoolStatistics(
+            max_concurrency=self._max_concurrency,
+            running=limiter_statistics.borrowed_tokens,
+            waiting=limiter_statistics.tasks_waiting
+        )
+
+    def _get_limiter(self) -> CapacityLimiter:
+        if self._limiter is None:
+            self._limiter = CapacityLimiter(self._max_concurrency)
+        return self._limiter
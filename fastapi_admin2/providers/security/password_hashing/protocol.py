@@ -17,4 +17,21 @@ class PasswordHasherProto(Protocol):
         It raises exception(HashingFailedError) if something fail.
         """
 
-    def hash(self, password: Union[str, bytes]) -> str: ...
\ No newline at end of file
+    def hash(self, password: Union[str, bytes]) -> str: ...
+
+
+class AsyncPasswordHasherProto(PasswordHasherProto, Protocol):
+    """
+    Hasher, that hashes without blocking event loop by itself(e.g. in bounded thread pool).
+    Hashers, that implement only PasswordHasherProto, are run in default thread pool
+    """
+
+    async def verify_async(self, hash_: str, password: str) -> None:
+        """
+        The same as `verify`, but doesn't block event loop
+        """
+
+    async def hash_async(self, password: Union[str, bytes]) -> str:
+        """
+        The same as `hash`, but doesn't block event loop
+        """
\ No newline at end of file
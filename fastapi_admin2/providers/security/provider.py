@@ -1,9 +1,11 @@
-import uuid
-from typing import TYPE_CHECKING, List, Optional
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING, List, Optional, Union
 
+import anyio
 from aioredis import Redis
 from fastapi import Depends, HTTPException
-from starlette.middleware.base import RequestResponseEndpoint, BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import RedirectResponse, Response
 from starlette.status import HTTP_303_SEE_OTHER, HTTP_401_UNAUTHORIZED
@@ -13,10 +15,13 @@ from fastapi_admin2.entities import AbstractAdmin
 from fastapi_admin2.providers import Provider
 from fastapi_admin2.providers.security.dependencies import AdminDaoDependencyMarker, EntityNotFound, \
     AdminDaoProto
+from fastapi_admin2.providers.security.middleware import AuthenticationMiddleware
 from fastapi_admin2.providers.security.dto import InitAdmin, RenewPasswordCredentials, LoginCredentials
 from fastapi_admin2.providers.security.password_hashing.protocol import HashVerifyFailedError, \
     PasswordHasherProto
 from fastapi_admin2.providers.security.responses import to_init_page, to_login_page
+from fastapi_admin2.providers.security.sessions import SessionStoreProto, RedisSessionStore
+from fastapi_admin2.utils.cache import TTLCache
 from fastapi_admin2.utils.depends import get_dependency_from_request_by_marker
 from fastapi_admin2.utils.files import FileManager
 
@@ -31,7 +36,16 @@ def get_current_admin(request: Request) -> AbstractAdmin:
     return admin
 
 
-SESSION_ID_KEY = "user_session:{session_id}"
+SESSION_INVALIDATION_CHANNEL = "fastapi_admin2:session_invalidation"
+# messages of invalidation channel, sessions are evicted one by one on logout and all at once for the admin,
+# whose password was changed
+SESSION_INVALIDATION_MESSAGE = "session:{session_id}"
+ADMIN_INVALIDATION_MESSAGE = "admin:{admin_id}"
+# delays between attempts to resubscribe to invalidation channel, after connection to redis was lost
+SESSION_INVALIDATION_RESUBSCRIBE_MIN_DELAY_IN_SECONDS = 0.5
+SESSION_INVALIDATION_RESUBSCRIBE_MAX_DELAY_IN_SECONDS = 30
+
+logger = logging.getLogger(__name__)
 
 
 class SecurityProvider(Provider):
@@ -41,7 +55,7 @@ class SecurityProvider(Provider):
     def __init__(
             self,
             file_manager: FileManager,
-            redis: Redis,
+            redis: Optional[Redis],
             password_hasher: PasswordHasherProto,
             login_path: str = "/login",
             logout_path: str = "/logout",
@@ -50,7 +64,16 @@ class SecurityProvider(Provider):
             login_title_translation_key: str = "login_title",
             keep_logined_in_seconds: int = 3600,
             keep_logined_with_checked_remember_me_in_seconds: int = 3600 * 24 * 7,
+            session_cache_size: int = 1024,
+            session_cache_ttl_in_seconds: float = 30,
+            session_invalidation_channel: Optional[str] = SESSION_INVALIDATION_CHANNEL,
+            session_store: Optional[SessionStoreProto] = None,
     ):
+        """
+        :param redis: it's used to store sessions, if `session_store` isn't passed,
+                      and to notify other workers about revoked sessions, can be omitted with other session store
+        :param session_store: where sessions are kept, sessions are stored in redis by default
+        """
         self.login_path = login_path
         self.logout_path = logout_path
         self.template_name = login_page_template_name
@@ -59,8 +82,23 @@ class SecurityProvider(Provider):
         self._password_hasher = password_hasher
         self._file_manager = file_manager
         self._redis = redis
+        if session_store is None:
+            if redis is None:
+                raise ValueError("Either redis or session store must be passed")
+            session_store = RedisSessionStore(redis)
+        self._session_store = session_store
         self._keep_logined_with_checked_remember_me_in_seconds = keep_logined_with_checked_remember_me_in_seconds
         self._keep_logined_in_seconds = keep_logined_in_seconds
+        # session id -> admin, so authenticated requests don't hit redis and database every time
+        self._admins_by_session_id: TTLCache[str, AbstractAdmin] = TTLCache(
+            maxsize=session_cache_size, ttl=session_cache_ttl_in_seconds
+        )
+        # without redis there are no other workers to notify
+        self._session_invalidation_channel = session_invalidation_channel if redis is not None else None
+        self._session_invalidation_listener: Optional[asyncio.Task] = None
+        # sessions revoked by other workers can't be evicted while there is no subscription to invalidations,
+        # so cache isn't used until subscription is restored
+        self._is_session_cache_enabled = True
 
     def register(self, app: "FastAPIAdmin") -> None:
         super(SecurityProvider, self).register(app)
@@ -75,7 +113,86 @@ class SecurityProvider(Provider):
         app.get("/renew_password")(self.renew_password_view)
         app.post("/renew_password")(self.renew_password)
 
-        app.add_middleware(BaseHTTPMiddleware, dispatch=self.authenticate_middleware)
+        app.add_middleware(AuthenticationMiddleware, provider=self)
+        app.register_file_manager(self._file_manager)
+
+        if self._session_invalidation_channel is not None:
+            app.router.on_startup.append(self.start_listening_to_session_invalidations)
+            app.router.on_shutdown.append(self.stop_listening_to_session_invalidations)
+
+    async def start_listening_to_session_invalidations(self) -> None:
+        """
+        Evict sessions from the cache of this worker, when they're revoked by other workers
+        """
+        if self._session_invalidation_listener is not None:
+            return
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self._session_invalidation_channel)
+        self._session_invalidation_listener = asyncio.create_task(self._listen_to_session_invalidations(pubsub))
+
+    async def stop_listening_to_session_invalidations(self) -> None:
+        if self._session_invalidation_listener is None:
+            return
+        self._session_invalidation_listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._session_invalidation_listener
+        self._session_invalidation_listener = None
+
+    async def _listen_to_session_invalidations(self, pubsub) -> None:
+        resubscribe_delay = SESSION_INVALIDATION_RESUBSCRIBE_MIN_DELAY_IN_SECONDS
+        try:
+            while True:
+                try:
+                    if pubsub is None:
+                        pubsub = self._redis.pubsub()
+                        await pubsub.subscribe(self._session_invalidation_channel)
+                        logger.info("Subscription to session invalidations is restored")
+                        resubscribe_delay = SESSION_INVALIDATION_RESUBSCRIBE_MIN_DELAY_IN_SECONDS
+                    self._is_session_cache_enabled = True
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        self._evict_cached_sessions(message["data"])
+                    raise ConnectionError("Subscription to session invalidations is closed")
+                except Exception:
+                    logger.exception(
+                        "Subscription to session invalidations is lost, resubscribing in %s seconds",
+                        resubscribe_delay
+                    )
+                    self._is_session_cache_enabled = False
+                    self._admins_by_session_id.clear()
+                    await self._close_session_invalidations_subscription(pubsub)
+                    pubsub = None
+                    await asyncio.sleep(resubscribe_delay)
+                    resubscribe_delay = min(
+                        resubscribe_delay * 2, SESSION_INVALIDATION_RESUBSCRIBE_MAX_DELAY_IN_SECONDS
+                    )
+        finally:
+            if pubsub is not None:
+                await self._close_session_invalidations_subscription(pubsub)
+
+    async def _close_session_invalidations_subscription(self, pubsub) -> None:
+        # connection can be already broken, so errors are not interesting here
+        with contextlib.suppress(Exception):
+            await pubsub.unsubscribe(self._session_invalidation_channel)
+        with contextlib.suppress(Exception):
+            await pubsub.close()
+
+    def _evict_cached_sessions(self, invalidation_message: Union[str, bytes]) -> None:
+        if isinstance(invalidation_message, bytes):
+            invalidation_message = invalidation_message.decode()
+        kind, _, value = invalidation_message.partition(":")
+        if kind == "session":
+            self._admins_by_session_id.pop(value)
+        elif kind == "admin":
+            self._admins_by_session_id.pop_where(lambda admin: str(admin.id) == value)
+        else:
+            logger.warning("Unknown message of session invalidation: %s", invalidation_message)
+
+    async def _invalidate_cached_sessions(self, invalidation_message: str) -> None:
+        self._evict_cached_sessions(invalidation_message)
+        if self._session_invalidation_channel is not None:
+            await self._redis.publish(self._session_invalidation_channel, invalidation_message)
 
     async def login_view(self, request: Request,
                          admin_dao: AdminDaoProto = Depends(AdminDaoDependencyMarker), ) -> Response:
@@ -107,11 +224,13 @@ class SecurityProvider(Provider):
         except EntityNotFound:
             return unauthorized_response
         else:
-            if self._is_password_hash_is_invalid(admin, login_credentials.password):
+            if await self._is_password_hash_is_invalid(admin, login_credentials.password):
                 return unauthorized_response
 
             if self._password_hasher.is_rehashing_required(admin.password):
-                await admin_dao.update_admin({}, password=self._password_hasher.hash(admin.password))
+                await admin_dao.update_admin(
+                    {"id": admin.id}, password=await self._hash_password(login_credentials.password)
+                )
 
         response = RedirectResponse(url=request.app.admin_path, status_code=HTTP_303_SEE_OTHER)
         if login_credentials.remember_me:
@@ -121,7 +240,7 @@ class SecurityProvider(Provider):
             expires_in_seconds = self._keep_logined_in_seconds
             response.delete_cookie("remember_me")
 
-        session_id = uuid.uuid4().hex
+        session_id = await self._session_store.create_session(admin.id, expires_in_seconds)
         response.set_cookie(
             self.session_cookie_key,
             session_id,
@@ -129,21 +248,23 @@ class SecurityProvider(Provider):
             path=request.app.admin_path,
             httponly=True
         )
-        await self._redis.set(SESSION_ID_KEY.format(session_id=session_id), admin.id, ex=expires_in_seconds)
         return response
 
     async def logout(self, request: Request) -> Response:
         response = to_login_page(request)
         response.delete_cookie(self.session_cookie_key, path=request.app.admin_path)
         session_id = request.cookies[self.session_cookie_key]
-        await self._redis.delete(SESSION_ID_KEY.format(session_id=session_id))
+        await self._session_store.delete_session(session_id)
+        await self._invalidate_cached_sessions(SESSION_INVALIDATION_MESSAGE.format(session_id=session_id))
         return response
 
-    async def authenticate_middleware(
-            self,
-            request: Request,
-            call_next: RequestResponseEndpoint
-    ) -> Response:
+    async def authenticate(self, request: Request) -> Optional[Response]:
+        """
+        Set admin of the session to `request.state.admin`
+
+        :param request:
+        :return: response, that should be sent instead of passing request further, if request can't be handled
+        """
         request.state.admin = None
 
         paths_related_to_authentication_stuff = [self.login_path, "/init", "/renew_password"]
@@ -151,16 +272,24 @@ class SecurityProvider(Provider):
         if not (session_id := request.cookies.get(self.session_cookie_key)):
             if request.scope["path"] not in paths_related_to_authentication_stuff:
                 return to_login_page(request)
+            return None
 
-        admin_id = await self._redis.get(SESSION_ID_KEY.format(session_id=session_id))
+        if self._is_session_cache_enabled:
+            if (admin := self._admins_by_session_id.get(session_id)) is not None:
+                request.state.admin = admin
+                return None
+
+        admin_id = await self._session_store.get_admin_id(session_id)
         admin_dao: AdminDaoProto = get_dependency_from_request_by_marker(request, AdminDaoDependencyMarker)
         try:
             admin = await admin_dao.get_one_admin_by_filters(id=int(admin_id))
-        except (EntityNotFound, TypeError):
-            return await call_next(request)
+        except (EntityNotFound, TypeError, ValueError):
+            return None
 
+        if self._is_session_cache_enabled:
+            self._admins_by_session_id.set(session_id, admin)
         request.state.admin = admin
-        return await call_next(request)
+        return None
 
     async def init_view(
             self,
@@ -193,7 +322,7 @@ class SecurityProvider(Provider):
 
         await admin_dao.add_admin(
             username=init_admin.username,
-            password=self._password_hasher.hash(init_admin.password),
+            password=await self._hash_password(init_admin.password),
             profile_pic=str(path_to_profile_pic)
         )
 
@@ -221,7 +350,7 @@ class SecurityProvider(Provider):
             admin_dao: AdminDaoProto = Depends(AdminDaoDependencyMarker)
     ) -> Response:
         error = None
-        if self._is_password_hash_is_invalid(admin, form.old_password):
+        if await self._is_password_hash_is_invalid(admin, form.old_password):
             error = request.state.gettext("old_password_error")
 
         if form.new_password != form.confirmation_new_password:
@@ -233,16 +362,34 @@ class SecurityProvider(Provider):
                 context={"request": request, "resources": resources, "error": error},
             )
 
-        await admin_dao.update_admin({"id": admin.id}, password=form.new_password)
+        await admin_dao.update_admin(
+            {"id": admin.id}, password=await self._hash_password(form.new_password)
+        )
+        # other sessions of the admin have entity with outdated password
+        await self._invalidate_cached_sessions(ADMIN_INVALIDATION_MESSAGE.format(admin_id=admin.id))
         return await self.logout(request)
 
-    def _is_password_hash_is_invalid(
+    async def _hash_password(self, password: str) -> str:
+        hash_async = getattr(self._password_hasher, "hash_async", None)
+        if hash_async is None:
+            # hasher implements only synchronous protocol
+            return await anyio.to_thread.run_sync(self._password_hasher.hash, password)
+        return await hash_async(password)
+
+    async def _verify_password(self, hash_: str, password: str) -> None:
+        verify_async = getattr(self._password_hasher, "verify_async", None)
+        if verify_async is None:
+            await anyio.to_thread.run_sync(self._password_hasher.verify, hash_, password)
+            return
+        await verify_async(hash_, password)
+
+    async def _is_password_hash_is_invalid(
             self,
             admin: AbstractAdmin,
             password: str
     ) -> bool:
         try:
-            self._password_hasher.verify(admin.password, password)
+            await self._verify_password(admin.password, password)
         except HashVerifyFailedError:
             return True
 
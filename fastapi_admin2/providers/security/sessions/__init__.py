@@ -0,0 +1,6 @@
+from .in_memory import InMemorySessionStore
+from .protocol import SessionStoreProto
+from .redis import RedisSessionStore
+from .signed_cookie import SignedCookieSessionStore
+
+__all__ = ('SessionStoreProto', 'RedisSessionStore', 'SignedCookieSessionStore', 'InMemorySessionStore')
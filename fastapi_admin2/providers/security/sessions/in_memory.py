@@ -0,0 +1,40 @@
+import time
+import uuid
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi_admin2.providers.security.sessions.protocol import SessionStoreProto, AdminId
+
+
+class InMemorySessionStore(SessionStoreProto):
+    """
+    Sessions are kept in memory of the process, so it fits only tests and setups with a single worker
+    """
+
+    def __init__(self, timer: Callable[[], float] = time.monotonic) -> None:
+        self._timer = timer
+        # session id -> id of admin and time, when session expires
+        self._sessions: Dict[str, Tuple[str, float]] = {}
+
+    async def create_session(self, admin_id: AdminId, expires_in_seconds: int) -> str:
+        self._delete_expired_sessions()
+        session_id = uuid.uuid4().hex
+        self._sessions[session_id] = (str(admin_id), self._timer() + expires_in_seconds)
+        return session_id
+
+    async def get_admin_id(self, session_id: str) -> Optional[str]:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        admin_id, expires_at = session
+        if expires_at <= self._timer():
+            del self._sessions[session_id]
+            return None
+        return admin_id
+
+    async def delete_session(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    def _delete_expired_sessions(self) -> None:
+        now = self._timer()
+        for session_id in [s for s, (_, expires_at) in self._sessions.items() if expires_at <= now]:
+            del self._sessions[session_id]
@@ -0,0 +1,19 @@
+from typing import Optional, Protocol, Union
+
+AdminId = Union[int, str]
+
+
+class SessionStoreProto(Protocol):
+
+    async def create_session(self, admin_id: AdminId, expires_in_seconds: int) -> str:
+        """
+        Create session of the admin.
+        It returns value of session cookie, which is passed to other methods as `session_id`
+        """
+
+    async def get_admin_id(self, session_id: str) -> Optional[str]:
+        """
+        Returns id of the admin, which session belongs to, or None if session doesn't exist, expired or revoked
+        """
+
+    async def delete_session(self, session_id: str) -> None: ...
@@ -0,0 +1,31 @@
+import uuid
+from typing import Optional
+
+from aioredis import Redis
+
+from fastapi_admin2.providers.security.sessions.protocol import SessionStoreProto, AdminId
+
+SESSION_ID_KEY = "user_session:{session_id}"
+
+
+class RedisSessionStore(SessionStoreProto):
+    """
+    Sessions are shared between workers through redis, so every authentication costs a round trip to it
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self._redis = redis
+
+    async def create_session(self, admin_id: AdminId, expires_in_seconds: int) -> str:
+        session_id = uuid.uuid4().hex
+        await self._redis.set(SESSION_ID_KEY.format(session_id=session_id), admin_id, ex=expires_in_seconds)
+        return session_id
+
+    async def get_admin_id(self, session_id: str) -> Optional[str]:
+        admin_id = await self._redis.get(SESSION_ID_KEY.format(session_id=session_id))
+        if isinstance(admin_id, bytes):
+            return admin_id.decode()
+        return admin_id
+
+    async def delete_session(self, session_id: str) -> None:
+        await self._redis.delete(SESSION_ID_KEY.format(session_id=session_id))
@@ -0,0 +1,118 @@
+import base64
+import binascii
+import hmac
+import secrets
+import time
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from aioredis import Redis
+
+from fastapi_admin2.providers.security.sessions.protocol import SessionStoreProto, AdminId
+
+REVOKED_SESSION_KEY = "revoked_user_session:{nonce}"
+SEPARATOR = "."
+
+
+class SignedCookieSessionStore(SessionStoreProto):
+    """
+    Session is kept in the cookie itself: id of admin, expiration time and random nonce are signed with HMAC,
+    so authentication doesn't need any storage.
+
+    Such sessions can't be deleted before expiration, so they're revoked by nonce instead.
+    Revoked sessions are kept in redis, if it's passed, so all workers see them, otherwise in memory of the process.
+    Only sessions revoked by logout are looked up there, so revocation list stays small.
+    """
+
+    def __init__(
+            self,
+            secret_key: Union[str, bytes],
+            redis: Optional[Redis] = None,
+            digest: str = "sha256",
+            timer: Callable[[], float] = time.time
+    ) -> None:
+        if isinstance(secret_key, str):
+            secret_key = secret_key.encode()
+        if not secret_key:
+            raise ValueError("Secret key must not be empty")
+        self._secret_key = secret_key
+        self._redis = redis
+        self._digest = digest
+        self._timer = timer
+        # nonce -> time, when session expires, it's used only if redis isn't passed
+        self._revoked_nonces: Dict[str, float] = {}
+
+    async def create_session(self, admin_id: AdminId, expires_in_seconds: int) -> str:
+        expires_at = int(self._timer()) + expires_in_seconds
+        payload = SEPARATOR.join([_encode(str(admin_id)), str(expires_at), secrets.token_urlsafe(16)])
+        return payload + SEPARATOR + self._sign(payload)
+
+    async def get_admin_id(self, session_id: str) -> Optional[str]:
+        session = self._load(session_id)
+        if session is None:
+            return None
+        admin_id, expires_at, nonce = session
+        if await self._is_revoked(nonce):
+            return None
+        return admin_id
+
+    async def delete_session(self, session_id: str) -> None:
+        session = self._load(session_id)
+        if session is None:
+            return
+        _, expires_at, nonce = session
+        # revocation is kept only until session expires by itself
+        expires_in_seconds = max(int(expires_at - self._timer()), 1)
+        if self._redis is not None:
+            await self._redis.set(REVOKED_SESSION_KEY.format(nonce=nonce), 1, ex=expires_in_seconds)
+            return
+
+        now = self._timer()
+        for revoked_nonce in [n for n, exp in self._revoked_nonces.items() if exp <= now]:
+            del self._revoked_nonces[revoked_nonce]
+        self._revoked_nonces[nonce] = expires_at
+
+    def _load(self, session_id: str) -> Optional[Tuple[str, int, str]]:
+        try:
+            encoded_admin_id, expires_at, nonce, signature = session_id.split(SEPARATOR)
+        except ValueError:
+            return None
+
+        payload = SEPARATOR.join([encoded_admin_id, expires_at, nonce])
+        # cookie can contain any characters, but strings are compared by compare_digest only if they're ascii
+        if not hmac.compare_digest(signature.encode(), self._sign(payload).encode()):
+            return None
+
+        try:
+            admin_id = _decode(encoded_admin_id)
+            expires_at = int(expires_at)
+        except ValueError:
+            return None
+        if expires_at <= self._timer():
+            return None
+        return admin_id, expires_at, nonce
+
+    async def _is_revoked(self, nonce: str) -> bool:
+        if self._redis is not None:
+            return bool(await self._redis.exists(REVOKED_SESSION_KEY.format(nonce=nonce)))
+
+        expires_at = self._revoked_nonces.get(nonce)
+        return expires_at is not None and expires_at > self._timer()
+
+    def _sign(self, payload: str) -> str:
+        signature = hmac.new(self._secret_key, payload.encode(), self._digest).digest()
+        return _encode_bytes(signature)
+
+
+def _encode(value: str) -> str:
+    return _encode_bytes(value.encode())
+
+
+def _encode_bytes(value: bytes) -> str:
+    return base64.urlsafe_b64encode(value).rstrip(b"=").decode()
+
+
+def _decode(value: str) -> str:
+    try:
+        return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as ex:
+        raise ValueError(ex)
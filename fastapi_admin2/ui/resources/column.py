@@ -1,4 +1,4 @@
-from typing import Optional, Mapping, Any
+from typing import Optional, Mapping, Any, Sequence
 
 from starlette.requests import Request
 
@@ -34,5 +34,18 @@ class Field:
 
 
 class ComputedField(Field):
+    def __init__(
+            self,
+            name: str,
+            label: Optional[str] = None,
+            display: Optional[displays.Display] = None,
+            input_: Optional[Input] = None,
+            depends_on: Sequence[str] = ()
+    ):
+        super().__init__(name, label, display, input_)
+        # names of model columns, which are required to compute value of the field,
+        # they are loaded on list page along with columns of displayed fields
+        self.depends_on = depends_on
+
     async def get_value(self, request: Request, obj: Mapping[str, Any]) -> Optional[Any]:
         return obj.get(self.name)
@@ -1,12 +1,14 @@
 import abc
 import asyncio
 from dataclasses import dataclass
-from typing import Type, Any, List, Union, Optional, TypeVar, Dict, Sequence, Hashable, Generic, Iterable
+from types import MappingProxyType
+from typing import Type, Any, List, Union, Optional, TypeVar, Dict, Sequence, Hashable, Generic, Iterable, \
+    Mapping, Tuple
 
 from starlette.datastructures import FormData
 from starlette.requests import Request
 
-from fastapi_admin2.enums import HTTPMethod
+from fastapi_admin2.enums import HTTPMethod, CountStrategy
 from fastapi_admin2.exceptions import FieldNotFoundError
 from fastapi_admin2.ui.resources.action import ToolbarAction, Action
 from fastapi_admin2.ui.resources.base import Resource
@@ -51,8 +53,30 @@ class FieldSpec:
     field_name: Optional[str] = None
 
 
+# allowance for non-file fields and multipart boundaries, when limit of form is computed from sizes of files
+MAX_SIZE_OF_FORM_FIELDS = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ModelResourceSpec:
+    """
+    Fields, filters and converters of model resource, that don't depend on request,
+    so they are scaffolded once per resource class and shared among all its instances
+    """
+    converters: Mapping[Hashable, ColumnToFieldConverter[Any]]
+    filters: Tuple[AbstractFilter, ...]
+    display_fields: Tuple[Field, ...]
+    input_fields: Tuple[Field, ...]
+    field_names: Tuple[str, ...]
+    field_labels: Tuple[str, ...]
+    # max size of body of create/update form, None if it's not limited by the resource
+    max_upload_size: Optional[int]
+
+
 class AbstractModelResource(Resource, abc.ABC):
     model: Type[Any]
+    # name of the resource in urls, lowercased name of model class is used by default
+    slug: Optional[str] = None
     fields: Sequence[Union[str, Field]] = ()
     page_pre_title: Optional[str] = None
     page_title: Optional[str] = None
@@ -71,14 +95,46 @@ class AbstractModelResource(Resource, abc.ABC):
     converters: Dict[Hashable, ColumnToFieldConverter[Any]] = {}
 
     paginator: Any = object()
+    page_size: int = 10
+
+    # Opt-in loading of only columns of displayed fields(plus primary key and `ComputedField.depends_on` columns)
+    # on list page. Don't enable it if hooks like `generate_row_attributes` access other columns.
+    # Projection is skipped anyway if some computed field doesn't declare columns it depends on
+    load_only_displayed_columns: bool = False
+
+    # relationships, that are loaded along with rows of list page to avoid N+1 lazy loads,
+    # nested relationships are separated by dot(e.g. "customer.address")
+    # `prefetch` loads every relationship by separate query for the whole page(selectinload/prefetch_related)
+    prefetch: Sequence[str] = ()
+    # `eager_load` loads relationships in the same query using JOIN(joinedload/select_related)
+    eager_load: Sequence[str] = ()
+
+    count_strategy: CountStrategy = CountStrategy.EXACT
+    # used only with CountStrategy.CAPPED
+    count_cap: int = 10_000
+
+    # count of rows, that are fetched from database and serialized at once during export
+    export_chunk_size: int = 1000
+    # count of rows of imported file, that are inserted to database by one multi-row INSERT
+    import_batch_size: int = 500
+
+    # count of entries, that are deleted by one DELETE statement during bulk deletion
+    bulk_delete_chunk_size: int = 1000
+    # delete all chunks in one transaction, otherwise every chunk is committed separately,
+    # so locks are held only during deletion of one chunk
+    bulk_delete_in_single_transaction: bool = False
+
+    # max size of body of create, update and import requests in bytes, larger requests are rejected before parsing.
+    # If it isn't specified, limit of forms is sum of `max_size` of all file inputs
+    max_upload_size: Optional[int] = None
 
     def __init__(self) -> None:
-        self._converters: Dict[Hashable, ColumnToFieldConverter[Any]] = {}
-
-        self._normalized_filters = self._scaffold_filters()
-        self.input_fields = self._scaffold_model_fields_for_input()
-        self.display_fields = self._scaffold_model_fields_for_display()
-        self._field_names = self.get_field_names()
+        spec = self.get_spec()
+        self._converters = spec.converters
+        self._normalized_filters = spec.filters
+        self.input_fields = spec.input_fields
+        self.display_fields = spec.display_fields
+        self._field_names = spec.field_names
 
     def __init_subclass__(cls, **kwargs: Any):
         super().__init_subclass__(**kwargs)
@@ -87,6 +143,49 @@ class AbstractModelResource(Resource, abc.ABC):
                 "`_default_filter` must be specified in subclasses of AbstractModelResource"
             )
 
+    @classmethod
+    def get_slug(cls) -> str:
+        return (cls.slug or cls.model.__name__).lower()
+
+    @classmethod
+    def get_spec(cls) -> ModelResourceSpec:
+        """
+        Return spec of the resource class, it's built on registration of resource or on first access.
+        Spec is looked up in class dict, so subclasses don't share spec of parent resource.
+
+        :return:
+        """
+        spec = cls.__dict__.get("_spec")
+        if spec is None:
+            spec = cls._build_spec()
+            cls._spec = spec
+        return spec
+
+    @classmethod
+    def _build_spec(cls) -> ModelResourceSpec:
+        converters = MappingProxyType({**cls._get_default_converters(), **cls.converters})
+        display_fields = tuple(cls._scaffold_model_fields_for_display(converters))
+        input_fields = tuple(cls._scaffold_model_fields_for_input(display_fields))
+        return ModelResourceSpec(
+            converters=converters,
+            filters=tuple(cls._scaffold_filters()),
+            display_fields=display_fields,
+            input_fields=input_fields,
+            field_names=tuple(field.name for field in display_fields),
+            field_labels=tuple(field.label for field in display_fields),
+            max_upload_size=cls._get_max_upload_size(input_fields)
+        )
+
+    @classmethod
+    def _get_max_upload_size(cls, input_fields: Sequence[Field]) -> Optional[int]:
+        if cls.max_upload_size is not None:
+            return cls.max_upload_size
+
+        file_inputs = [field.input for field in input_fields if isinstance(field.input, inputs.File)]
+        if not file_inputs or any(file_input.max_size is None for file_input in file_inputs):
+            return None
+        return sum(file_input.max_size for file_input in file_inputs) + MAX_SIZE_OF_FORM_FIELDS
+
     @classmethod
     async def from_http_request(cls, request: Request) -> "AbstractModelResource":
         model_resource = cls()
@@ -137,20 +236,50 @@ class AbstractModelResource(Resource, abc.ABC):
         return result
 
     async def _assemble_rows_list(self, orm_models: Sequence[Any], request: Request) -> List[List[str]]:
+        if not self.display_fields:
+            return [[] for _ in orm_models]
+
+        # values are rendered column by column, so each display renders all of its values in one call
+        rendered_columns = []
+        for field in self.display_fields:
+            if isinstance(field, ComputedField):
+                column_values = [await field.get_value(request, obj) for obj in orm_models]
+            else:
+                column_values = [getattr(obj, field.name, None) for obj in orm_models]
+            rendered_columns.append(await field.display.render_column(request, column_values))
+
+        return [list(row) for row in zip(*rendered_columns)]
+
+    async def export_rows(self, orm_models: Sequence[Any], request: Request, raw: bool = False) -> List[List[Any]]:
+        """
+        Serialize rows for export either through displays of fields(like on list page) or as raw values
+
+        :param orm_models:
+        :param request:
+        :param raw: export raw values of fields without rendering them by displays
+        :return:
+        """
+        if not raw:
+            return await self._assemble_rows_list(orm_models, request)
+
         result = []
         for orm_model_instance in orm_models:
             row = []
             for field in self.display_fields:
                 if isinstance(field, ComputedField):
-                    field_value = await field.get_value(request, orm_model_instance)
+                    row.append(await field.get_value(request, orm_model_instance))
                 else:
-                    field_value = getattr(orm_model_instance, field.name, None)
-
-                row.append(await field.display.render(request, field_value))
-
+                    row.append(getattr(orm_model_instance, field.name, None))
             result.append(row)
         return result
 
+    @classmethod
+    def get_foreign_key_input(cls, name: str) -> inputs.BaseForeignKeyInput:
+        for field in cls.get_spec().input_fields:
+            if field.name == name and isinstance(field.input, inputs.BaseForeignKeyInput):
+                return field.input
+        raise FieldNotFoundError(f"Field {name} of related entity isn't found")
+
     async def render_inputs(self, request: Request, obj: Optional[Any] = None) -> List[str]:
         rendered_inputs: List[str] = []
 
@@ -173,15 +302,39 @@ class AbstractModelResource(Resource, abc.ABC):
             rendered_filters.append(await filter_.render(request))
         return rendered_filters
 
+    def should_load_only_displayed_columns(self) -> bool:
+        """
+        Return whether list page can be loaded with only columns returned by `get_list_column_names`
+        """
+        if not self.load_only_displayed_columns:
+            return False
+        return all(field.depends_on for field in self.display_fields if isinstance(field, ComputedField))
+
+    def get_list_column_names(self) -> List[str]:
+        """
+        Return names of fields, which values are required to render list page
+        """
+        column_names: List[str] = []
+        for field in self.display_fields:
+            if isinstance(field, ComputedField):
+                column_names.extend(field.depends_on)
+            else:
+                column_names.append(field.name)
+        return column_names
+
     def get_field_labels(self, display: bool = True) -> List[str]:
+        if display:
+            return list(self.get_spec().field_labels)
         return self._get_fields_attr("label", display)
 
     def get_field_names(self, display: bool = True) -> List[str]:
+        if display:
+            return list(self.get_spec().field_names)
         return self._get_fields_attr("name", display)
 
     def _get_fields_attr(self, attr: str, display: bool = True) -> List[Any]:
         some_field_attribute_values = []
-        for field in self._scaffold_model_fields_for_display():
+        for field in self.get_spec().display_fields:
             if display and isinstance(field.display, displays.InputOnly):
                 continue
             some_field_attribute_values.append(getattr(field, attr))
@@ -205,6 +358,14 @@ class AbstractModelResource(Resource, abc.ABC):
                 method=HTTPMethod.GET,
                 ajax=False,
                 class_="btn-dark",
+            ),
+            ToolbarAction(
+                label=request.state.gettext("export"),
+                icon="fas fa-file-export",
+                name="export",
+                method=HTTPMethod.GET,
+                ajax=False,
+                class_="btn-outline-dark",
             )
         ]
 
@@ -235,7 +396,9 @@ class AbstractModelResource(Resource, abc.ABC):
             ),
         ]
 
-    def _create_field_by_field_name(self, field_name: str) -> Field:
+    @classmethod
+    def _create_field_by_field_name(cls, field_name: str,
+                                    converters: Mapping[Hashable, ColumnToFieldConverter[Any]]) -> Field:
         """
         Create field if you have passed on string to fields
         and rely only on built-in recognition of field type
@@ -248,48 +411,107 @@ class AbstractModelResource(Resource, abc.ABC):
         In this case, fields would be transformed to appropriate field inputs and displays automaticly
 
         :param field_name:
+        :param converters:
         :return:
         """
-        column = self._get_column_by_name(field_name)
+        column = cls._get_column_by_name(field_name)
         if not column:
-            raise FieldNotFoundError(f"Can't found field '{field_name}' in model {self.model}")
-
+            raise FieldNotFoundError(f"Can't found field '{field_name}' in model {cls.model}")
 
         try:
-            converter = self._converters[column]
+            converter = converters[column]
         except KeyError:
-            return self._convert_column_for_which_no_converter_found(column, field_name)
+            return cls._convert_column_for_which_no_converter_found(column, field_name)
 
         return converter.convert(column, field_name)
 
+    @classmethod
     @abc.abstractmethod
-    def _get_column_by_name(self, name: str) -> Any:
+    def _get_default_converters(cls) -> Dict[Hashable, ColumnToFieldConverter[Any]]:
         pass
 
+    @classmethod
     @abc.abstractmethod
-    def _convert_column_for_which_no_converter_found(self, column: Any, field_name: str) -> Field:
+    def _get_column_by_name(cls, name: str) -> Any:
+        pass
+
+    @classmethod
+    @abc.abstractmethod
+    def _convert_column_for_which_no_converter_found(cls, column: Any, field_name: str) -> Field:
         pass
 
     @abc.abstractmethod
     async def enrich_select_with_filters(self, request: Request, model: Any, query: Q) -> Q:
         pass
 
+    @abc.abstractmethod
+    def apply_list_projection(self, query: Q) -> Q:
+        """
+        Restrict columns, that are loaded by list query, to the ones returned by `get_list_column_names`
+        """
+
+    @abc.abstractmethod
+    def apply_eager_loading(self, query: Q, streamed: bool = False) -> Q:
+        """
+        Load relationships declared in `prefetch` and `eager_load` along with rows of list page
+
+        :param streamed: rows are fetched by chunks(e.g. during export) instead of all at once
+        """
+
     @abc.abstractmethod
     async def resolve_form_data(self, data: FormData):
         pass
 
-    def _scaffold_model_fields_for_input(self) -> List[Field]:
-        fields_for_display = self._scaffold_model_fields_for_display()
+    async def parse_row(self, row: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Convert row of imported file to values of model columns through inputs of fields,
+        like it's done with submitted create form.
+        Many-to-many relations can't be imported, files are expected to be already uploaded(as links).
+
+        :param row: mapping of field names to raw values of imported row
+        :raises ValueError: if value can't be parsed or doesn't pass validators of input
+        :return:
+        """
+        values: Dict[str, Any] = {}
+        for field in self.input_fields:
+            input_ = field.input
+            if input_.context.get("disabled") or isinstance(input_, (inputs.DisplayOnly, inputs.BaseManyToManyInput)):
+                continue
+
+            name = input_.context.get("name", field.name)
+            if row.get(name) is None:
+                continue
+
+            if isinstance(input_, inputs.File):
+                value = row[name]
+            else:
+                value = await input_.parse(row[name])
+            if value is None:
+                continue
+
+            for validator in input_.validators:
+                if not validator(value):
+                    raise ValueError(f"Value `{value}` of field `{name}` is not valid")
+            values[name] = value
+        return values
+
+    @classmethod
+    def _scaffold_model_fields_for_input(cls, fields_for_display: Sequence[Field]) -> List[Field]:
         return [
             f for f in fields_for_display
             if not isinstance(f, ComputedField) and not isinstance(f.display, inputs.DisplayOnly)
         ]
 
+    @classmethod
     @abc.abstractmethod
-    def _scaffold_model_fields_for_display(self) -> List[Field]:
+    def _scaffold_model_fields_for_display(
+            cls,
+            converters: Mapping[Hashable, ColumnToFieldConverter[Any]]
+    ) -> List[Field]:
         pass
 
-    def _scaffold_filters(self) -> Sequence[AbstractFilter]:
+    @classmethod
+    def _scaffold_filters(cls) -> Sequence[AbstractFilter]:
         """
         Iterate filters and convert string filters(by default it means searching by some column with operator ilike)
         to _default_filter(which should be set in ORM dialect)
@@ -297,8 +519,8 @@ class AbstractModelResource(Resource, abc.ABC):
         :return:
         """
         filters: List[AbstractFilter] = []
-        for filter_ in self.filters:
+        for filter_ in cls.filters:
             if isinstance(filter_, str):
-                filter_ = self._default_filter(name=filter_, label=filter_.title())
+                filter_ = cls._default_filter(name=filter_, label=filter_.title())
             filters.append(filter_)
         return filters
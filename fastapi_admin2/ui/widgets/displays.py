@@ -1,6 +1,6 @@
 import json
 from datetime import datetime
-from typing import Optional, Any, Callable
+from typing import Optional, Any, Callable, Sequence, List, Tuple
 
 from starlette.requests import Request
 
@@ -13,18 +13,51 @@ class Display(Widget):
     Parent class for all display widgets
     """
 
+    def format_value(self, value: Any) -> Any:
+        """
+        Convert value of the field before it's passed to the template(or returned as is, if there is no template)
+
+        :param value:
+        :return:
+        """
+        return value
+
+    async def render(self, request: Request, value: Any) -> str:
+        return await super().render(request, self.format_value(value))
+
+    async def render_column(self, request: Request, values: Sequence[Any]) -> List[str]:
+        """
+        Render all values of the column at once.
+        Displays without template are rendered synchronously, templated ones by one render of template per column.
+
+        :param request:
+        :param values:
+        :return:
+        """
+        if type(self).render is not Display.render:
+            # subclass customizes rendering of separate value, so it can't be rendered column-wise
+            return [await self.render(request, value) for value in values]
+
+        formatted_values = ["" if v is None else v for v in map(self.format_value, values)]
+        if not self.template_name:
+            return formatted_values
+
+        return await request.state.render_jinja_column(
+            self.template_name,
+            formatted_values,
+            context=dict(current_locale=request.state.current_locale, **self.context)
+        )
+
 
 class DatetimeDisplay(Display):
     def __init__(self, format_: str = DATETIME_FORMAT):
         super().__init__()
         self.format_ = format_
 
-    async def render(self, request: Request, value: datetime) -> str:
-        timestamp = value
-        if value is not None:
-            timestamp = value.strftime(self.format_)
-
-        return await super(DatetimeDisplay, self).render(request, timestamp)
+    def format_value(self, value: Optional[datetime]) -> Optional[str]:
+        if value is None:
+            return None
+        return value.strftime(self.format_)
 
 
 class DateDisplay(DatetimeDisplay):
@@ -45,8 +78,19 @@ class Boolean(Display):
 class Image(Display):
     template_name = "widgets/displays/image.html"
 
-    def __init__(self, width: Optional[str] = None, height: Optional[str] = None):
-        super().__init__(width=width, height=height)
+    def __init__(self, width: Optional[str] = None, height: Optional[str] = None,
+                 thumbnail_size: Optional[Tuple[int, int]] = None):
+        """
+        :param thumbnail_size: size of thumbnail generated by `ThumbnailingFileManager`, which is shown instead of
+                               the original image, original is shown until thumbnail is generated.
+                               Url of thumbnail is built in template by `thumbnail` filter
+        """
+        super().__init__(width=width, height=height, thumbnail_size=thumbnail_size)
+
+    def format_value(self, value: Any) -> Optional[str]:
+        if not value:
+            return None
+        return str(value)
 
 
 class Json(Display):
@@ -56,8 +100,8 @@ class Json(Display):
         super().__init__(**context)
         self._dumper = dumper
 
-    async def render(self, request: Request, value: dict):
-        return await super(Json, self).render(request, self._dumper(value))
+    def format_value(self, value: Any) -> str:
+        return self._dumper(value)
 
 
 class EnumDisplay(Display):
@@ -1,12 +1,15 @@
 import abc
 import json
+from dataclasses import dataclass
 from enum import Enum as EnumCLS
-from typing import Any, List, Optional, Tuple, Type, Callable
+from typing import Any, List, Optional, Tuple, Type, Callable, Sequence
 
+from fastapi.encoders import jsonable_encoder
 from starlette.datastructures import UploadFile
 from starlette.requests import Request
 
 from fastapi_admin2.default_settings import DATE_FORMAT_FLATPICKR
+from fastapi_admin2.utils.cache import TTLCache
 from fastapi_admin2.utils.files import FileManager
 from fastapi_admin2.ui.widgets import Widget
 
@@ -95,12 +98,39 @@ class Select(Input):
         """
 
     async def render(self, request: Request, value: Any) -> str:
+        if value is None:
+            value = self.default
+        if value is None:
+            value = ""
+
         options = await self.get_options()
-        self.context.update(options=options)
-        return await super(Select, self).render(request, value)
+        # input is shared among requests, so options are passed to template without storing them in context
+        return await request.state.render_jinja(
+            self.template_name,
+            context=dict(
+                value=value,
+                current_locale=request.state.current_locale,
+                **self.context,
+                options=options
+            )
+        )
+
+
+@dataclass(frozen=True)
+class OptionsPage:
+    # label and value of every option
+    options: List[Tuple[str, Any]]
+    has_more: bool
 
 
 class BaseForeignKeyInput(Select, abc.ABC):
+    """
+    Input of related entity. Related table may be huge, so only selected options are rendered,
+    others are searched by label on demand through autocomplete endpoint and cached for a short time.
+    """
+    template_name = "widgets/inputs/foreign_key.html"
+    multiple = False
+
     def __init__(
             self,
             model: Any,
@@ -108,13 +138,96 @@ class BaseForeignKeyInput(Select, abc.ABC):
             null: bool = False,
             disabled: bool = False,
             help_text: Optional[str] = None,
+            search_fields: Sequence[str] = (),
+            options_page_size: int = 20,
+            options_cache_ttl_in_seconds: float = 30,
+            options_cache_size: int = 256,
     ):
+        """
+        :param search_fields: fields of related model, which are searched by prefix of the query,
+                              the first string field is searched by default
+        :param options_page_size: count of options loaded at once
+        :param options_cache_ttl_in_seconds: how long found options are cached
+        """
         super().__init__(help_text=help_text, default=default, null=null, disabled=disabled)
         self.model = model
+        self.search_fields = tuple(search_fields)
+        self.options_page_size = options_page_size
+        # (query, limit, offset) -> page of options, so hot queries(e.g. empty one on focus) don't hit database
+        self._options_cache: TTLCache[Tuple[str, int, int], OptionsPage] = TTLCache(
+            maxsize=options_cache_size, ttl=options_cache_ttl_in_seconds
+        )
+
+    @abc.abstractmethod
+    async def search_options(self, request: Request, query: str, limit: int, offset: int) -> OptionsPage:
+        """
+        Find related entities, which search fields start with query(case-insensitive)
+
+        :param request:
+        :param query:
+        :param limit: max count of options in the page
+        :param offset:
+        :return:
+        """
+
+    @abc.abstractmethod
+    async def get_selected_options(self, request: Request, value: Any) -> List[Tuple[str, Any]]:
+        """
+        Return options of entities, that are selected in the field of the edited entity
+
+        :param request:
+        :param value: value of the field(e.g. related entity, its primary key or collection of them)
+        :return:
+        """
+
+    async def get_options_page(self, request: Request, query: str, limit: int, offset: int) -> OptionsPage:
+        key = (query, limit, offset)
+        page = self._options_cache.get(key)
+        if page is None:
+            page = await self.search_options(request, query, limit, offset)
+            self._options_cache.set(key, page)
+        return page
+
+    async def get_options(self) -> List[Tuple[Any, ...]]:
+        # options are loaded on demand, see `search_options`
+        if self.context.get("null"):
+            return [("", "")]
+        return []
+
+    async def render(self, request: Request, value: Any) -> str:
+        if value is None:
+            value = self.default
+
+        selected_options = await self.get_selected_options(request, value) if value is not None else []
+        options = [dict(label=label, value=v, selected=True) for label, v in jsonable_encoder(selected_options)]
+        if self.context.get("null") and not self.multiple:
+            options.insert(0, dict(label="", value="", selected=not selected_options))
+
+        # input is shared among requests, so context of the request isn't stored in it
+        return await request.state.render_jinja(
+            self.template_name,
+            context=dict(
+                value=value,
+                current_locale=request.state.current_locale,
+                **self.context,
+                options=options,
+                multiple=self.multiple,
+                autocomplete_url=_get_autocomplete_url(request, self.context.get("name")),
+                options_page_size=self.options_page_size
+            )
+        )
 
 
 class BaseManyToManyInput(BaseForeignKeyInput, abc.ABC):
     template_name = "widgets/inputs/many_to_many.html"
+    multiple = True
+
+
+def _get_autocomplete_url(request: Request, field_name: Optional[str]) -> Optional[str]:
+    resource = request.path_params.get("resource") or request.path_params.get("resource_name")
+    if resource is None or field_name is None:
+        return None
+    return request.url_for("autocomplete_options", resource=resource, field=field_name)
 
 
 class Enum(Select):
@@ -236,7 +349,12 @@ class File(Input):
             null: bool = False,
             disabled: bool = False,
             help_text: Optional[str] = None,
+            max_size: Optional[int] = None,
     ):
+        """
+        :param max_size: max size of uploaded file in bytes, forms with larger files are rejected
+                         before they're parsed, see `AbstractModelResource.max_upload_size`
+        """
         super().__init__(
             null=null,
             default=default,
@@ -245,6 +363,7 @@ class File(Input):
             help_text=help_text,
         )
         self._file_manager = file_manager
+        self.max_size = max_size
 
     async def parse(self, value: Optional[UploadFile]):
         if value and value.filename:
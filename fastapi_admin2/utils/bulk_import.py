@@ -0,0 +1,147 @@
+import codecs
+import csv
+import itertools
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Mapping, Optional
+
+import anyio
+from starlette.datastructures import UploadFile
+
+from fastapi_admin2.entities import ImportBatchReport, ImportReport, ImportRowError
+from fastapi_admin2.enums import DataFormat
+from fastapi_admin2.exceptions import DatabaseError
+
+BulkInserter = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class ReadRow:
+    """
+    Row of imported file, that is already decoded from csv/json
+    """
+    # 1-based number of the row in the file
+    number: int
+    values: Mapping[str, Any]
+    # row can't be decoded, it's reported as error of the row instead of aborting import
+    error: Optional[str] = None
+
+
+async def read_batches(file: UploadFile, import_format: DataFormat,
+                       batch_size: int) -> AsyncIterator[List[ReadRow]]:
+    """
+    Read uploaded file incrementally, so only one batch of rows is kept in memory at the moment.
+    Reading is done in worker thread, because uploaded file could be rolled over to the disk.
+
+    :param file:
+    :param import_format:
+    :param batch_size:
+    :return: batches of rows numbered from 1
+    """
+    lines = codecs.getreader("utf-8-sig")(file.file)
+    if import_format == DataFormat.CSV:
+        rows = _stop_on_unreadable_row(_read_csv_rows(lines))
+    else:
+        rows = _stop_on_unreadable_row(_read_ndjson_rows(lines))
+
+    while True:
+        batch = await anyio.to_thread.run_sync(_take, rows, batch_size)
+        if not batch:
+            return
+        yield batch
+
+
+async def import_rows(batches: AsyncIterator[List[ReadRow]],
+                      parse_row: Callable[[Mapping[str, Any]], Awaitable[Dict[str, Any]]],
+                      insert_rows: BulkInserter) -> ImportReport:
+    """
+    Parse every row of batch and insert valid ones at once.
+    Invalid rows are skipped and reported, failure of insert is reported for the whole batch.
+
+    :param batches:
+    :param parse_row: function, that validates row and converts it to values of model columns
+    :param insert_rows: function, that inserts batch of rows by one statement in its own transaction
+    :return:
+    """
+    report = ImportReport()
+    started_at = time.perf_counter()
+
+    batch_number = 0
+    async for batch in batches:
+        batch_number += 1
+        batch_report = ImportBatchReport(batch_number=batch_number)
+        batch_started_at = time.perf_counter()
+
+        parsed_rows: List[Dict[str, Any]] = []
+        for row in batch:
+            if row.error is not None:
+                batch_report.errors.append(ImportRowError(row.number, row.error))
+                continue
+            try:
+                parsed_rows.append(await parse_row(row.values))
+            except (ValueError, TypeError, KeyError) as ex:
+                batch_report.errors.append(ImportRowError(row.number, str(ex)))
+
+        if parsed_rows:
+            try:
+                await insert_rows(parsed_rows)
+                batch_report.inserted_count = len(parsed_rows)
+            except DatabaseError as ex:
+                batch_report.errors.append(ImportRowError(None, str(ex)))
+
+        batch_report.elapsed_seconds = time.perf_counter() - batch_started_at
+        batch_report.rows_per_second = _get_throughput(batch_report.inserted_count, batch_report.elapsed_seconds)
+
+        report.batches.append(batch_report)
+        report.inserted_count += batch_report.inserted_count
+        report.errors_count += len(batch_report.errors)
+
+    report.elapsed_seconds = time.perf_counter() - started_at
+    report.rows_per_second = _get_throughput(report.inserted_count, report.elapsed_seconds)
+    return report
+
+
+def _read_csv_rows(lines: Iterator[str]) -> Iterator[ReadRow]:
+    for row_number, row in enumerate(csv.DictReader(lines), start=1):
+        # csv can't distinguish empty string from missing value, so empty cells are treated as missing
+        yield ReadRow(row_number, {k: v for k, v in row.items() if v != ""})
+
+
+def _read_ndjson_rows(lines: Iterator[str]) -> Iterator[ReadRow]:
+    for row_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as ex:
+            yield ReadRow(row_number, {}, error=f"Invalid json: {ex}")
+            continue
+        if not isinstance(row, dict):
+            yield ReadRow(row_number, {}, error="Row must be a json object")
+            continue
+        yield ReadRow(row_number, row)
+
+
+def _stop_on_unreadable_row(rows: Iterator[ReadRow]) -> Iterator[ReadRow]:
+    """
+    Report failure of decoding or parsing of the file(e.g. it isn't utf-8 or csv) as error of the row,
+    on which it has occurred. Reader can't recover after such failure, so the rest of the file is skipped
+    """
+    last_row_number = 0
+    try:
+        for row in rows:
+            last_row_number = row.number
+            yield row
+    except (UnicodeDecodeError, csv.Error) as ex:
+        yield ReadRow(last_row_number + 1, {}, error=f"File can't be read starting from this row: {ex}")
+
+
+def _take(rows: Iterator[ReadRow], count: int) -> List[ReadRow]:
+    return list(itertools.islice(rows, count))
+
+
+def _get_throughput(rows_count: int, elapsed_seconds: float) -> float:
+    if elapsed_seconds <= 0:
+        return 0.0
+    return rows_count / elapsed_seconds
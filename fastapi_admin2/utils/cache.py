@@ -0,0 +1,59 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    LRU cache, which entries also expire after `ttl` seconds since they were set.
+    It's not shared between processes, so every worker has its own copy of entries
+    """
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic) -> None:
+        if maxsize <= 0:
+            raise ValueError("Size of cache must be positive")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._timer = timer
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        try:
+            expires_at, value = self._entries[key]
+        except KeyError:
+            return None
+
+        if expires_at <= self._timer():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._entries[key] = (self._timer() + self._ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        return entry[1]
+
+    def pop_where(self, predicate: Callable[[V], bool]) -> None:
+        """
+        Remove all entries, which values match predicate
+        """
+        for key in [k for k, (_, value) in self._entries.items() if predicate(value)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
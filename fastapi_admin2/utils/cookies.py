@@ -0,0 +1,62 @@
+import http.cookies
+from datetime import datetime
+from typing import Optional, Tuple, Union
+
+from starlette.types import Send, Message
+
+Header = Tuple[bytes, bytes]
+
+
+def build_set_cookie_header(
+        key: str,
+        value: str = "",
+        max_age: Optional[int] = None,
+        expires: Optional[Union[datetime, str, int]] = None,
+        path: Optional[str] = "/",
+        domain: Optional[str] = None,
+        secure: bool = False,
+        httponly: bool = False,
+        samesite: Optional[str] = "lax",
+) -> Header:
+    """
+    Build raw `set-cookie` header the same way as `starlette.responses.Response.set_cookie` does,
+    for pure ASGI middlewares, which don't have response object to set cookie on
+    """
+    cookie: http.cookies.BaseCookie = http.cookies.SimpleCookie()
+    cookie[key] = value
+    if max_age is not None:
+        cookie[key]["max-age"] = max_age
+    if expires is not None:
+        cookie[key]["expires"] = expires
+    if path is not None:
+        cookie[key]["path"] = path
+    if domain is not None:
+        cookie[key]["domain"] = domain
+    if secure:
+        cookie[key]["secure"] = True
+    if httponly:
+        cookie[key]["httponly"] = True
+    if samesite is not None:
+        cookie[key]["samesite"] = samesite
+    return b"set-cookie", cookie.output(header="").strip().encode("latin-1")
+
+
+def build_delete_cookie_header(key: str, path: Optional[str] = "/", domain: Optional[str] = None) -> Header:
+    return build_set_cookie_header(key, max_age=0, expires=0, path=path, domain=domain)
+
+
+def send_with_headers(send: Send, *headers: Header) -> Send:
+    """
+    Wrap ASGI send callable, so headers are appended to the start of response
+
+    :param send:
+    :param headers:
+    :return:
+    """
+
+    async def send_wrapper(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            message["headers"] = [*message.get("headers", []), *headers]
+        await send(message)
+
+    return send_wrapper
@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Sequence
+
+from fastapi_admin2.enums import DataFormat
+
+EXPORT_MEDIA_TYPES = {
+    DataFormat.CSV: "text/csv",
+    DataFormat.NDJSON: "application/x-ndjson",
+}
+
+
+async def chunked(iterator: AsyncIterator[Any], chunk_size: int) -> AsyncIterator[List[Any]]:
+    chunk = []
+    async for item in iterator:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def stream_export(
+        orm_models: AsyncIterator[Any],
+        serialize_rows: Callable[[Sequence[Any]], Awaitable[List[List[Any]]]],
+        field_names: Sequence[str],
+        export_format: DataFormat,
+        chunk_size: int
+) -> AsyncIterator[str]:
+    """
+    Serialize rows chunk by chunk, so only one chunk of rows is kept in memory at the moment
+
+    :param orm_models: asynchronous iterator over rows, that are streamed from database
+    :param serialize_rows: function, that converts chunk of rows to values of exported fields
+    :param field_names: names of exported fields(header of csv or keys of json objects)
+    :param export_format:
+    :param chunk_size:
+    :return:
+    """
+    if export_format == DataFormat.CSV:
+        yield _dump_csv_rows([field_names])
+
+    async for chunk in chunked(orm_models, chunk_size):
+        rows = await serialize_rows(chunk)
+        if export_format == DataFormat.CSV:
+            yield _dump_csv_rows(rows)
+        else:
+            yield "".join(
+                json.dumps(dict(zip(field_names, row)), default=str, ensure_ascii=False) + "\n"
+                for row in rows
+            )
+
+
+def _dump_csv_rows(rows: Sequence[Sequence[Any]]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
@@ -1,9 +1,15 @@
 from .on_premise import OnPremiseFileManager
 from .base import FileManager
 from .static import StaticFilesManager
+from .content_addressed import ContentAddressedFileManager
+from .thumbnails import ThumbnailingFileManager
+from .serving import UploadsApp
 
 __all__ = (
     'StaticFilesManager',
     'FileManager',
-    'OnPremiseFileManager'
+    'OnPremiseFileManager',
+    'ContentAddressedFileManager',
+    'ThumbnailingFileManager',
+    'UploadsApp'
 )
@@ -1,6 +1,7 @@
 import abc
 import os
-from typing import NewType, Union
+import pathlib
+from typing import NewType, Optional, Union
 
 from starlette.datastructures import UploadFile
 
@@ -12,3 +13,21 @@ class FileManager(abc.ABC):
     @abc.abstractmethod
     async def download_file(self, file: UploadFile) -> Union[Link, os.PathLike]:
         pass
+
+    @property
+    def uploads_dir(self) -> Optional[pathlib.Path]:
+        """
+        Local directory, paths of saved files are relative to, None if files aren't stored on local disk
+        """
+        return None
+
+    async def startup(self) -> None:
+        """
+        Acquire long-lived resources(e.g. clients of storages), it's called on startup of application,
+        if file manager is registered with `FastAPIAdmin.register_file_manager`
+        """
+
+    async def shutdown(self) -> None:
+        """
+        Release resources acquired on startup
+        """
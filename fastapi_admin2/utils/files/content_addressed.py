@@ -0,0 +1,55 @@
+import contextlib
+import hashlib
+import os
+import pathlib
+from typing import Optional, Sequence
+
+import anyio
+from starlette.datastructures import UploadFile
+
+from fastapi_admin2.utils.files.on_premise import OnPremiseFileManager, DEFAULT_MAX_FILE_SIZE
+from fastapi_admin2.utils.files.utils import create_content_addressed_file_identifier
+
+DEFAULT_HASH_ALGORITHM = "sha256"
+
+
+class ContentAddressedFileManager(OnPremiseFileManager):
+    """
+    Store every distinct content once under its digest in sharded directories(e.g. "ab/cd/abcd...png").
+    Upload is hashed while it's streamed to temporary file, if the same content is already stored,
+    temporary file is discarded and path to existing file is returned, so re-uploads don't take space
+    and never overwrite other files with the same name.
+    """
+
+    def __init__(
+            self,
+            uploads_dir: os.PathLike,
+            allow_extensions: Optional[Sequence[str]] = None,
+            max_size: int = DEFAULT_MAX_FILE_SIZE,
+            hash_algorithm: str = DEFAULT_HASH_ALGORITHM,
+            shard_depth: int = 2,
+            shard_width: int = 2
+    ):
+        super().__init__(uploads_dir, allow_extensions=allow_extensions, max_size=max_size)
+        self._hash_algorithm = hash_algorithm
+        self._shard_depth = shard_depth
+        self._shard_width = shard_width
+
+    async def _stream_to_file(self, filename: str, file: UploadFile) -> os.PathLike:
+        hasher = hashlib.new(self._hash_algorithm)
+        async with self._open_temporary_file("upload") as (f, path_to_temporary_file):
+            await self._copy_by_chunks(file, f, on_chunk=hasher.update)
+
+        relative_path = create_content_addressed_file_identifier(
+            hasher.hexdigest(), pathlib.Path(filename).suffix,
+            shard_depth=self._shard_depth, shard_width=self._shard_width
+        )
+        path_to_file = self._uploads_dir / relative_path
+        if path_to_file.exists():
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path_to_temporary_file)
+            return path_to_file
+
+        path_to_file.parent.mkdir(parents=True, exist_ok=True)
+        await anyio.to_thread.run_sync(os.replace, path_to_temporary_file, path_to_file)
+        return path_to_file
@@ -1,14 +1,18 @@
+import contextlib
 import os
 import pathlib
-from typing import Callable, Optional, Sequence, Union
+import uuid
+from typing import AsyncIterator, Callable, Optional, Sequence, Tuple, Union
 
 import anyio
+from anyio import AsyncFile
 from starlette.datastructures import UploadFile
 
 from fastapi_admin2.exceptions import FileExtNotAllowed, FileMaxSizeLimit
 from fastapi_admin2.utils.files.base import Link, FileManager
 
 DEFAULT_MAX_FILE_SIZE = 1024 ** 3
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 class OnPremiseFileManager(FileManager):
@@ -24,32 +28,76 @@ class OnPremiseFileManager(FileManager):
         self._uploads_dir = pathlib.Path(uploads_dir)
         self._filename_generator = filename_generator
 
+    @property
+    def uploads_dir(self) -> pathlib.Path:
+        return self._uploads_dir
+
     async def download_file(self, file: UploadFile) -> Union[Link, os.PathLike]:
         if self._filename_generator:
             filename = self._filename_generator(file)
         else:
             filename = file.filename
-        content = await file.read()
-        file_size = len(content)
-        if file_size > self._max_size:
-            raise FileMaxSizeLimit(f"File size {file_size} exceeds max size {self._max_size}")
 
+        # extension is checked before reading any byte of the file
         if self._file_extension_is_not_allowed(filename):
             raise FileExtNotAllowed(f"File ext is not allowed of {self._allow_extensions}")
 
-        return await self._save_file(filename, content)  # type: ignore
+        return await self._stream_to_file(filename, file)  # type: ignore
 
-    async def _save_file(self, filename: str, content: bytes) -> os.PathLike:
+    async def save_file(self, filename: str, content: bytes) -> os.PathLike:
         """
-        Save file to upload directory / filename
+        Save content to upload directory / filename
 
         :param filename:
         :param content:
-        :return: relative path to upload directory
+        :return: path to saved file
         """
-        path_to_file = self._uploads_dir / filename
-        async with await anyio.open_file(path_to_file, "wb") as f:
+        if len(content) > self._max_size:
+            raise FileMaxSizeLimit(f"File size {len(content)} exceeds max size {self._max_size}")
+
+        async with self._open_temporary_file(filename) as (f, path_to_temporary_file):
             await f.write(content)
+        return await self._replace(path_to_temporary_file, filename)
+
+    async def _stream_to_file(self, filename: str, file: UploadFile) -> os.PathLike:
+        """
+        Copy uploaded file to upload directory / filename chunk by chunk, so only one chunk is kept in memory.
+        File is written to temporary file and renamed after all, so partially written files are never visible
+
+        :param filename:
+        :param file:
+        :return: path to saved file
+        """
+        async with self._open_temporary_file(filename) as (f, path_to_temporary_file):
+            await self._copy_by_chunks(file, f)
+        return await self._replace(path_to_temporary_file, filename)
+
+    async def _copy_by_chunks(self, file: UploadFile, f: AsyncFile,
+                              on_chunk: Optional[Callable[[bytes], None]] = None) -> None:
+        file_size = 0
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > self._max_size:
+                raise FileMaxSizeLimit(f"File size exceeds max size {self._max_size}")
+            if on_chunk is not None:
+                on_chunk(chunk)
+            await f.write(chunk)
+
+    @contextlib.asynccontextmanager
+    async def _open_temporary_file(self, filename: str) -> AsyncIterator[Tuple[AsyncFile, pathlib.Path]]:
+        # temporary file is created in the same directory, so it's renamed atomically
+        path_to_temporary_file = self._uploads_dir / f".{filename}.{uuid.uuid4().hex}.tmp"
+        try:
+            async with await anyio.open_file(path_to_temporary_file, "wb") as f:
+                yield f, path_to_temporary_file
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path_to_temporary_file)
+            raise
+
+    async def _replace(self, path_to_temporary_file: pathlib.Path, filename: str) -> os.PathLike:
+        path_to_file = self._uploads_dir / filename
+        await anyio.to_thread.run_sync(os.replace, path_to_temporary_file, path_to_file)
         return path_to_file
 
     def _file_extension_is_not_allowed(self, filename: str) -> bool:
@@ -1,42 +1,135 @@
+import contextlib
+import hashlib
 import os
+import pathlib
 from typing import Optional, Union
 
-from aioboto3 import Session
-from aiobotocore.client import AioBaseClient
 from fastapi import UploadFile
 
+from fastapi_admin2.exceptions import RequiredThirdPartyLibNotInstalled
 from fastapi_admin2.utils.files import FileManager
 from fastapi_admin2.utils.files.base import Link
-from fastapi_admin2.utils.files.utils import create_unique_file_identifier
+from fastapi_admin2.utils.files.utils import create_unique_file_identifier, \
+    create_content_addressed_file_identifier
+
+try:
+    from aioboto3 import Session
+    from aiobotocore.client import AioBaseClient
+    from aiobotocore.config import AioConfig
+    from boto3.s3.transfer import TransferConfig
+    from botocore.exceptions import ClientError
+except ImportError:  # pragma: no cover
+    Session = None
+
+DEFAULT_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 10
+HASHING_CHUNK_SIZE = 1024 * 1024
 
 
 class S3FileManager(FileManager):
     def __init__(self, bucket_name: str, access_key: str, secret_key: str, region: str,
-                 file_identifier_prefix: str) -> None:
+                 file_identifier_prefix: str,
+                 endpoint_url: Optional[str] = None,
+                 multipart_chunk_size: int = DEFAULT_MULTIPART_CHUNK_SIZE,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 deduplicate: bool = False) -> None:
+        """
+        :param endpoint_url: url of S3-compatible storage(e.g. minio), AWS S3 is used by default
+        :param multipart_chunk_size: files larger than it are uploaded by parts of this size
+        :param max_concurrency: count of parts of one file uploaded concurrently
+        :param deduplicate: store files under digest of their content, so the same content is uploaded once
+        """
+        _raise_if_aioboto3_not_installed()
         self._client: Optional[AioBaseClient] = None
+        self._exit_stack: Optional[contextlib.AsyncExitStack] = None
         self._bucket_name = bucket_name
         self._access_key = access_key
         self._secret_key = secret_key
         self._region_name = region
         self._file_identifier_prefix = file_identifier_prefix
+        self._endpoint_url = endpoint_url
+        self._max_concurrency = max_concurrency
+        self._deduplicate = deduplicate
+        self._transfer_config = TransferConfig(
+            multipart_threshold=multipart_chunk_size,
+            multipart_chunksize=multipart_chunk_size,
+            max_concurrency=max_concurrency
+        )
 
     async def download_file(self, file: UploadFile) -> Union[Link, os.PathLike]:
-        file_identifier = create_unique_file_identifier(file, self._file_identifier_prefix)
-
-        async with await self.connect() as s3:  # type: AioBaseClient
-            await s3.upload_fileobj(file.file, self._bucket_name, file_identifier)
+        s3 = await self.connect()
+        if self._deduplicate:
+            file_identifier = await self._create_content_addressed_file_identifier(file)
+            if not await self._is_uploaded(s3, file_identifier):
+                await s3.upload_fileobj(file.file, self._bucket_name, file_identifier, Config=self._transfer_config)
+        else:
+            file_identifier = create_unique_file_identifier(file, self._file_identifier_prefix)
+            await s3.upload_fileobj(file.file, self._bucket_name, file_identifier, Config=self._transfer_config)
 
+        if self._endpoint_url is not None:
+            return Link("{0}/{1}/{2}".format(self._endpoint_url.rstrip("/"), self._bucket_name, file_identifier))
         return Link("https://{0}.s3.{1}.amazonaws.com/{2}".format(
             self._bucket_name, self._region_name, file_identifier
         ))
 
+    async def _create_content_addressed_file_identifier(self, file: UploadFile) -> str:
+        # uploaded file is already spooled by starlette, so it's read twice: for hashing and for upload
+        hasher = hashlib.sha256()
+        while chunk := await file.read(HASHING_CHUNK_SIZE):
+            hasher.update(chunk)
+        await file.seek(0)
+        return self._file_identifier_prefix + create_content_addressed_file_identifier(
+            hasher.hexdigest(), pathlib.Path(file.filename).suffix
+        )
+
+    async def _is_uploaded(self, s3: AioBaseClient, file_identifier: str) -> bool:
+        try:
+            await s3.head_object(Bucket=self._bucket_name, Key=file_identifier)
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return False
+            raise
+        return True
+
     async def connect(self) -> AioBaseClient:
+        """
+        Return client, that is kept open until shutdown, so connections are reused between uploads.
+        Client is opened lazily, if file manager isn't registered with `FastAPIAdmin.register_file_manager`
+        """
         if self._client is None:
-            session = Session(
-                aws_access_key_id=self._access_key,
-                aws_secret_access_key=self._secret_key,
-                region_name=self._region_name
-            )
-            self._client = session.client("s3")
-
+            await self.startup()
         return self._client
+
+    async def startup(self) -> None:
+        if self._client is not None:
+            return
+        session = Session(
+            aws_access_key_id=self._access_key,
+            aws_secret_access_key=self._secret_key,
+            region_name=self._region_name
+        )
+        self._exit_stack = contextlib.AsyncExitStack()
+        self._client = await self._exit_stack.enter_async_context(session.client(
+            "s3",
+            endpoint_url=self._endpoint_url,
+            # every concurrently uploaded part needs its own connection
+            config=AioConfig(max_pool_connections=self._max_concurrency)
+        ))
+
+    async def shutdown(self) -> None:
+        if self._exit_stack is None:
+            return
+        await self._exit_stack.aclose()
+        self._exit_stack = None
+        self._client = None
+
+
+def _raise_if_aioboto3_not_installed() -> None:
+    if Session is not None:  # pragma: no cover
+        return
+
+    raise RequiredThirdPartyLibNotInstalled(
+        "aioboto3",
+        thing_that_cant_work_without_lib="S3FileManager",
+        can_be_installed_with_ext="s3"
+    )
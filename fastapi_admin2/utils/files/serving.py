@@ -0,0 +1,186 @@
+import email.utils
+import mimetypes
+import os
+import re
+import stat
+from typing import List, Optional, Tuple, Union
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.types import Scope, Receive, Send
+
+SERVING_CHUNK_SIZE = 64 * 1024
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATED_CACHE_CONTROL = "no-cache"
+ZERO_COPY_SEND_EXTENSION = "http.response.zerocopysend"
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+Header = Tuple[bytes, bytes]
+
+
+class UploadsApp:
+    """
+    ASGI application, that serves uploaded files, e.g.::
+
+        app.mount("/static/uploads", UploadsApp(directory="static/uploads"))
+
+    Files are revalidated by strong ETag, files of immutable directory are cached by browsers forever.
+    Single byte ranges are supported, so large media can be streamed and resumed.
+    Body is sent by `sendfile` if server supports zero-copy send extension of ASGI, otherwise by chunks.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], chunk_size: int = SERVING_CHUNK_SIZE,
+                 immutable: bool = False) -> None:
+        """
+        :param immutable: content of files never changes, e.g. directory is written by ContentAddressedFileManager
+        """
+        self._directory = os.path.realpath(directory)
+        self._chunk_size = chunk_size
+        self._cache_control = IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATED_CACHE_CONTROL
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] == "http"
+
+        if scope["method"] not in ("GET", "HEAD"):
+            await _send_empty_response(send, 405, [(b"allow", b"GET, HEAD")])
+            return
+
+        path = self._resolve_path(scope["path"])
+        stat_result = await anyio.to_thread.run_sync(_stat_regular_file, path) if path is not None else None
+        if stat_result is None:
+            await _send_empty_response(send, 404)
+            return
+
+        etag = _create_etag(stat_result)
+        headers = [
+            (b"etag", etag.encode("latin-1")),
+            (b"last-modified", email.utils.formatdate(stat_result.st_mtime, usegmt=True).encode("latin-1")),
+            (b"cache-control", self._cache_control.encode("latin-1")),
+            (b"accept-ranges", b"bytes"),
+        ]
+        request_headers = Headers(scope=scope)
+
+        if _is_not_modified(request_headers.get("if-none-match"), etag):
+            await _send_empty_response(send, 304, headers)
+            return
+
+        file_size = stat_result.st_size
+        status_code, offset, count = 200, 0, file_size
+        range_header = request_headers.get("range")
+        if range_header is not None and request_headers.get("if-range", etag) == etag:
+            byte_range = _parse_range(range_header, file_size)
+            if byte_range is False:
+                await _send_empty_response(send, 416, [*headers, (b"content-range", f"bytes */{file_size}".encode())])
+                return
+            if byte_range is not None:
+                start, end = byte_range
+                status_code, offset, count = 206, start, end - start + 1
+                headers.append((b"content-range", f"bytes {start}-{end}/{file_size}".encode()))
+
+        media_type, _ = mimetypes.guess_type(path)
+        headers.extend([
+            (b"content-type", (media_type or "application/octet-stream").encode("latin-1")),
+            (b"content-length", str(count).encode()),
+        ])
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        if scope["method"] == "HEAD":
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if ZERO_COPY_SEND_EXTENSION in scope.get("extensions", {}):
+            await self._send_by_sendfile(send, path, offset, count)
+        else:
+            await self._send_by_chunks(send, path, offset, count)
+
+    def _resolve_path(self, requested_path: str) -> Optional[str]:
+        relative_path = requested_path.lstrip("/")
+        # hidden files are temporary files of uploads in progress
+        if not relative_path or any(part.startswith(".") for part in relative_path.split("/")):
+            return None
+        path = os.path.realpath(os.path.join(self._directory, relative_path))
+        if os.path.commonpath([self._directory, path]) != self._directory:
+            return None
+        return path
+
+    async def _send_by_sendfile(self, send: Send, path: str, offset: int, count: int) -> None:
+        with open(path, "rb") as f:
+            await send({
+                "type": ZERO_COPY_SEND_EXTENSION,
+                "file": f.fileno(),
+                "offset": offset,
+                "count": count,
+                "more_body": False,
+            })
+
+    async def _send_by_chunks(self, send: Send, path: str, offset: int, count: int) -> None:
+        async with await anyio.open_file(path, "rb") as f:
+            await f.seek(offset)
+            remaining = count
+            while remaining > 0:
+                chunk = await f.read(min(self._chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        if remaining > 0 or count == 0:
+            # file is empty or has been truncated while it's sent
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def _stat_regular_file(path: str) -> Optional[os.stat_result]:
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        # e.g. file is missing, name is too long or file isn't accessible
+        return None
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+    return stat_result
+
+
+def _create_etag(stat_result: os.stat_result) -> str:
+    return f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def _is_not_modified(if_none_match: Optional[str], etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # weak comparison is used for If-None-Match
+    tags: List[str] = [tag.strip().replace("W/", "", 1) for tag in if_none_match.split(",")]
+    return etag in tags
+
+
+def _parse_range(range_header: str, file_size: int) -> Union[Tuple[int, int], None, bool]:
+    """
+    Parse single byte range, multiple ranges and malformed headers are ignored and whole file is sent
+
+    :return: first and last byte of the range, None if header is ignored, False if range is unsatisfiable
+    """
+    match = RANGE_PATTERN.match(range_header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # suffix range, e.g. last 500 bytes
+        suffix_length = int(last)
+        if suffix_length == 0 or file_size == 0:
+            return False
+        return max(file_size - suffix_length, 0), file_size - 1
+
+    start = int(first)
+    if start >= file_size:
+        return False
+    end = int(last) if last else file_size - 1
+    if start > end:
+        return None
+    return start, min(end, file_size - 1)
+
+
+async def _send_empty_response(send: Send, status_code: int, headers: Optional[List[Header]] = None) -> None:
+    await send({"type": "http.response.start", "status": status_code, "headers": headers or []})
+    await send({"type": "http.response.body", "body": b""})
@@ -1,4 +1,6 @@
 import os
+import pathlib
+import posixpath
 from typing import Union
 
 from starlette.datastructures import UploadFile
@@ -13,5 +15,21 @@ class StaticFilesManager(FileManager):
         self._static_path_prefix = static_path_prefix
 
     async def download_file(self, file: UploadFile) -> Union[Link, os.PathLike]:
-        await self._file_uploader.download_file(file)
-        return Link(os.path.join(self._static_path_prefix, file.filename))
\ No newline at end of file
+        path_to_file = await self._file_uploader.download_file(file)
+        if not isinstance(path_to_file, os.PathLike):
+            # file is stored remotely and wrapped file manager has already built link to it
+            return path_to_file
+
+        # saved file may be named differently from uploaded one(e.g. content-addressed files)
+        uploads_dir = self._file_uploader.uploads_dir
+        if uploads_dir is None:
+            relative_path = pathlib.PurePath(pathlib.Path(path_to_file).name)
+        else:
+            relative_path = pathlib.Path(path_to_file).relative_to(uploads_dir)
+        return Link(posixpath.join(self._static_path_prefix, relative_path.as_posix()))
+
+    async def startup(self) -> None:
+        await self._file_uploader.startup()
+
+    async def shutdown(self) -> None:
+        await self._file_uploader.shutdown()
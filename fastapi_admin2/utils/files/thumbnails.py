@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import os
+import pathlib
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional, Sequence, Set, Tuple, Union, List
+
+from starlette.datastructures import UploadFile
+
+from fastapi_admin2.exceptions import RequiredThirdPartyLibNotInstalled
+from fastapi_admin2.utils.files.base import FileManager, Link
+
+try:
+    from PIL import Image as PILImage
+except ImportError:  # pragma: no cover
+    PILImage = None
+
+Size = Tuple[int, int]
+
+DEFAULT_THUMBNAIL_SIZES: Sequence[Size] = ((200, 200),)
+THUMBNAIL_SUFFIX = ".thumb{width}x{height}"
+
+logger = logging.getLogger(__name__)
+
+
+def get_thumbnail_name(original: str, size: Size) -> str:
+    """
+    Build name of thumbnail of the given size, which is stored next to the original,
+    e.g. "/static/uploads/photo.png" -> "/static/uploads/photo.thumb200x200.png".
+    It works both for paths and urls, so displays can find thumbnails by url of the original.
+    """
+    directory, _, name = original.rpartition("/")
+    stem, dot, extension = name.rpartition(".")
+    if not stem:
+        stem, dot, extension = name, "", ""
+    thumbnail_name = stem + THUMBNAIL_SUFFIX.format(width=size[0], height=size[1]) + dot + extension
+    if not directory and not original.startswith("/"):
+        return thumbnail_name
+    return directory + "/" + thumbnail_name
+
+
+def generate_thumbnails(path_to_original: str, sizes: Sequence[Size]) -> List[str]:
+    """
+    Generate thumbnails of the image, that fit the given sizes with preserved aspect ratio.
+    It's CPU-bound, so it's run in process pool.
+
+    :return: paths to generated thumbnails
+    """
+    path = pathlib.Path(path_to_original)
+    paths_to_thumbnails = []
+    with PILImage.open(path) as original:
+        original.load()
+        for size in sizes:
+            thumbnail = original.copy()
+            thumbnail.thumbnail(size)
+            path_to_thumbnail = path.with_name(get_thumbnail_name(path.name, size))
+            # thumbnail appears at once, so displays never load partially written file
+            path_to_temporary_file = f"{path_to_thumbnail}.{uuid.uuid4().hex}.tmp"
+            thumbnail.save(path_to_temporary_file, format=original.format)
+            os.replace(path_to_temporary_file, path_to_thumbnail)
+            paths_to_thumbnails.append(str(path_to_thumbnail))
+    return paths_to_thumbnails
+
+
+class ThumbnailingFileManager(FileManager):
+    """
+    Generate thumbnails of uploaded images in background, so lists show them instead of originals.
+    It wraps file manager, that stores files on local disk(e.g. OnPremiseFileManager), thumbnails are stored next to
+    the original file and are served the same way as it, e.g.::
+
+        StaticFilesManager(ThumbnailingFileManager(OnPremiseFileManager(uploads_dir=...)))
+
+    Upload doesn't wait for thumbnails, `displays.Image` falls back to the original until thumbnail exists.
+    """
+
+    def __init__(
+            self,
+            file_manager: FileManager,
+            sizes: Sequence[Size] = DEFAULT_THUMBNAIL_SIZES,
+            executor: Optional[Executor] = None,
+            max_workers: Optional[int] = None
+    ):
+        """
+        :param file_manager: file manager, that returns path to saved file on local disk
+        :param sizes: bounding boxes of thumbnails
+        :param executor: executor to generate thumbnails in, process pool with `max_workers` is created by default
+        """
+        _raise_if_pillow_not_installed()
+        self._file_manager = file_manager
+        self._sizes = tuple(sizes)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_workers = max_workers
+        # strong references to running generations, otherwise tasks might be garbage collected
+        self._pending_generations: Set[asyncio.Future] = set()
+
+    async def download_file(self, file: UploadFile) -> Union[Link, os.PathLike]:
+        path_to_file = await self._file_manager.download_file(file)
+        # deduplicating file manager returns the same path for the same content, its thumbnails already exist
+        if not self._are_thumbnails_generated(path_to_file):
+            self.schedule_thumbnails_generation(path_to_file)
+        return path_to_file
+
+    @property
+    def uploads_dir(self) -> Optional[pathlib.Path]:
+        return self._file_manager.uploads_dir
+
+    def schedule_thumbnails_generation(self, path_to_file: Union[str, os.PathLike]) -> None:
+        future = asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), generate_thumbnails, str(pathlib.Path(path_to_file)), self._sizes
+        )
+        self._pending_generations.add(future)
+        future.add_done_callback(self._on_generation_done)
+
+    async def startup(self) -> None:
+        await self._file_manager.startup()
+
+    async def shutdown(self) -> None:
+        if self._pending_generations:
+            await asyncio.wait(self._pending_generations)
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        await self._file_manager.shutdown()
+
+    def _are_thumbnails_generated(self, path_to_file: Union[str, os.PathLike]) -> bool:
+        path = pathlib.Path(path_to_file)
+        return all(path.with_name(get_thumbnail_name(path.name, size)).is_file() for size in self._sizes)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+
+    def _on_generation_done(self, future: asyncio.Future) -> None:
+        self._pending_generations.discard(future)
+        if future.cancelled():
+            return
+        if (exception := future.exception()) is not None:
+            # e.g. uploaded file isn't an image, original is still shown in such case
+            logger.warning("Thumbnails of uploaded file weren't generated", exc_info=exception)
+
+
+def _raise_if_pillow_not_installed() -> None:
+    if PILImage is not None:  # pragma: no cover
+        return
+
+    raise RequiredThirdPartyLibNotInstalled(
+        "Pillow",
+        thing_that_cant_work_without_lib="thumbnails",
+        can_be_installed_with_ext="thumbnails"
+    )
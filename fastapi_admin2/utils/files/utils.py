@@ -8,3 +8,18 @@ def create_unique_file_identifier(file: UploadFile, *parts: str) -> str:
     file_extension = pathlib.Path(file.filename).suffix
     current_timestamp = str(datetime.now().timestamp()).replace('.', '')
     return ''.join(parts) + current_timestamp + file_extension
+
+
+def create_content_addressed_file_identifier(digest: str, file_extension: str,
+                                             shard_depth: int = 2, shard_width: int = 2) -> str:
+    """
+    Build path of the file from digest of its content, e.g. "ab/cd/abcdef...png".
+    Leading characters of digest are used as nested directories, so no directory holds too many files
+
+    :param digest: hex digest of the content
+    :param file_extension: extension with leading dot or empty string
+    :param shard_depth: count of nested directories
+    :param shard_width: count of characters of digest used as name of every directory
+    """
+    shards = [digest[i * shard_width:(i + 1) * shard_width] for i in range(shard_depth)]
+    return "/".join([*shards, digest + file_extension.lower()])
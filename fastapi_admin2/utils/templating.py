@@ -1,14 +1,26 @@
 import functools
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 
-from jinja2 import pass_context, Environment, FileSystemLoader, select_autoescape, FileSystemBytecodeCache
+from jinja2 import pass_context, Environment, FileSystemLoader, select_autoescape, FileSystemBytecodeCache, \
+    Template, nodes
 from starlette.background import BackgroundTask
 from starlette.requests import Request
 from starlette.responses import HTMLResponse
 
 from fastapi_admin2.default_settings import BASE_DIR
+from fastapi_admin2.utils.files.thumbnails import get_thumbnail_name
+
+# Renders template of display as macro for every value of the column during one render of column template,
+# instead of looking up and rendering template of display for every cell separately
+COLUMN_TEMPLATE_HEAD = "{%- macro render_cell(value) -%}"
+COLUMN_TEMPLATE_TAIL = (
+    "{%- endmacro -%}"
+    "{%- for value in values -%}{% set _ = cells.append(render_cell(value)) %}{%- endfor -%}"
+)
+# templates, that can't be inlined to macro(e.g. extending other templates), are included into it
+INCLUDED_CELL_TEMPLATE_SOURCE = "{% include cell_template %}"
 
 
 class JinjaTemplates:
@@ -18,6 +30,7 @@ class JinjaTemplates:
         if self._directory is None:
             self._directory = BASE_DIR / "templates"
         self.env = self._create_env()
+        self._column_templates: Dict[str, Tuple[Template, Template]] = {}
 
     async def create_html_response(
             self,
@@ -44,11 +57,44 @@ class JinjaTemplates:
             background=background,
         )
 
+    async def render_column(self, template_name: str, values: Sequence[Any],
+                            context: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Render template for every value of the column at once
+
+        :param template_name:
+        :param values: values of the column, each of them is passed to the template as `value`
+        :param context: context, that is shared among all cells of the column
+        :return: rendered cells in the same order as values
+        """
+        cells: List[str] = []
+        column_template = self._get_column_template(supplement_template_name(template_name))
+        await column_template.render_async(context or {}, values=values, cells=cells)
+        return cells
+
+    def _get_column_template(self, template_name: str) -> Template:
+        cell_template = self.env.get_template(template_name)
+        # column template is compiled again only if template of cell has been reloaded
+        cached_templates = self._column_templates.get(template_name)
+        if cached_templates is not None and cached_templates[0] is cell_template:
+            return cached_templates[1]
+
+        source, _, _ = self.env.loader.get_source(self.env, template_name)
+        if _can_be_inlined_into_macro(self.env.parse(source)):
+            column_template = self.env.from_string(COLUMN_TEMPLATE_HEAD + source + COLUMN_TEMPLATE_TAIL)
+        else:
+            column_template = self.env.from_string(
+                COLUMN_TEMPLATE_HEAD + INCLUDED_CELL_TEMPLATE_SOURCE + COLUMN_TEMPLATE_TAIL,
+                globals={"cell_template": cell_template}
+            )
+        self._column_templates[template_name] = (cell_template, column_template)
+        return column_template
+
     async def _render_content(self, template_name: str, context: Optional[Dict[str, Any]] = None) -> str:
         if context is None:
             context = {}
         template = self.env.get_template(template_name)
-        return await template.render_async(context)
+        return await template.render_async(_get_request_template_context(context), **context)
 
     def _create_env(self) -> Environment:
         env = Environment(
@@ -60,16 +106,31 @@ class JinjaTemplates:
 
         env.globals["url_for"] = url_for
         env.globals["NOW_YEAR"] = date.today().year
+        env.filters["thumbnail"] = get_thumbnail_name
 
         return env
 
 
+def _get_request_template_context(context: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return context, that is specific for the request(e.g. gettext for locale of request), set by middlewares
+    """
+    request: Optional[Request] = context.get("request")
+    if request is None:
+        return {}
+    return getattr(request.state, "template_context", {})
+
+
 @pass_context
 def url_for(context: Dict[str, Any], name: str, **path_params: Any) -> str:
     request: Request = context["request"]
     return request.url_for(name, **path_params)
 
 
+def _can_be_inlined_into_macro(template_ast: nodes.Template) -> bool:
+    return template_ast.find(nodes.Extends) is None and template_ast.find(nodes.Block) is None
+
+
 @functools.lru_cache(1200)
 def supplement_template_name(name: str) -> str:
     if not name.endswith(".html"):
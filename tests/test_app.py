@@ -0,0 +1,69 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Column, Integer
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+from starlette.requests import Request
+
+from fastapi_admin2.app import FastAPIAdmin
+from fastapi_admin2.backends.sqla import Model, SQLAlchemyBackend
+from fastapi_admin2.depends import get_model_resource_type_by_resource_name
+from fastapi_admin2.exceptions import ResourceRegistrationError
+
+pytest.importorskip("aiosqlite")
+
+Base = declarative_base()
+
+
+class Order(Base):
+    __tablename__ = "orders"
+
+    id = Column(Integer, primary_key=True)
+
+
+class OrderResource(Model):
+    label = "Orders"
+    model = Order
+    fields = ["id"]
+
+
+class ArchivedOrderResource(OrderResource):
+    label = "Archived orders"
+    slug = "archived-order"
+
+
+@pytest.fixture()
+def app() -> FastAPIAdmin:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    return FastAPIAdmin(orm_backend=SQLAlchemyBackend(sessionmaker(engine, class_=AsyncSession), None), providers=[])
+
+
+def create_request(app: FastAPIAdmin) -> Request:
+    return Request({"type": "http", "app": app})
+
+
+def test_resources_of_the_same_model_are_resolved_by_slug(app: FastAPIAdmin):
+    app.register_resource(OrderResource)
+    app.register_resource(ArchivedOrderResource)
+
+    assert get_model_resource_type_by_resource_name(create_request(app), "order") is OrderResource
+    assert get_model_resource_type_by_resource_name(create_request(app), "Archived-Order") is ArchivedOrderResource
+    assert app.get_orm_model_by_slug("archived-order") is Order
+
+
+def test_unknown_slug(app: FastAPIAdmin):
+    app.register_resource(OrderResource)
+
+    with pytest.raises(HTTPException) as exc_info:
+        get_model_resource_type_by_resource_name(create_request(app), "customer")
+    assert exc_info.value.status_code == 404
+
+
+def test_duplicate_slug_is_rejected(app: FastAPIAdmin):
+    class DuplicateOrderResource(OrderResource):
+        label = "Duplicate orders"
+
+    app.register_resource(OrderResource)
+
+    with pytest.raises(ResourceRegistrationError):
+        app.register_resource(DuplicateOrderResource)
@@ -0,0 +1,171 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Tuple
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, ForeignKey as ForeignKeyConstraint, Integer, String, delete
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+from starlette.requests import Request
+
+from fastapi_admin2.app import FastAPIAdmin
+from fastapi_admin2.backends.sqla import Model, SQLAlchemyBackend
+from fastapi_admin2.backends.sqla.widgets.inputs import ForeignKey
+from fastapi_admin2.ui.resources import Field
+from fastapi_admin2.ui.widgets.inputs import OptionsPage
+
+pytest.importorskip("aiosqlite")
+
+pytestmark = pytest.mark.asyncio
+
+CUSTOMER_NAMES = ["alice", "Alex", "bob", "al_x", "al%x", "alan"]
+
+Base = declarative_base()
+
+
+class Customer(Base):
+    __tablename__ = "customers"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class Order(Base):
+    __tablename__ = "orders"
+
+    id = Column(Integer, primary_key=True)
+    customer_id = Column(Integer, ForeignKeyConstraint("customers.id"))
+
+
+class CountingForeignKey(ForeignKey):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.searches_count = 0
+
+    async def search_options(self, request: Request, query: str, limit: int, offset: int) -> OptionsPage:
+        self.searches_count += 1
+        return await super().search_options(request, query, limit, offset)
+
+
+class OrderResource(Model):
+    label = "Orders"
+    model = Order
+    fields = ["id", Field("customer_id", input_=ForeignKey(Customer, options_page_size=2))]
+
+
+@pytest_asyncio.fixture()
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(Customer.__table__.insert(), [
+            {"id": i, "name": name} for i, name in enumerate(CUSTOMER_NAMES, 1)
+        ])
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture()
+def app(engine) -> FastAPIAdmin:
+    app = FastAPIAdmin(orm_backend=SQLAlchemyBackend(sessionmaker(engine, class_=AsyncSession), None), providers=[])
+    app.register_resource(OrderResource)
+    return app
+
+
+def create_request(app: FastAPIAdmin) -> Request:
+    return Request({"type": "http", "app": app})
+
+
+async def call(app: FastAPIAdmin, path: str, query_string: bytes = b"") -> Tuple[int, bytes]:
+    messages: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        await asyncio.sleep(3600)
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        messages.append(message)
+
+    await app({
+        "type": "http", "method": "GET", "path": path, "raw_path": path.encode(), "query_string": query_string,
+        "headers": [], "scheme": "http", "server": ("testserver", 80), "client": ("testclient", 1),
+        "root_path": "", "http_version": "1.1", "asgi": {"version": "3.0"},
+    }, receive, send)
+    start, *body_messages = messages
+    return start["status"], b"".join(m.get("body", b"") for m in body_messages)
+
+
+def get_labels(page: OptionsPage) -> List[str]:
+    return [label for label, _ in page.options]
+
+
+@pytest.mark.parametrize("query,expected_labels", [
+    ("al", ["alice", "Alex", "al_x", "al%x", "alan"]),
+    ("AL", ["alice", "Alex", "al_x", "al%x", "alan"]),
+    ("al_", ["al_x"]),
+    ("al%", ["al%x"]),
+    ("", CUSTOMER_NAMES),
+])
+async def test_options_are_searched_by_prefix(app: FastAPIAdmin, query: str, expected_labels: List[str]):
+    page = await ForeignKey(Customer).search_options(create_request(app), query, limit=10, offset=0)
+
+    assert get_labels(page) == expected_labels
+    assert not page.has_more
+
+
+@pytest.mark.parametrize("offset,expected_options,has_more", [
+    (0, [("alice", 1), ("Alex", 2)], True),
+    (2, [("al_x", 4), ("al%x", 5)], True),
+    (4, [("alan", 6)], False),
+])
+async def test_options_are_paginated_by_offset(app: FastAPIAdmin, offset: int,
+                                               expected_options: List[Tuple[str, int]], has_more: bool):
+    page = await ForeignKey(Customer).search_options(create_request(app), "al", limit=2, offset=offset)
+
+    assert page.options == expected_options
+    assert page.has_more is has_more
+
+
+async def test_get_selected_options(app: FastAPIAdmin):
+    input_ = ForeignKey(Customer)
+    request = create_request(app)
+
+    assert await input_.get_selected_options(request, 3) == [("bob", 3)]
+    assert await input_.get_selected_options(request, Customer(id=2, name="Alex")) == [("Alex", 2)]
+    assert await input_.get_selected_options(request, None) == []
+    assert await input_.get_selected_options(request, 100) == []
+
+
+async def test_options_page_is_cached(app: FastAPIAdmin, engine):
+    input_ = CountingForeignKey(Customer)
+    request = create_request(app)
+
+    first_page = await input_.get_options_page(request, "al", limit=2, offset=0)
+    async with engine.begin() as connection:
+        await connection.execute(delete(Customer).where(Customer.id == 1))
+    second_page = await input_.get_options_page(request, "al", limit=2, offset=0)
+    await input_.get_options_page(request, "al", limit=2, offset=2)
+
+    assert second_page == first_page
+    assert input_.searches_count == 2
+
+
+async def test_autocomplete(app: FastAPIAdmin):
+    status, body = await call(app, "/order/autocomplete/customer_id", b"q=al&offset=2")
+
+    assert status == 200
+    assert json.loads(body) == {
+        "options": [{"label": "al_x", "value": 4}, {"label": "al%x", "value": 5}],
+        "has_more": True
+    }
+
+
+@pytest.mark.parametrize("field", ["id", "missing"])
+async def test_autocomplete_of_field_without_related_input_is_not_found(app: FastAPIAdmin, field: str):
+    status, _ = await call(app, f"/order/autocomplete/{field}")
+
+    assert status == 404
@@ -0,0 +1,152 @@
+from typing import Any, List, Mapping, Optional
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, String, create_engine, event, inspect, select
+from sqlalchemy.orm import Session, declarative_base, relationship
+from starlette.requests import Request
+
+from fastapi_admin2.backends.sqla import Model
+from fastapi_admin2.ui.resources import ComputedField
+
+Base = declarative_base()
+
+
+class Article(Base):
+    __tablename__ = "articles"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
+    body = Column(String, nullable=False)
+
+
+class Writer(Base):
+    __tablename__ = "writers"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+
+
+class Post(Base):
+    __tablename__ = "posts"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
+    writer_id = Column(Integer, ForeignKey("writers.id"), nullable=False)
+
+    writer = relationship(Writer)
+    comments = relationship("Comment", order_by="Comment.id")
+
+
+class Comment(Base):
+    __tablename__ = "comments"
+
+    id = Column(Integer, primary_key=True)
+    post_id = Column(Integer, ForeignKey("posts.id"), nullable=False)
+    text = Column(String, nullable=False)
+
+
+class BodyLength(ComputedField):
+    async def get_value(self, request: Request, obj: Mapping[str, Any]) -> Optional[Any]:
+        return len(obj["body"])
+
+
+class ArticleResource(Model):
+    label = "Articles"
+    model = Article
+    fields = ["id", "title"]
+
+
+class ProjectedArticleResource(ArticleResource):
+    load_only_displayed_columns = True
+
+
+class ProjectedArticleResourceWithComputedField(ProjectedArticleResource):
+    fields = ["id", "title", BodyLength("body_length")]
+
+
+class ProjectedArticleResourceWithDeclaredDependencies(ProjectedArticleResource):
+    fields = ["id", "title", BodyLength("body_length", depends_on=["body"])]
+
+
+class PostResource(Model):
+    label = "Posts"
+    model = Post
+    fields = ["id", "title"]
+    load_only_displayed_columns = True
+
+
+class JoinedPostResource(PostResource):
+    eager_load = ["writer", "comments"]
+
+
+class PrefetchedPostResource(PostResource):
+    prefetch = ["writer", "comments"]
+
+
+@pytest.fixture()
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Article(id=1, title="title", body="body"))
+        writers = [Writer(id=1, name="first"), Writer(id=2, name="second")]
+        session.add_all(writers)
+        session.add_all([
+            Post(id=i, title=f"post {i}", writer=writers[i % 2], comments=[
+                Comment(id=i * 10 + j, text=f"comment {j}") for j in range(2)
+            ])
+            for i in range(1, 5)
+        ])
+        session.commit()
+        session.expunge_all()
+        yield session
+
+
+def load_article(session: Session, resource: Model) -> Article:
+    return session.execute(resource.apply_list_projection(select(Article))).scalars().one()
+
+
+def test_all_columns_are_loaded_by_default(session: Session):
+    article = load_article(session, ArticleResource())
+
+    assert not inspect(article).unloaded
+
+
+def test_only_displayed_columns_are_loaded(session: Session):
+    article = load_article(session, ProjectedArticleResource())
+
+    assert inspect(article).unloaded == {"body"}
+
+
+def test_computed_field_without_dependencies_disables_projection(session: Session):
+    article = load_article(session, ProjectedArticleResourceWithComputedField())
+
+    assert not inspect(article).unloaded
+
+
+def test_dependencies_of_computed_field_are_loaded(session: Session):
+    article = load_article(session, ProjectedArticleResourceWithDeclaredDependencies())
+
+    assert not inspect(article).unloaded
+
+
+@pytest.mark.parametrize("resource_type,expected_statements_count", [
+    # one query with JOINs
+    (JoinedPostResource, 1),
+    # query of posts and one query per relationship for the whole page
+    (PrefetchedPostResource, 3),
+])
+def test_relationships_are_loaded_without_lazy_loads(session: Session, resource_type,
+                                                     expected_statements_count: int):
+    resource = resource_type()
+    statements: List[str] = []
+    event.listen(session.bind, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    stmt = resource.apply_eager_loading(resource.apply_list_projection(select(Post)))
+    posts = session.execute(stmt).unique().scalars().all()
+    rendered = [(post.title, post.writer.name, [comment.text for comment in post.comments]) for post in posts]
+
+    assert len(statements) == expected_statements_count
+    assert rendered[0] == ("post 1", "second", ["comment 0", "comment 1"])
+    assert len(rendered) == 4
+    assert "writer_id" not in inspect(posts[0]).unloaded
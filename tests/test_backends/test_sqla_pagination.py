@@ -0,0 +1,124 @@
+import base64
+import json
+from typing import List, Optional, Sequence
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+from fastapi_admin2.backends.sqla.pagination import Cursor, Direction, InvalidCursorError, \
+    apply_keyset_pagination, get_keyset_columns, paginate_fetched_rows
+
+Base = declarative_base()
+
+# names are not unique, so pages sorted by name contain ties
+NAMES = ["a", "b", "b", "b", "c", "d", "d", "e"]
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+
+
+@pytest.fixture()
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Item(id=i, name=name) for i, name in enumerate(NAMES, start=1)])
+        session.commit()
+        yield session
+
+
+def fetch_page(session: Session, page_size: int, raw_cursor: Optional[str] = None,
+               sort_key: Sequence[str] = ()):
+    columns = get_keyset_columns(Item, sort_key)
+    cursor = Cursor.decode(raw_cursor) if raw_cursor else None
+    rows = session.execute(apply_keyset_pagination(select(Item), columns, page_size, cursor)).scalars().all()
+    return paginate_fetched_rows(rows, columns, page_size, cursor)
+
+
+def ids(items: List[Item]) -> List[int]:
+    return [item.id for item in items]
+
+
+class TestCursor:
+    def test_encode_and_decode(self):
+        cursor = Cursor(values=("b", 3), direction=Direction.BACKWARD)
+
+        assert Cursor.decode(cursor.encode()) == cursor
+
+    @pytest.mark.parametrize("raw_cursor", [
+        "not a cursor!",
+        base64.urlsafe_b64encode(b"[1, 2]").decode(),
+        base64.urlsafe_b64encode(json.dumps({"v": [1], "d": "sideways"}).encode()).decode(),
+        base64.urlsafe_b64encode(json.dumps({"v": [{"unknown": 1}], "d": "f"}).encode()).decode(),
+    ])
+    def test_decode_malformed_cursor(self, raw_cursor: str):
+        with pytest.raises(InvalidCursorError):
+            Cursor.decode(raw_cursor)
+
+
+class TestGetKeysetColumns:
+    def test_primary_key_is_used_by_default(self):
+        assert get_keyset_columns(Item) == [Item.__table__.c.id]
+
+    def test_primary_key_is_appended_to_sort_key(self):
+        assert get_keyset_columns(Item, ["name"]) == [Item.__table__.c.name, Item.__table__.c.id]
+
+
+class TestKeysetPagination:
+    def test_first_page(self, session: Session):
+        page, next_cursor, prev_cursor = fetch_page(session, page_size=3)
+
+        assert ids(page) == [1, 2, 3]
+        assert next_cursor is not None
+        assert prev_cursor is None
+
+    def test_forward(self, session: Session):
+        _, next_cursor, _ = fetch_page(session, page_size=3)
+
+        page, next_cursor, prev_cursor = fetch_page(session, page_size=3, raw_cursor=next_cursor)
+        assert ids(page) == [4, 5, 6]
+        assert prev_cursor is not None
+
+        page, next_cursor, _ = fetch_page(session, page_size=3, raw_cursor=next_cursor)
+        assert ids(page) == [7, 8]
+        assert next_cursor is None
+
+    def test_backward(self, session: Session):
+        _, next_cursor, _ = fetch_page(session, page_size=3)
+        _, next_cursor, _ = fetch_page(session, page_size=3, raw_cursor=next_cursor)
+        _, _, prev_cursor = fetch_page(session, page_size=3, raw_cursor=next_cursor)
+
+        page, next_cursor, prev_cursor = fetch_page(session, page_size=3, raw_cursor=prev_cursor)
+        assert ids(page) == [4, 5, 6]
+        assert next_cursor is not None
+
+        page, _, prev_cursor = fetch_page(session, page_size=3, raw_cursor=prev_cursor)
+        assert ids(page) == [1, 2, 3]
+        assert prev_cursor is None
+
+    def test_ties_of_sort_key_are_neither_skipped_nor_repeated(self, session: Session):
+        seen_ids: List[int] = []
+        raw_cursor = None
+        while True:
+            page, raw_cursor, _ = fetch_page(session, page_size=2, raw_cursor=raw_cursor, sort_key=["name"])
+            seen_ids.extend(ids(page))
+            if raw_cursor is None:
+                break
+
+        assert seen_ids == [1, 2, 3, 4, 5, 6, 7, 8]
+
+    def test_empty_page(self, session: Session):
+        cursor = Cursor(values=(100,)).encode()
+
+        assert fetch_page(session, page_size=3, raw_cursor=cursor) == ([], None, None)
+
+    def test_cursor_that_does_not_match_sort_key(self, session: Session):
+        cursor = Cursor(values=("b", 3)).encode()
+
+        with pytest.raises(InvalidCursorError):
+            fetch_page(session, page_size=3, raw_cursor=cursor)
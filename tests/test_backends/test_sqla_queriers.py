@@ -0,0 +1,115 @@
+from typing import List
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, ForeignKey, Integer, String, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from starlette.requests import Request
+
+from fastapi_admin2.backends.sqla import Model
+from fastapi_admin2.backends.sqla.pagination import Cursor
+from fastapi_admin2.backends.sqla.queriers import get_resource_list, stream_resource_list
+
+pytest.importorskip("aiosqlite")
+
+pytestmark = pytest.mark.asyncio
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+
+    tags = relationship("Tag", order_by="Tag.id")
+
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True)
+    item_id = Column(Integer, ForeignKey("items.id"), nullable=False)
+    name = Column(String, nullable=False)
+
+
+class ItemResource(Model):
+    label = "Items"
+    model = Item
+    fields = ["id", "name"]
+
+
+class KeysetPaginatedItemResource(ItemResource):
+    keyset_pagination = True
+
+
+class ItemWithTagsResource(ItemResource):
+    eager_load = ["tags"]
+    export_chunk_size = 2
+
+
+@pytest_asyncio.fixture()
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(Item.__table__.insert(), [{"id": i, "name": f"item {i}"} for i in range(1, 6)])
+        await connection.execute(Tag.__table__.insert(), [
+            {"id": i * 10 + j, "item_id": i, "name": f"tag {j}"} for i in range(1, 6) for j in range(2)
+        ])
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture()
+def executed_statements(engine) -> List[str]:
+    statements: List[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def collect_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lower())
+
+    return statements
+
+
+@pytest.fixture()
+def session(engine) -> AsyncSession:
+    return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)()
+
+
+def create_request() -> Request:
+    return Request({"type": "http", "query_string": b"", "headers": []})
+
+
+async def test_offset_page_is_counted(session: AsyncSession, executed_statements: List[str]):
+    resource_list = await get_resource_list(
+        create_request(), ItemResource(), page_size=2, model=Item, page_num=1, session=session
+    )
+
+    assert resource_list.total_entries_count == 5
+    assert any("count(" in statement for statement in executed_statements)
+
+
+async def test_keyset_page_is_not_counted(session: AsyncSession, executed_statements: List[str]):
+    cursor = Cursor(values=(2,)).encode()
+
+    resource_list = await get_resource_list(
+        create_request(), KeysetPaginatedItemResource(), page_size=2, model=Item, session=session, cursor=cursor
+    )
+
+    assert [item.id for item in resource_list.models] == [3, 4]
+    assert resource_list.has_next_page
+    assert not any("count(" in statement for statement in executed_statements)
+
+
+async def test_export_with_joined_collection(engine, executed_statements: List[str]):
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    rows = await stream_resource_list(create_request(), ItemWithTagsResource(), Item, session_maker)
+
+    exported = [(item.id, [tag.name for tag in item.tags]) async for item in rows]
+
+    assert exported == [(i, ["tag 0", "tag 1"]) for i in range(1, 6)]
+    # tags are loaded by one query per chunk of items
+    assert len(executed_statements) == 4
@@ -0,0 +1,99 @@
+from typing import List, Tuple
+
+import pytest
+import pytest_asyncio
+from starlette.requests import Request
+from tortoise import Tortoise, fields
+from tortoise import Model as TortoiseModel
+
+from fastapi_admin2.backends.tortoise.widgets.inputs import ForeignKey
+from fastapi_admin2.ui.widgets.inputs import OptionsPage
+
+pytestmark = pytest.mark.asyncio
+
+CUSTOMER_NAMES = ["alice", "Alex", "bob", "al_x", "al%x", "alan"]
+
+
+class Customer(TortoiseModel):
+    id = fields.IntField(pk=True)
+    name = fields.CharField(max_length=50)
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class CountingForeignKey(ForeignKey):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.searches_count = 0
+
+    async def search_options(self, request: Request, query: str, limit: int, offset: int) -> OptionsPage:
+        self.searches_count += 1
+        return await super().search_options(request, query, limit, offset)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def database():
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": [__name__]})
+    await Tortoise.generate_schemas()
+    await Customer.bulk_create([Customer(id=i, name=name) for i, name in enumerate(CUSTOMER_NAMES, 1)])
+    yield
+    await Tortoise.close_connections()
+
+
+def create_request() -> Request:
+    # tortoise inputs query through global connections, so request isn't bound to application
+    return Request({"type": "http"})
+
+
+def get_labels(page: OptionsPage) -> List[str]:
+    return [label for label, _ in page.options]
+
+
+@pytest.mark.parametrize("query,expected_labels", [
+    ("al", ["alice", "Alex", "al_x", "al%x", "alan"]),
+    ("AL", ["alice", "Alex", "al_x", "al%x", "alan"]),
+    ("al_", ["al_x"]),
+    ("al%", ["al%x"]),
+    ("", CUSTOMER_NAMES),
+])
+async def test_options_are_searched_by_prefix(query: str, expected_labels: List[str]):
+    page = await ForeignKey(Customer).search_options(create_request(), query, limit=10, offset=0)
+
+    assert get_labels(page) == expected_labels
+    assert not page.has_more
+
+
+@pytest.mark.parametrize("offset,expected_options,has_more", [
+    (0, [("alice", 1), ("Alex", 2)], True),
+    (2, [("al_x", 4), ("al%x", 5)], True),
+    (4, [("alan", 6)], False),
+])
+async def test_options_are_paginated_by_offset(offset: int, expected_options: List[Tuple[str, int]], has_more: bool):
+    page = await ForeignKey(Customer).search_options(create_request(), "al", limit=2, offset=offset)
+
+    assert page.options == expected_options
+    assert page.has_more is has_more
+
+
+async def test_get_selected_options():
+    input_ = ForeignKey(Customer)
+    request = create_request()
+
+    assert await input_.get_selected_options(request, 3) == [("bob", 3)]
+    assert await input_.get_selected_options(request, await Customer.get(id=2)) == [("Alex", 2)]
+    assert await input_.get_selected_options(request, None) == []
+    assert await input_.get_selected_options(request, 100) == []
+
+
+async def test_options_page_is_cached():
+    input_ = CountingForeignKey(Customer)
+    request = create_request()
+
+    first_page = await input_.get_options_page(request, "al", limit=2, offset=0)
+    await Customer.filter(id=1).delete()
+    second_page = await input_.get_options_page(request, "al", limit=2, offset=0)
+    await input_.get_options_page(request, "al", limit=2, offset=2)
+
+    assert second_page == first_page
+    assert input_.searches_count == 2
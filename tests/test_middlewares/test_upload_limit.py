@@ -0,0 +1,113 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+from sqlalchemy import Column, Integer
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from fastapi_admin2.app import FastAPIAdmin
+from fastapi_admin2.backends.sqla import Model, SQLAlchemyBackend
+from fastapi_admin2.middlewares.upload_limit import UploadLimitMiddleware
+
+pytest.importorskip("aiosqlite")
+
+pytestmark = pytest.mark.asyncio
+
+LIMIT = 100
+BOUNDARY = "boundary"
+
+Base = declarative_base()
+
+
+class Product(Base):
+    __tablename__ = "products"
+
+    id = Column(Integer, primary_key=True)
+
+
+class ProductResource(Model):
+    label = "Products"
+    model = Product
+    fields = ["id"]
+    max_upload_size = LIMIT
+
+
+def create_admin_app() -> FastAPIAdmin:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    app = FastAPIAdmin(
+        orm_backend=SQLAlchemyBackend(sessionmaker(engine, class_=AsyncSession), None), providers=[]
+    )
+    app.register_resource(ProductResource)
+    return app
+
+
+def create_multipart_chunks(file_size: int, chunk_size: int = 32) -> List[bytes]:
+    body = (
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="products.csv"\r\n'
+        f"Content-Type: text/csv\r\n\r\n"
+    ).encode() + b"x" * file_size + f"\r\n--{BOUNDARY}--\r\n".encode()
+    return [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+
+async def call(app: Any, path: str, chunks: List[bytes],
+               content_length: Optional[int] = None) -> Tuple[int, bytes]:
+    headers = [(b"content-type", f"multipart/form-data; boundary={BOUNDARY}".encode())]
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode()))
+    scope = {
+        "type": "http", "method": "POST", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "headers": headers, "scheme": "http", "server": ("testserver", 80), "client": ("client", 1),
+        "root_path": "", "http_version": "1.1", "asgi": {"version": "3.0"},
+    }
+    # body is streamed by chunks without Content-Length(Transfer-Encoding: chunked)
+    messages: List[Dict[str, Any]] = [
+        {"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+        for index, chunk in enumerate(chunks)
+    ]
+    sent: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        if not messages:
+            await asyncio.sleep(3600)
+        return messages.pop(0)
+
+    async def send(message: Dict[str, Any]) -> None:
+        sent.append(message)
+
+    await asyncio.wait_for(app(scope, receive, send), timeout=10)
+    return sent[0]["status"], b"".join(message.get("body", b"") for message in sent[1:])
+
+
+async def test_chunked_oversized_body_of_import_is_rejected_with_413():
+    status_code, body = await call(create_admin_app(), "/product/import", create_multipart_chunks(LIMIT * 2))
+
+    assert status_code == 413
+    assert b"exceeds max size 100" in body
+
+
+async def test_oversized_body_with_content_length_is_rejected_before_reading():
+    chunks = create_multipart_chunks(LIMIT * 2)
+
+    status_code, _ = await call(create_admin_app(), "/product/import", chunks,
+                                content_length=sum(map(len, chunks)))
+
+    assert status_code == 413
+
+
+async def test_app_response_is_replaced_if_app_handles_exceeded_limit_by_itself():
+    async def app(scope, receive, send):
+        try:
+            await Request(scope, receive).body()
+        except Exception:
+            await PlainTextResponse("There was an error parsing the body", status_code=400)(scope, receive, send)
+            return
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    middleware = UploadLimitMiddleware(app, get_limit=lambda scope: LIMIT)
+
+    assert (await call(middleware, "/", create_multipart_chunks(LIMIT * 2)))[0] == 413
+    assert await call(middleware, "/", [b"small", b"body"]) == (200, b"ok")
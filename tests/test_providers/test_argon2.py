@@ -0,0 +1,84 @@
+import pytest
+
+pytest.importorskip("argon2")
+
+from argon2 import PasswordHasher, Type  # noqa: E402
+
+from fastapi_admin2.providers.security.password_hashing import calibration  # noqa: E402
+from fastapi_admin2.providers.security.password_hashing.argon2_cffi import Argon2PasswordHasher  # noqa: E402
+from fastapi_admin2.providers.security.password_hashing.calibration import calibrate_argon2  # noqa: E402
+
+
+def create_hash(time_cost: int = 2, memory_cost: int = 64, parallelism: int = 2, type_: Type = Type.ID) -> str:
+    return PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism,
+                          type=type_).hash("secret")
+
+
+def create_hasher(time_cost: int = 2, memory_cost: int = 64, parallelism: int = 2) -> Argon2PasswordHasher:
+    return Argon2PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
+
+class TestRehashing:
+    def test_hash_with_the_same_parameters(self):
+        assert not create_hasher().is_rehashing_required(create_hash())
+
+    @pytest.mark.parametrize("weaker_parameters", [
+        dict(time_cost=1),
+        dict(memory_cost=32),
+        dict(parallelism=1),
+    ])
+    def test_hash_with_weaker_parameters_is_upgraded(self, weaker_parameters):
+        assert create_hasher().is_rehashing_required(create_hash(**weaker_parameters))
+
+    @pytest.mark.parametrize("stronger_parameters", [
+        dict(time_cost=3),
+        dict(memory_cost=128),
+        dict(parallelism=4),
+    ])
+    def test_hash_with_stronger_parameters_is_not_downgraded(self, stronger_parameters):
+        assert not create_hasher().is_rehashing_required(create_hash(**stronger_parameters))
+
+    def test_hashes_do_not_flip_between_hosts_with_different_parameters(self):
+        # e.g. parallelism is calibrated by count of CPUs, but memory budget of the host with more CPUs is lower
+        many_cpus_host, much_memory_host = create_hasher(parallelism=4), create_hasher(memory_cost=128)
+
+        assert not many_cpus_host.is_rehashing_required(much_memory_host.hash("secret"))
+        assert not much_memory_host.is_rehashing_required(many_cpus_host.hash("secret"))
+
+    def test_hash_of_other_type_is_upgraded(self):
+        assert create_hasher().is_rehashing_required(create_hash(type_=Type.I))
+
+    def test_invalid_hash(self):
+        assert create_hasher().is_rehashing_required("not a hash")
+
+
+class TestCalibration:
+    @pytest.fixture(autouse=True)
+    def fake_measure(self, monkeypatch):
+        # latency grows linearly with time and memory cost, 64 MiB hashed with time cost 1 takes 40 ms
+        def measure(time_cost, memory_cost, parallelism, type_, rounds):
+            return 0.04 * time_cost * memory_cost / (64 * 1024)
+
+        monkeypatch.setattr(calibration, "_measure", measure)
+
+    def test_time_cost_is_raised_while_it_fits_target_latency(self):
+        parameters = calibrate_argon2(target_latency_seconds=0.1, max_memory_cost_kib=64 * 1024, parallelism=2)
+
+        assert (parameters.time_cost, parameters.memory_cost, parameters.parallelism) == (2, 64 * 1024, 2)
+        assert parameters.latency_seconds == pytest.approx(0.08)
+
+    def test_memory_cost_is_halved_if_whole_budget_is_too_slow(self):
+        parameters = calibrate_argon2(target_latency_seconds=0.05, max_memory_cost_kib=256 * 1024, parallelism=2)
+
+        assert (parameters.time_cost, parameters.memory_cost) == (1, 64 * 1024)
+
+    def test_memory_budget_less_than_minimum(self):
+        with pytest.raises(ValueError):
+            calibrate_argon2(max_memory_cost_kib=8, parallelism=2)
+
+    def test_hasher_from_calibration(self):
+        hasher = Argon2PasswordHasher.from_calibration(target_latency_seconds=0.1, max_memory_cost_kib=64 * 1024,
+                                                       parallelism=2)
+
+        assert not hasher.is_rehashing_required(create_hash(time_cost=2, memory_cost=64 * 1024, parallelism=2))
+        assert hasher.is_rehashing_required(create_hash(time_cost=1, memory_cost=64 * 1024, parallelism=2))
@@ -0,0 +1,158 @@
+import asyncio
+import hashlib
+import os
+import threading
+from typing import Union
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from fastapi_admin2.entities import AbstractAdmin
+from fastapi_admin2.providers.security import SecurityProvider, provider as security_provider_module
+from fastapi_admin2.providers.security.password_hashing.protocol import HashVerifyFailedError
+from fastapi_admin2.providers.security.sessions import InMemorySessionStore
+from fastapi_admin2.utils.files import FileManager
+from fastapi_admin2.utils.files.base import Link
+
+pytestmark = pytest.mark.asyncio
+
+
+class SynchronousPasswordHasher:
+    """
+    Hasher written against synchronous protocol, that has no `hash_async` and `verify_async`
+    """
+
+    def __init__(self) -> None:
+        self.hashing_threads = set()
+
+    def is_rehashing_required(self, hash_: str) -> bool:
+        return False
+
+    def verify(self, hash_: str, password: str) -> None:
+        if self.hash(password) != hash_:
+            raise HashVerifyFailedError()
+
+    def hash(self, password: Union[str, bytes]) -> str:
+        self.hashing_threads.add(threading.get_ident())
+        if isinstance(password, str):
+            password = password.encode()
+        return hashlib.sha256(password).hexdigest()
+
+
+class NoopFileManager(FileManager):
+    async def download_file(self, file: UploadFile) -> Union[Link, os.PathLike]:
+        raise NotImplementedError
+
+
+def create_provider(password_hasher: SynchronousPasswordHasher) -> SecurityProvider:
+    return SecurityProvider(
+        file_manager=NoopFileManager(), redis=None, password_hasher=password_hasher,
+        session_store=InMemorySessionStore()
+    )
+
+
+def create_admin(password_hash: str) -> AbstractAdmin:
+    return AbstractAdmin(id=1, username="admin", password=password_hash, profile_pic="")
+
+
+async def test_synchronous_hasher_is_run_in_thread():
+    password_hasher = SynchronousPasswordHasher()
+    provider = create_provider(password_hasher)
+
+    password_hash = await provider._hash_password("secret")
+
+    assert password_hash == hashlib.sha256(b"secret").hexdigest()
+    assert password_hasher.hashing_threads
+    assert threading.get_ident() not in password_hasher.hashing_threads
+
+
+async def test_synchronous_hasher_verifies_password():
+    password_hasher = SynchronousPasswordHasher()
+    provider = create_provider(password_hasher)
+    admin = create_admin(password_hasher.hash("secret"))
+
+    assert not await provider._is_password_hash_is_invalid(admin, "secret")
+    assert await provider._is_password_hash_is_invalid(admin, "wrong")
+
+
+class FakePubSub:
+    def __init__(self, messages: list, is_connection_lost: bool) -> None:
+        self._messages = messages
+        self._is_connection_lost = is_connection_lost
+        self.is_closed = False
+
+    async def subscribe(self, channel: str) -> None:
+        pass
+
+    async def unsubscribe(self, channel: str) -> None:
+        if self._is_connection_lost:
+            raise ConnectionError("Connection reset by peer")
+
+    async def close(self) -> None:
+        self.is_closed = True
+
+    async def listen(self):
+        if self._is_connection_lost:
+            raise ConnectionError("Connection reset by peer")
+        for message in self._messages:
+            yield message
+        await asyncio.Event().wait()
+
+
+class FakeRedis:
+    def __init__(self, *pubsubs: FakePubSub) -> None:
+        self.pubsubs = list(pubsubs)
+
+    def pubsub(self) -> FakePubSub:
+        return self.pubsubs.pop(0)
+
+
+def create_provider_with_redis(redis: FakeRedis) -> SecurityProvider:
+    return SecurityProvider(
+        file_manager=NoopFileManager(), redis=redis, password_hasher=SynchronousPasswordHasher(),
+        session_store=InMemorySessionStore()
+    )
+
+
+async def wait_for_listener() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def test_session_cache_is_disabled_while_session_invalidations_are_unavailable():
+    broken_pubsub = FakePubSub([], is_connection_lost=True)
+    provider = create_provider_with_redis(FakeRedis(broken_pubsub))
+    provider._admins_by_session_id.set("stale", create_admin(""))
+
+    await provider.start_listening_to_session_invalidations()
+    try:
+        await wait_for_listener()
+
+        assert broken_pubsub.is_closed
+        assert not provider._is_session_cache_enabled
+        assert provider._admins_by_session_id.get("stale") is None
+    finally:
+        await provider.stop_listening_to_session_invalidations()
+
+
+async def test_session_invalidations_are_resubscribed_after_connection_is_lost(monkeypatch):
+    monkeypatch.setattr(security_provider_module, "SESSION_INVALIDATION_RESUBSCRIBE_MIN_DELAY_IN_SECONDS", 0)
+    broken_pubsub = FakePubSub([], is_connection_lost=True)
+    restored_pubsub = FakePubSub(
+        [{"type": "subscribe", "data": 1}, {"type": "message", "data": b"session:revoked"}],
+        is_connection_lost=False
+    )
+    provider = create_provider_with_redis(FakeRedis(broken_pubsub, restored_pubsub))
+
+    await provider.start_listening_to_session_invalidations()
+    try:
+        await asyncio.sleep(0)
+        provider._admins_by_session_id.set("revoked", create_admin(""))
+        await wait_for_listener()
+
+        assert provider._is_session_cache_enabled
+        assert provider._admins_by_session_id.get("revoked") is None
+    finally:
+        await provider.stop_listening_to_session_invalidations()
+
+    assert restored_pubsub.is_closed
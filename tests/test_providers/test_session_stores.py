@@ -0,0 +1,92 @@
+import pytest
+
+from fastapi_admin2.providers.security.sessions import InMemorySessionStore, SignedCookieSessionStore
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemorySessionStore:
+    async def test_get_admin_id(self):
+        store = InMemorySessionStore()
+
+        session_id = await store.create_session(1, expires_in_seconds=60)
+
+        assert await store.get_admin_id(session_id) == "1"
+
+    async def test_session_expires(self):
+        timer = FakeTimer()
+        store = InMemorySessionStore(timer=timer)
+        session_id = await store.create_session(1, expires_in_seconds=60)
+
+        timer.now += 61
+
+        assert await store.get_admin_id(session_id) is None
+
+    async def test_delete_session(self):
+        store = InMemorySessionStore()
+        session_id = await store.create_session(1, expires_in_seconds=60)
+
+        await store.delete_session(session_id)
+
+        assert await store.get_admin_id(session_id) is None
+
+
+class TestSignedCookieSessionStore:
+    async def test_get_admin_id(self):
+        store = SignedCookieSessionStore("secret")
+
+        session_id = await store.create_session(1, expires_in_seconds=60)
+
+        assert await store.get_admin_id(session_id) == "1"
+
+    async def test_session_is_valid_for_other_store_with_the_same_key(self):
+        session_id = await SignedCookieSessionStore("secret").create_session(1, expires_in_seconds=60)
+
+        assert await SignedCookieSessionStore("secret").get_admin_id(session_id) == "1"
+        assert await SignedCookieSessionStore("other secret").get_admin_id(session_id) is None
+
+    async def test_fail_if_session_is_tampered(self):
+        store = SignedCookieSessionStore("secret")
+        session_id = await store.create_session(1, expires_in_seconds=60)
+        forged_session_id = (await store.create_session(2, expires_in_seconds=60)).split(".")[0] + \
+            session_id[session_id.index("."):]
+
+        assert await store.get_admin_id(forged_session_id) is None
+        assert await store.get_admin_id("malformed") is None
+
+    async def test_fail_if_session_contains_non_ascii_characters(self):
+        store = SignedCookieSessionStore("secret")
+        session_id = await store.create_session(1, expires_in_seconds=60)
+        encoded_admin_id, expires_at, nonce, _ = session_id.split(".")
+
+        assert await store.get_admin_id(session_id[:-1] + "é") is None
+        assert await store.get_admin_id(".".join(["é", expires_at, nonce, "é"])) is None
+        await store.delete_session(session_id[:-1] + "é")
+        assert await store.get_admin_id(session_id) == "1"
+
+    async def test_session_expires(self):
+        timer = FakeTimer()
+        store = SignedCookieSessionStore("secret", timer=timer)
+        session_id = await store.create_session(1, expires_in_seconds=60)
+
+        timer.now += 61
+
+        assert await store.get_admin_id(session_id) is None
+
+    async def test_deleted_session_is_revoked(self):
+        store = SignedCookieSessionStore("secret")
+        session_id = await store.create_session(1, expires_in_seconds=60)
+        other_session_id = await store.create_session(1, expires_in_seconds=60)
+
+        await store.delete_session(session_id)
+
+        assert await store.get_admin_id(session_id) is None
+        assert await store.get_admin_id(other_session_id) == "1"
@@ -0,0 +1,60 @@
+import html
+
+import pytest
+from starlette.requests import Request
+
+from fastapi_admin2.middlewares.templating import TemplatingMiddleware
+from fastapi_admin2.ui.widgets.displays import Image
+from fastapi_admin2.utils.templating import JinjaTemplates
+
+pytestmark = pytest.mark.asyncio
+
+# filename of uploaded file is chosen by client
+MALICIOUS_URL = "/static/uploads/x');alert(document.cookie);//.png"
+
+
+async def create_request() -> Request:
+    scope = {"type": "http", "state": {}}
+
+    async def app(scope, receive, send):
+        pass
+
+    await TemplatingMiddleware(app, JinjaTemplates())(scope, None, None)
+    request = Request(scope)
+    request.state.current_locale = "en"
+    return request
+
+
+def get_attribute(rendered: str, name: str) -> str:
+    # browser unescapes attributes before handler is run
+    return html.unescape(rendered.split(f'{name}="')[1].split('"')[0])
+
+
+async def test_render_thumbnail_with_fallback_to_original():
+    display = Image(thumbnail_size=(200, 100))
+
+    rendered = await display.render(await create_request(), "/static/uploads/photo.png")
+
+    assert 'src="/static/uploads/photo.thumb200x100.png"' in rendered
+    assert 'data-original="/static/uploads/photo.png"' in rendered
+
+
+async def test_url_of_original_is_not_interpolated_into_javascript():
+    display = Image(thumbnail_size=(200, 100))
+    request = await create_request()
+
+    rendered_cells = [
+        await display.render(request, MALICIOUS_URL),
+        *await display.render_column(request, [MALICIOUS_URL])
+    ]
+
+    for rendered in rendered_cells:
+        assert get_attribute(rendered, "onerror") == "this.onerror = null; this.src = this.dataset.original"
+        assert get_attribute(rendered, "data-original") == MALICIOUS_URL
+
+
+async def test_render_without_thumbnail():
+    rendered = await Image().render(await create_request(), "/static/uploads/photo.png")
+
+    assert 'src="/static/uploads/photo.png"' in rendered
+    assert "onerror" not in rendered
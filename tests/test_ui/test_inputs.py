@@ -0,0 +1,46 @@
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from starlette.requests import Request
+
+from fastapi_admin2.ui.widgets.inputs import Select
+
+pytestmark = pytest.mark.asyncio
+
+CURRENT_USER_COUNTRIES: List[List[str]] = []
+
+
+class AllowedCountriesSelect(Select):
+    async def get_options(self) -> List[Tuple[Any, ...]]:
+        # options depend on the current user in real world, so they differ between requests
+        await asyncio.sleep(0)
+        return [(country, country) for country in CURRENT_USER_COUNTRIES.pop(0)]
+
+
+def create_request() -> Tuple[Request, List[Dict[str, Any]]]:
+    rendered_contexts: List[Dict[str, Any]] = []
+
+    async def render_jinja(template_name: str, context: Dict[str, Any]) -> str:
+        await asyncio.sleep(0)
+        rendered_contexts.append(context)
+        return template_name
+
+    request = Request({"type": "http"})
+    request.state.render_jinja = render_jinja
+    request.state.current_locale = "en"
+    return request, rendered_contexts
+
+
+async def test_concurrent_renders_of_shared_select_do_not_mix_options():
+    select = AllowedCountriesSelect(null=True)
+    CURRENT_USER_COUNTRIES.extend([["UA"], ["PL"]])
+    (first_request, first_contexts), (second_request, second_contexts) = create_request(), create_request()
+
+    await asyncio.gather(select.render(first_request, None), select.render(second_request, "PL"))
+
+    assert first_contexts[0]["options"] == [("UA", "UA")]
+    assert first_contexts[0]["value"] == ""
+    assert second_contexts[0]["options"] == [("PL", "PL")]
+    assert second_contexts[0]["value"] == "PL"
+    assert "options" not in select.context
@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+from typing import Any, Dict, List, Mapping
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from fastapi_admin2.enums import DataFormat
+from fastapi_admin2.exceptions import DatabaseError
+from fastapi_admin2.utils.bulk_import import import_rows, read_batches
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeTable:
+    def __init__(self, fail_on_batch: int = 0) -> None:
+        self.rows: List[Dict[str, Any]] = []
+        self.inserts_count = 0
+        self._fail_on_batch = fail_on_batch
+
+    async def insert_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self.inserts_count += 1
+        if self.inserts_count == self._fail_on_batch:
+            raise DatabaseError("duplicate key")
+        self.rows.extend(rows)
+
+
+async def parse_row(row: Mapping[str, Any]) -> Dict[str, Any]:
+    return {"id": int(row["id"]), "name": row.get("name")}
+
+
+def create_upload_file(content: bytes, filename: str = "import.csv") -> UploadFile:
+    return UploadFile(filename=filename, file=io.BytesIO(content))
+
+
+async def import_file(content: bytes, import_format: DataFormat, table: FakeTable, batch_size: int = 2):
+    batches = read_batches(create_upload_file(content), import_format, batch_size=batch_size)
+    return await import_rows(batches, parse_row, table.insert_rows)
+
+
+async def test_import_csv():
+    table = FakeTable()
+    content = "\ufeffid,name\n1,first\n2,\n3,third\n".encode()
+
+    report = await import_file(content, DataFormat.CSV, table)
+
+    assert table.rows == [{"id": 1, "name": "first"}, {"id": 2, "name": None}, {"id": 3, "name": "third"}]
+    assert table.inserts_count == 2
+    assert report.inserted_count == 3
+    assert report.errors_count == 0
+    assert [batch.inserted_count for batch in report.batches] == [2, 1]
+
+
+async def test_import_ndjson():
+    table = FakeTable()
+    content = b'{"id": 1, "name": "first"}\n\n{"id": 2}\n'
+
+    report = await import_file(content, DataFormat.NDJSON, table)
+
+    assert table.rows == [{"id": 1, "name": "first"}, {"id": 2, "name": None}]
+    assert report.inserted_count == 2
+
+
+async def test_invalid_rows_are_reported_and_skipped():
+    table = FakeTable()
+    content = b'{"id": 1}\n{"id": \n[1, 2]\n{"id": "two"}\n{"id": 5}\n'
+
+    report = await import_file(content, DataFormat.NDJSON, table, batch_size=10)
+
+    assert table.rows == [{"id": 1, "name": None}, {"id": 5, "name": None}]
+    assert [error.row_number for error in report.batches[0].errors] == [2, 3, 4]
+    assert report.errors_count == 3
+
+
+async def test_failed_insert_is_reported_for_the_whole_batch():
+    table = FakeTable(fail_on_batch=1)
+    content = b"id\n1\n2\n3\n"
+
+    report = await import_file(content, DataFormat.CSV, table)
+
+    assert table.rows == [{"id": 3, "name": None}]
+    assert report.inserted_count == 1
+    assert report.batches[0].inserted_count == 0
+    assert [(error.row_number, error.error) for error in report.batches[0].errors] == [(None, "duplicate key")]
+
+
+@pytest.mark.parametrize("import_format", [DataFormat.CSV, DataFormat.NDJSON])
+async def test_file_that_is_not_utf8_is_reported(import_format: DataFormat):
+    table = FakeTable()
+    if import_format == DataFormat.CSV:
+        content = "id,name\n1,first\n2,café\n".encode("utf-16")
+    else:
+        content = json.dumps({"id": 1, "name": "café"}, ensure_ascii=False).encode("latin-1")
+
+    report = await import_file(content, import_format, table)
+
+    assert report.inserted_count == 0
+    assert report.errors_count == 1
+    assert "can't be read" in report.batches[-1].errors[0].error
+
+
+async def test_malformed_csv_is_reported():
+    table = FakeTable()
+    content = b"id,name\n1,first\n2," + b"x" * (csv.field_size_limit() + 1) + b"\n3,third\n"
+
+    report = await import_file(content, DataFormat.CSV, table)
+
+    assert table.rows == [{"id": 1, "name": "first"}]
+    errors = [error for batch in report.batches for error in batch.errors]
+    assert [error.row_number for error in errors] == [2]
+    assert "can't be read" in errors[0].error
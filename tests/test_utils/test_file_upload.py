@@ -4,8 +4,8 @@ import py.path
 import pytest
 from fastapi import UploadFile
 
-from fastapi_admin2.exceptions import FileExtNotAllowed
-from fastapi_admin2.utils.files import OnPremiseFileManager, StaticFilesManager
+from fastapi_admin2.exceptions import FileExtNotAllowed, FileMaxSizeLimit
+from fastapi_admin2.utils.files import OnPremiseFileManager, StaticFilesManager, ContentAddressedFileManager
 
 pytestmark = pytest.mark.asyncio
 
@@ -36,6 +36,25 @@ class TestOnPremiseFileUploader:
         with pytest.raises(FileExtNotAllowed):
             await uploader.download_file(upload_file)
 
+    async def test_fail_if_file_exceeds_max_size(self, tmpdir: py.path.local):
+        uploader = OnPremiseFileManager(uploads_dir=tmpdir, max_size=3)
+        upload_file = UploadFile(filename="test.txt", file=io.BytesIO(b"test"))
+
+        with pytest.raises(FileMaxSizeLimit):
+            await uploader.download_file(upload_file)
+
+        assert tmpdir.listdir() == []
+
+    async def test_extension_is_checked_before_reading_file(self, tmpdir: py.path.local):
+        uploader = OnPremiseFileManager(uploads_dir=tmpdir, allow_extensions=["jpeg"])
+        file = io.BytesIO(b"test")
+        upload_file = UploadFile(filename="test.txt", file=file)
+
+        with pytest.raises(FileExtNotAllowed):
+            await uploader.download_file(upload_file)
+
+        assert file.tell() == 0
+
     async def test_save_file(self, tmpdir: py.path.local):
         uploader = OnPremiseFileManager(uploads_dir=tmpdir)
 
@@ -45,12 +64,56 @@ class TestOnPremiseFileUploader:
         assert str((tmpdir / "test.txt").read()) == "test"
 
 
+class TestContentAddressedFileManager:
+    async def test_upload(self, tmpdir: py.path.local):
+        uploader = ContentAddressedFileManager(uploads_dir=tmpdir)
+        upload_file = UploadFile(filename="test.TXT", file=io.BytesIO(b"test"))
+
+        path_to_file = await uploader.download_file(upload_file)
+
+        digest = "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"
+        assert str(path_to_file) == str(tmpdir / "9f" / "86" / f"{digest}.txt")
+        assert str(py.path.local(path_to_file).read()) == "test"
+
+    async def test_same_content_is_stored_once(self, tmpdir: py.path.local):
+        uploader = ContentAddressedFileManager(uploads_dir=tmpdir)
+
+        first_path = await uploader.download_file(UploadFile(filename="a.txt", file=io.BytesIO(b"test")))
+        second_path = await uploader.download_file(UploadFile(filename="b.txt", file=io.BytesIO(b"test")))
+        other_path = await uploader.download_file(UploadFile(filename="a.txt", file=io.BytesIO(b"other")))
+
+        assert first_path == second_path
+        assert other_path != first_path
+        assert len(list(tmpdir.visit(fil=lambda p: p.isfile()))) == 2
+
+
 class TestStaticFileUploader:
     async def test_upload(self, tmpdir: py.path.local):
         uploader = StaticFilesManager(OnPremiseFileManager(uploads_dir=tmpdir, allow_extensions=["jpeg"]),
                                       static_path_prefix="/static/uploads")
         upload_file = UploadFile(filename="test.jpeg", file=io.BytesIO(b"test"))
 
-        path_to_file = await uploader.upload(upload_file)
+        path_to_file = await uploader.download_file(upload_file)
 
         assert str(path_to_file) == "/static/uploads/test.jpeg"
+
+    async def test_link_is_built_from_path_of_saved_file(self, tmpdir: py.path.local):
+        uploader = StaticFilesManager(ContentAddressedFileManager(uploads_dir=tmpdir),
+                                      static_path_prefix="/static/uploads")
+        upload_file = UploadFile(filename="test.txt", file=io.BytesIO(b"test"))
+
+        link = await uploader.download_file(upload_file)
+
+        digest = "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"
+        assert link == f"/static/uploads/9f/86/{digest}.txt"
+
+    async def test_link_uses_generated_filename(self, tmpdir: py.path.local):
+        uploader = StaticFilesManager(
+            OnPremiseFileManager(uploads_dir=tmpdir, filename_generator=lambda file: "generated.txt"),
+            static_path_prefix="/static/uploads"
+        )
+        upload_file = UploadFile(filename="test.txt", file=io.BytesIO(b"test"))
+
+        link = await uploader.download_file(upload_file)
+
+        assert link == "/static/uploads/generated.txt"
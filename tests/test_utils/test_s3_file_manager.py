@@ -0,0 +1,95 @@
+import io
+import urllib.request
+
+import pytest
+import pytest_asyncio
+from fastapi import UploadFile
+
+aioboto3 = pytest.importorskip("aioboto3")
+moto_server = pytest.importorskip("moto.server")
+
+from fastapi_admin2.utils.files.s3 import S3FileManager  # noqa: E402
+
+pytestmark = pytest.mark.asyncio
+
+BUCKET_NAME = "uploads"
+
+
+@pytest.fixture()
+def s3_endpoint_url():
+    # local S3-compatible stand-in, so uploads are tested without AWS
+    server = moto_server.ThreadedMotoServer(port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    endpoint_url = f"http://{host}:{port}"
+    yield endpoint_url
+    # state of moto is shared by all servers of the process, so buckets are dropped after each test
+    urllib.request.urlopen(urllib.request.Request(f"{endpoint_url}/moto-api/reset", method="POST"))
+    server.stop()
+
+
+async def create_s3_file_manager(endpoint_url: str, deduplicate: bool = False) -> S3FileManager:
+    file_manager = S3FileManager(
+        bucket_name=BUCKET_NAME, access_key="test", secret_key="test", region="us-east-1",
+        file_identifier_prefix="test_", endpoint_url=endpoint_url,
+        multipart_chunk_size=5 * 1024 * 1024, max_concurrency=4, deduplicate=deduplicate
+    )
+    await file_manager.startup()
+    s3 = await file_manager.connect()
+    await s3.create_bucket(Bucket=BUCKET_NAME)
+    return file_manager
+
+
+@pytest_asyncio.fixture()
+async def s3_file_manager(s3_endpoint_url: str):
+    file_manager = await create_s3_file_manager(s3_endpoint_url)
+    yield file_manager
+    await file_manager.shutdown()
+
+
+@pytest_asyncio.fixture()
+async def deduplicating_s3_file_manager(s3_endpoint_url: str):
+    file_manager = await create_s3_file_manager(s3_endpoint_url, deduplicate=True)
+    yield file_manager
+    await file_manager.shutdown()
+
+
+class TestS3FileManager:
+    async def test_upload(self, s3_file_manager: S3FileManager, s3_endpoint_url: str):
+        upload_file = UploadFile(filename="test.txt", file=io.BytesIO(b"test"))
+
+        link = await s3_file_manager.download_file(upload_file)
+
+        assert link.startswith(f"{s3_endpoint_url}/{BUCKET_NAME}/test_")
+        assert link.endswith(".txt")
+
+    async def test_multipart_upload(self, s3_file_manager: S3FileManager):
+        content = b"x" * (12 * 1024 * 1024)
+        upload_file = UploadFile(filename="big.bin", file=io.BytesIO(content))
+
+        link = await s3_file_manager.download_file(upload_file)
+
+        s3 = await s3_file_manager.connect()
+        uploaded = await s3.get_object(Bucket=BUCKET_NAME, Key=link.rsplit("/", 1)[1])
+        assert await uploaded["Body"].read() == content
+
+    async def test_client_is_reused_between_uploads(self, s3_file_manager: S3FileManager):
+        client = await s3_file_manager.connect()
+
+        await s3_file_manager.download_file(UploadFile(filename="a.txt", file=io.BytesIO(b"a")))
+        await s3_file_manager.download_file(UploadFile(filename="b.txt", file=io.BytesIO(b"b")))
+
+        assert await s3_file_manager.connect() is client
+
+    async def test_same_content_is_uploaded_once_with_deduplication(
+            self, deduplicating_s3_file_manager: S3FileManager
+    ):
+        file_manager = deduplicating_s3_file_manager
+
+        first_link = await file_manager.download_file(UploadFile(filename="a.txt", file=io.BytesIO(b"test")))
+        second_link = await file_manager.download_file(UploadFile(filename="b.txt", file=io.BytesIO(b"test")))
+
+        assert first_link == second_link
+        s3 = await file_manager.connect()
+        objects = await s3.list_objects_v2(Bucket=BUCKET_NAME)
+        assert objects["KeyCount"] == 1
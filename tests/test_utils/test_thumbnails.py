@@ -0,0 +1,52 @@
+import io
+
+import py.path
+import pytest
+from fastapi import UploadFile
+
+from fastapi_admin2.utils.files import OnPremiseFileManager
+from fastapi_admin2.utils.files.thumbnails import get_thumbnail_name
+
+
+@pytest.mark.parametrize("original,expected", [
+    ("/static/uploads/photo.png", "/static/uploads/photo.thumb200x100.png"),
+    ("https://example.com/uploads/photo.jpeg", "https://example.com/uploads/photo.thumb200x100.jpeg"),
+    ("photo.tar.gz", "photo.tar.thumb200x100.gz"),
+    ("photo", "photo.thumb200x100"),
+])
+def test_get_thumbnail_name(original: str, expected: str):
+    assert get_thumbnail_name(original, (200, 100)) == expected
+
+
+@pytest.mark.asyncio
+async def test_thumbnails_are_generated_next_to_original(tmpdir: py.path.local):
+    pil_image = pytest.importorskip("PIL.Image")
+    from fastapi_admin2.utils.files import ThumbnailingFileManager
+
+    content = io.BytesIO()
+    pil_image.new("RGB", (800, 400)).save(content, format="PNG")
+    content.seek(0)
+    file_manager = ThumbnailingFileManager(OnPremiseFileManager(uploads_dir=tmpdir), sizes=[(200, 200)])
+
+    await file_manager.download_file(UploadFile(filename="photo.png", file=content))
+    await file_manager.shutdown()
+
+    with pil_image.open(tmpdir / "photo.thumb200x200.png") as thumbnail:
+        assert thumbnail.size == (200, 100)
+
+
+@pytest.mark.asyncio
+async def test_existing_thumbnails_are_not_generated_again(tmpdir: py.path.local):
+    pil_image = pytest.importorskip("PIL.Image")
+    from fastapi_admin2.utils.files import ThumbnailingFileManager
+
+    content = io.BytesIO()
+    pil_image.new("RGB", (800, 400)).save(content, format="PNG")
+    content.seek(0)
+    (tmpdir / "photo.thumb200x200.png").write_binary(b"existing thumbnail")
+    file_manager = ThumbnailingFileManager(OnPremiseFileManager(uploads_dir=tmpdir), sizes=[(200, 200)])
+
+    await file_manager.download_file(UploadFile(filename="photo.png", file=content))
+    await file_manager.shutdown()
+
+    assert (tmpdir / "photo.thumb200x200.png").read_binary() == b"existing thumbnail"
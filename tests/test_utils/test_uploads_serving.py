@@ -0,0 +1,119 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import py.path
+import pytest
+
+from fastapi_admin2.utils.files import UploadsApp
+
+pytestmark = pytest.mark.asyncio
+
+
+async def call(app: UploadsApp, path: str, headers: Optional[Dict[str, str]] = None, method: str = "GET",
+               extensions: Optional[Dict[str, Any]] = None) -> Tuple[int, Dict[str, str], List[Dict[str, Any]]]:
+    messages: List[Dict[str, Any]] = []
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "extensions": extensions or {},
+    }
+    await app(scope, receive, send)
+    start, *body_messages = messages
+    response_headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    return start["status"], response_headers, body_messages
+
+
+def read_body(messages: List[Dict[str, Any]]) -> bytes:
+    return b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+
+
+@pytest.fixture()
+def uploads_dir(tmpdir: py.path.local) -> py.path.local:
+    (tmpdir / "test.txt").write_binary(b"0123456789")
+    (tmpdir / ".test.txt.tmp").write_binary(b"partial")
+    return tmpdir
+
+
+class TestUploadsApp:
+    async def test_serve_file(self, uploads_dir: py.path.local):
+        status, headers, body = await call(UploadsApp(uploads_dir), "/test.txt")
+
+        assert status == 200
+        assert read_body(body) == b"0123456789"
+        assert headers["content-type"].startswith("text/plain")
+        assert headers["accept-ranges"] == "bytes"
+        assert headers["cache-control"] == "no-cache"
+
+    async def test_files_of_immutable_directory_are_cached_forever(self, uploads_dir: py.path.local):
+        _, headers, _ = await call(UploadsApp(uploads_dir, immutable=True), "/test.txt")
+
+        assert "immutable" in headers["cache-control"]
+
+    async def test_not_modified(self, uploads_dir: py.path.local):
+        app = UploadsApp(uploads_dir)
+        _, headers, _ = await call(app, "/test.txt")
+
+        status, _, body = await call(app, "/test.txt", headers={"If-None-Match": headers["etag"]})
+
+        assert status == 304
+        assert read_body(body) == b""
+
+    @pytest.mark.parametrize("range_header,content_range,expected_body", [
+        ("bytes=2-4", "bytes 2-4/10", b"234"),
+        ("bytes=7-", "bytes 7-9/10", b"789"),
+        ("bytes=-2", "bytes 8-9/10", b"89"),
+        ("bytes=8-100", "bytes 8-9/10", b"89"),
+    ])
+    async def test_range(self, uploads_dir: py.path.local, range_header: str, content_range: str,
+                         expected_body: bytes):
+        status, headers, body = await call(UploadsApp(uploads_dir), "/test.txt", headers={"Range": range_header})
+
+        assert status == 206
+        assert headers["content-range"] == content_range
+        assert headers["content-length"] == str(len(expected_body))
+        assert read_body(body) == expected_body
+
+    async def test_unsatisfiable_range(self, uploads_dir: py.path.local):
+        status, headers, _ = await call(UploadsApp(uploads_dir), "/test.txt", headers={"Range": "bytes=20-"})
+
+        assert status == 416
+        assert headers["content-range"] == "bytes */10"
+
+    async def test_range_is_ignored_if_file_changed(self, uploads_dir: py.path.local):
+        status, _, body = await call(
+            UploadsApp(uploads_dir), "/test.txt", headers={"Range": "bytes=2-4", "If-Range": '"outdated"'}
+        )
+
+        assert status == 200
+        assert read_body(body) == b"0123456789"
+
+    async def test_zero_copy_send(self, uploads_dir: py.path.local):
+        status, _, body = await call(
+            UploadsApp(uploads_dir), "/test.txt", headers={"Range": "bytes=2-4"},
+            extensions={"http.response.zerocopysend": {}}
+        )
+
+        assert status == 206
+        assert body[0]["type"] == "http.response.zerocopysend"
+        assert (body[0]["offset"], body[0]["count"]) == (2, 3)
+
+    @pytest.mark.parametrize("path", ["/missing.txt", "/.test.txt.tmp", "/../test.txt", "/", "/" + "x" * 1024])
+    async def test_not_found(self, uploads_dir: py.path.local, path: str):
+        status, _, _ = await call(UploadsApp(uploads_dir), path)
+
+        assert status == 404
+
+    async def test_head(self, uploads_dir: py.path.local):
+        status, headers, body = await call(UploadsApp(uploads_dir), "/test.txt", method="HEAD")
+
+        assert status == 200
+        assert headers["content-length"] == "10"
+        assert read_body(body) == b""